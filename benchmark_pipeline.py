@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmark on recorded sessions.
+
+Replays labelled recordings through the app's real detection pipeline
+(PhoneDetector with motion gate, ROI tracker, cascade, scheduler and
+pickup/putdown state machine, plus overlay drawing and JPEG encoding) on
+CPU, and reports per-stage latency percentiles, sustained FPS and event
+latency against ground truth as JSON.
+
+Frames are replayed as fast as possible but timed with the recording's own
+timestamps: while an inference is running, frames that arrive in media time
+are dropped exactly as the live inference worker would drop them (disable
+with --ideal to run detection on every due frame).
+
+Labels live in a JSON sidecar (session.mp4 -> session.json, or labels.json
+inside an image folder), with times in seconds from the start:
+    {"events": [{"type": "picked_up", "time": 3.2}, {"type": "put_down", "time": 11.0}]}
+
+Usage:
+    python benchmark_pipeline.py recordings/*.mp4 --output results.json
+    python benchmark_pipeline.py session.mp4 --backend openvino --imgsz 416 --output ov416.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import time
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+from judgy_reachy_no_phone.config import Config
+from judgy_reachy_no_phone.detection import PhoneDetector
+from judgy_reachy_no_phone.frames import FrameRing
+from judgy_reachy_no_phone.motion import MotionGate
+from judgy_reachy_no_phone.roi_tracker import RoiTracker
+from judgy_reachy_no_phone.cascade import CascadePolicy
+from judgy_reachy_no_phone.scheduler import DetectionScheduler
+from judgy_reachy_no_phone.sources import ReplaySource
+
+STAGES = ("capture", "detect", "state", "draw", "encode")
+EVENT_TYPES = ("picked_up", "put_down")
+
+
+def load_labels(recording):
+    """Ground-truth events for a recording, or None if it has no sidecar."""
+    if os.path.isdir(recording):
+        path = os.path.join(recording, "labels.json")
+    else:
+        path = os.path.splitext(recording)[0] + ".json"
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        data = json.load(f)
+    return sorted(
+        ({"type": e["type"], "time": float(e["time"])} for e in data.get("events", [])),
+        key=lambda e: e["time"]
+    )
+
+
+def percentiles(samples):
+    """Latency summary in milliseconds."""
+    if not samples:
+        return None
+    ms = np.asarray(samples) * 1000
+    return {
+        "count": int(ms.size),
+        "mean": round(float(ms.mean()), 2),
+        "p50": round(float(np.percentile(ms, 50)), 2),
+        "p90": round(float(np.percentile(ms, 90)), 2),
+        "p95": round(float(np.percentile(ms, 95)), 2),
+        "p99": round(float(np.percentile(ms, 99)), 2),
+        "max": round(float(ms.max()), 2),
+    }
+
+
+def match_events(expected, detected, early_tolerance=0.5, max_latency=5.0):
+    """
+    Pair detected events with ground truth of the same type.
+
+    A detection matches the first unmatched labelled event it follows by at
+    most max_latency seconds (or precedes by early_tolerance, for labels
+    placed a little late). Unpaired labels are missed, unpaired detections false.
+    """
+    used = set()
+    matches = []
+    missed = []
+    for label in expected:
+        for i, det in enumerate(detected):
+            if i in used or det["type"] != label["type"]:
+                continue
+            delay = det["time"] - label["time"]
+            if -early_tolerance <= delay <= max_latency:
+                used.add(i)
+                matches.append({"type": label["type"], "time": label["time"], "latency": round(delay, 3)})
+                break
+        else:
+            missed.append(label)
+    false = [det for i, det in enumerate(detected) if i not in used]
+
+    latency = {}
+    for event_type in EVENT_TYPES:
+        delays = [m["latency"] for m in matches if m["type"] == event_type]
+        if delays:
+            latency[event_type] = {
+                "mean_s": round(float(np.mean(delays)), 3),
+                "p50_s": round(float(np.percentile(delays, 50)), 3),
+                "max_s": round(float(np.max(delays)), 3),
+            }
+    return {
+        "expected": len(expected),
+        "matched": len(matches),
+        "missed": missed,
+        "false": false,
+        "latency": latency,
+        "matches": matches,
+    }
+
+
+def build_detector(args, config):
+    """PhoneDetector wired like the app, from Config plus command-line overrides."""
+    motion_gate = MotionGate(
+        threshold=config.MOTION_THRESHOLD,
+        max_interval=config.MOTION_MAX_INTERVAL,
+        enabled=config.MOTION_GATE_ENABLED and not args.no_motion_gate
+    )
+    roi_tracker = None
+    if config.TRACK_CROP_ENABLED and not args.no_roi_tracker:
+        roi_tracker = RoiTracker(
+            confirm_interval=config.TRACK_CONFIRM_INTERVAL,
+            crop_margin=config.TRACK_CROP_MARGIN,
+            min_score=config.TRACK_MIN_SCORE
+        )
+    cascade = None
+    if config.CASCADE_ENABLED or args.cascade:
+        cascade = CascadePolicy(
+            screen_weights=config.CASCADE_SCREEN_MODEL,
+            mode=config.CASCADE_MODE,
+            screen_ratio=config.CASCADE_SCREEN_RATIO
+        )
+    return PhoneDetector(
+        motion_gate=motion_gate,
+        roi_tracker=roi_tracker,
+        cascade=cascade,
+        backend=args.backend or config.INFERENCE_BACKEND,
+        precision=args.precision or config.INFERENCE_PRECISION,
+        model_cache_dir=config.MODEL_CACHE_DIR,
+        calibration_dir=config.INT8_CALIBRATION_DIR,
+        imgsz=args.imgsz or config.INFERENCE_SIZE,
+        device=args.device
+    )
+
+
+def build_scheduler(args, config):
+    """Detection scheduler as configured in the app, or None to detect every frame."""
+    if args.no_scheduler:
+        return None
+    return DetectionScheduler(
+        cpu_budget=args.cpu_budget or config.DETECTION_CPU_BUDGET,
+        dense_interval=config.DETECTION_DENSE_INTERVAL,
+        normal_interval=config.DETECTION_NORMAL_INTERVAL,
+        sparse_interval=config.DETECTION_SPARSE_INTERVAL,
+        idle_after=config.DETECTION_IDLE_AFTER
+    )
+
+
+def replay(recording, detector, scheduler, args, config):
+    """Run one recording through the pipeline and collect timings and events."""
+    source = ReplaySource(recording, realtime=False)
+    if not source.open():
+        return {"recording": recording, "error": "cannot open recording"}
+
+    ring = FrameRing()
+    detector.reset()
+    cooldown = args.cooldown if args.cooldown is not None else config.COOLDOWN_SECONDS
+
+    stages = {stage: [] for stage in STAGES}
+    frame_totals = []
+    events = []
+    frames = detected = skipped = dropped = 0
+    first_timestamp = None
+    busy_until = float("-inf")  # Media time at which the simulated worker is free again
+
+    wall_start = time.perf_counter()
+    while True:
+        start = time.perf_counter()
+        seq = source.read(ring)
+        capture_time = time.perf_counter() - start
+        if seq is None:
+            if source.finished:
+                break
+            continue
+
+        with ring.borrow(seq) as lease:
+            frames += 1
+            stages["capture"].append(capture_time)
+            frame_time = capture_time
+            timestamp = lease.timestamp
+            if first_timestamp is None:
+                first_timestamp = timestamp
+
+            phone_active = detector.phone_visible or detector.pickup_pending
+            if not args.ideal and timestamp < busy_until:
+                dropped += 1  # Live worker would still be busy with an earlier frame
+            elif scheduler is not None and not scheduler.should_run(timestamp, phone_active):
+                skipped += 1
+            else:
+                start = time.perf_counter()
+                event = detector.process_frame(
+                    lease.frame,
+                    pickup_seconds=config.PICKUP_SECONDS,
+                    putdown_seconds=config.PUTDOWN_SECONDS,
+                    cooldown=cooldown,
+                    timestamp=timestamp
+                )
+                elapsed = time.perf_counter() - start
+                detected += 1
+                stages["detect"].append(detector.last_inference_time)
+                stages["state"].append(max(0.0, elapsed - detector.last_inference_time))
+                frame_time += elapsed
+                busy_until = timestamp + elapsed
+                if scheduler is not None:
+                    # Same sample the app feeds its scheduler (inference only, not the state update)
+                    scheduler.record_latency(detector.last_inference_time, timestamp, model_ran=detector.model_ran)
+                if event:
+                    # The event is available once the inference finishes
+                    events.append({"type": event, "time": round(timestamp - first_timestamp + elapsed, 3)})
+
+            if not args.no_preview:
+                start = time.perf_counter()
+                drawn = detector.draw_detections(lease.frame)
+                draw_time = time.perf_counter() - start
+                start = time.perf_counter()
+                cv2.imencode('.jpg', drawn, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                encode_time = time.perf_counter() - start
+                stages["draw"].append(draw_time)
+                stages["encode"].append(encode_time)
+                frame_time += draw_time + encode_time
+
+            frame_totals.append(frame_time)
+
+    wall = time.perf_counter() - wall_start
+    source.close()
+    media_duration = frames / source.fps if source.fps else 0.0
+
+    result = {
+        "recording": recording,
+        "frames": frames,
+        "media_seconds": round(media_duration, 2),
+        "wall_seconds": round(wall, 3),
+        "fps": round(frames / wall, 1) if wall else 0.0,
+        "realtime_factor": round(media_duration / wall, 2) if wall else 0.0,
+        "detections": detected,
+        "detections_per_second": round(detected / media_duration, 2) if media_duration else 0.0,
+        "frames_skipped": skipped,
+        "frames_dropped": dropped,
+        "stages_ms": {stage: percentiles(samples) for stage, samples in stages.items()},
+        "frame_total_ms": percentiles(frame_totals),
+        "events": events,
+        "detector": detector.get_stats(),
+    }
+
+    labels = load_labels(recording)
+    if labels is not None:
+        result["accuracy"] = match_events(labels, events, max_latency=args.max_latency)
+    return result
+
+
+def print_summary(result):
+    print(f"\n{result['recording']}")
+    if "error" in result:
+        print(f"  ⚠️  {result['error']}")
+        return
+    print(f"  {result['frames']} frames, {result['fps']} FPS ({result['realtime_factor']}x real time), "
+          f"{result['detections']} detections, {result['frames_dropped']} dropped, {result['frames_skipped']} skipped")
+    print("  | Stage | Mean | P50 | P95 | P99 | Max |")
+    print("  |-------|------|-----|-----|-----|-----|")
+    for stage, p in list(result["stages_ms"].items()) + [("total", result["frame_total_ms"])]:
+        if p:
+            print(f"  | {stage} | {p['mean']:.1f}ms | {p['p50']:.1f}ms | {p['p95']:.1f}ms | {p['p99']:.1f}ms | {p['max']:.1f}ms |")
+
+    accuracy = result.get("accuracy")
+    if accuracy is None:
+        print(f"  Events: {[e['type'] for e in result['events']]} (no labels)")
+        return
+    print(f"  Events: {accuracy['matched']}/{accuracy['expected']} matched, "
+          f"{len(accuracy['missed'])} missed, {len(accuracy['false'])} false")
+    for event_type, latency in accuracy["latency"].items():
+        print(f"    {event_type}: mean {latency['mean_s']:.2f}s, max {latency['max_s']:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark on recorded sessions")
+    parser.add_argument("recordings", nargs="+", help="Video files or image folders (with JSON label sidecars)")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--device", default="cpu", help="cpu (default), cuda, mps or auto")
+    parser.add_argument("--backend", default="", help="Override INFERENCE_BACKEND")
+    parser.add_argument("--precision", default="", help="Override INFERENCE_PRECISION")
+    parser.add_argument("--imgsz", type=int, default=0, help="Override INFERENCE_SIZE")
+    parser.add_argument("--cpu-budget", type=float, default=0.0, help="Override DETECTION_CPU_BUDGET")
+    parser.add_argument("--cooldown", type=float, default=None, help="Override COOLDOWN_SECONDS")
+    parser.add_argument("--no-scheduler", action="store_true", help="Detect every frame the worker is free for")
+    parser.add_argument("--ideal", action="store_true", help="Never drop frames for inference time")
+    parser.add_argument("--no-motion-gate", action="store_true")
+    parser.add_argument("--no-roi-tracker", action="store_true")
+    parser.add_argument("--cascade", action="store_true", help="Enable the screening model cascade")
+    parser.add_argument("--no-preview", action="store_true", help="Skip overlay drawing and JPEG encoding")
+    parser.add_argument("--max-latency", type=float, default=5.0,
+                        help="Seconds after a labelled event a detection still counts as a match")
+    args = parser.parse_args()
+
+    config = Config()
+    detector = build_detector(args, config)
+    if not detector.initialize():
+        print(f"Model failed to load: {detector.loading_message}")
+        return
+
+    results = []
+    for recording in args.recordings:
+        result = replay(recording, detector, build_scheduler(args, config), args, config)
+        print_summary(result)
+        results.append(result)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "settings": {
+            "backend": detector.backend_name,
+            "imgsz": detector.imgsz,
+            "scheduler": not args.no_scheduler,
+            "cpu_budget": args.cpu_budget or config.DETECTION_CPU_BUDGET,
+            "motion_gate": detector.motion_gate.enabled if detector.motion_gate else False,
+            "roi_tracker": detector.roi_tracker is not None,
+            "cascade": detector.screen_model is not None,
+            "ideal": args.ideal,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
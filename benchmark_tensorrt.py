@@ -2,12 +2,20 @@
 """
 TensorRT vs PyTorch Benchmark Script - 3-Way Comparison
 Tests: TensorRT GPU, PyTorch GPU, PyTorch CPU
+
+Input size sweep (CPU latency vs recall):
+    python benchmark_tensorrt.py --sweep-sizes 320,416,640 --frames path/to/desk_frames
 """
 
+import argparse
+import glob
+import os
 import time
 import numpy as np
 import torch
 
+PHONE_CLASS_ID = 67  # "cell phone" in COCO
+
 def benchmark_yolo(model, num_frames=100, warmup_frames=10):
     """Benchmark YOLO detection speed."""
     # Create test frame (640x480 RGB)
@@ -28,7 +36,117 @@ def benchmark_yolo(model, num_frames=100, warmup_frames=10):
 
     return avg_ms, fps
 
+def load_frames(path, limit=200):
+    """Load frames from an image folder or a video file."""
+    import cv2
+
+    frames = []
+    if os.path.isdir(path):
+        for file in sorted(glob.glob(os.path.join(path, "*")))[:limit]:
+            image = cv2.imread(file)
+            if image is not None:
+                frames.append(image)
+    else:
+        cap = cv2.VideoCapture(path)
+        while len(frames) < limit:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+    return frames
+
+
+def sweep_input_sizes(sizes, frames_path=None, num_frames=100, confidence=0.5):
+    """
+    Benchmark YOLO26m on CPU at several input sizes.
+
+    Frames are letterboxed with the app's own preprocessing. Recall is
+    measured against the largest size: the fraction of frames where the
+    largest size finds a phone that the smaller size also finds. Without
+    recorded frames (random noise), only latency is meaningful.
+    """
+    from ultralytics import YOLO
+    from judgy_reachy_no_phone.preprocess import Letterbox
+
+    if frames_path:
+        frames = load_frames(frames_path, limit=num_frames)
+        print(f"Loaded {len(frames)} frames from {frames_path}")
+    else:
+        frames = [np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)]
+        print("No --frames given: timing on random noise (recall not measured)")
+    if not frames:
+        print("No frames loaded!")
+        return {}
+
+    model = YOLO("yolo26m.pt")
+    model.to('cpu')
+
+    results = {}
+    for size in sorted(sizes):
+        letterbox = Letterbox(size)
+        print(f"  Input size {size}...")
+
+        # Warm up
+        for _ in range(5):
+            model.predict(letterbox(frames[0]), imgsz=size, verbose=False, classes=[PHONE_CLASS_ID])
+
+        latencies = []
+        found = []
+        for i in range(max(num_frames, len(frames))):
+            frame = frames[i % len(frames)]
+            start = time.perf_counter()
+            out = model.predict(letterbox(frame), imgsz=size, conf=confidence, verbose=False, classes=[PHONE_CLASS_ID])
+            latencies.append((time.perf_counter() - start) * 1000)
+            if i < len(frames):
+                found.append(out[0].boxes is not None and len(out[0].boxes) > 0)
+
+        results[size] = {
+            "avg_ms": float(np.mean(latencies)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "fps": 1000.0 / float(np.mean(latencies)),
+            "found": found,
+        }
+
+    # Recall relative to the largest input size
+    reference = results[max(results)]["found"]
+    positives = sum(reference)
+    for size, r in results.items():
+        if frames_path and positives:
+            hits = sum(1 for ref, got in zip(reference, r["found"]) if ref and got)
+            r["recall"] = hits / positives
+        else:
+            r["recall"] = None
+
+    print()
+    print("| Input Size | FPS | Avg Latency | P95 Latency | Recall vs Largest |")
+    print("|------------|-----|-------------|-------------|-------------------|")
+    for size, r in sorted(results.items()):
+        recall = f"{r['recall'] * 100:.1f}%" if r["recall"] is not None else "n/a"
+        print(f"| {size} | {r['fps']:.1f} | {r['avg_ms']:.1f}ms | {r['p95_ms']:.1f}ms | {recall} |")
+    if frames_path and not positives:
+        print("\n  ⚠️  No phones found at the largest size - recall not measurable on these frames")
+
+    return results
+
+
 def main():
+    parser = argparse.ArgumentParser(description="YOLO26m backend and input size benchmark")
+    parser.add_argument("--sweep-sizes", default="",
+                        help="Comma-separated input sizes to sweep on CPU, e.g. 320,416,640")
+    parser.add_argument("--frames", default=None,
+                        help="Folder of images or a video of desk scenes (for recall)")
+    parser.add_argument("--num-frames", type=int, default=100, help="Frames to time per size")
+    args = parser.parse_args()
+
+    if args.sweep_sizes:
+        print("=" * 70)
+        print("Input Size Sweep on CPU (latency vs recall)")
+        print("=" * 70)
+        sizes = [int(s) for s in args.sweep_sizes.split(",") if s.strip()]
+        sweep_input_sizes(sizes, args.frames, args.num_frames)
+        return
+
     from ultralytics import YOLO
 
     print("=" * 70)
@@ -7,9 +7,12 @@ import numpy as np
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
 
+from .tracing import TRACER
+
 logger = logging.getLogger(__name__)
 
 
+@TRACER.traced("play_sound", "audio")
 def play_sound_safe(reachy: ReachyMini, sound_name: str):
     """Play a sound, catching any errors."""
     try:
@@ -18,85 +21,101 @@ def play_sound_safe(reachy: ReachyMini, sound_name: str):
         logger.debug(f"Sound playback error: {e}")
 
 
+@TRACER.traced(cat="animation")
 def curious_look(reachy: ReachyMini):
     """Curious head tilt - first offense."""
     head = create_head_pose(z=5, roll=15, mm=True, degrees=True)
     reachy.goto_target(head=head, antennas=[0.4, 0.2], duration=0.4, method="minjerk")
-    time.sleep(0.3)
+    _hold(0.3)
 
 
+@TRACER.traced(cat="animation")
 def disappointed_shake(reachy: ReachyMini):
     """Disappointed head shake - repeat offense."""
     for _ in range(3):
         head = create_head_pose(roll=-15, mm=True, degrees=True)
         reachy.goto_target(head=head, antennas=[-0.1, -0.1], duration=0.15)
-        time.sleep(0.15)
+        _hold(0.15)
         head = create_head_pose(roll=15, mm=True, degrees=True)
         reachy.goto_target(head=head, antennas=[-0.1, -0.1], duration=0.15)
-        time.sleep(0.15)
+        _hold(0.15)
 
     # Return to neutral
     head = create_head_pose(roll=0, mm=True, degrees=True)
     reachy.goto_target(head=head, antennas=[0.0, 0.0], duration=0.3)
 
 
+@TRACER.traced(cat="animation")
 def dramatic_sigh(reachy: ReachyMini):
     """Dramatic sigh and look away - many offenses."""
     # Look up (exasperated)
     head = create_head_pose(z=10, roll=0, mm=True, degrees=True)
     reachy.goto_target(head=head, antennas=[0.5, 0.5], duration=0.4)
-    time.sleep(0.4)
+    _hold(0.4)
 
     # Slump down
     head = create_head_pose(z=-5, roll=0, mm=True, degrees=True)
     reachy.goto_target(head=head, antennas=[-0.3, -0.3], duration=0.6)
-    time.sleep(0.8)
+    _hold(0.8)
 
     # Look away
     reachy.goto_target(body_yaw=np.deg2rad(30), duration=0.5)
-    time.sleep(1.0)
+    _hold(1.0)
 
     # Return
     head = create_head_pose(z=0, roll=0, mm=True, degrees=True)
     reachy.goto_target(head=head, antennas=[0.0, 0.0], body_yaw=0, duration=0.5)
 
 
+@TRACER.traced(cat="animation")
 def approving_nod(reachy: ReachyMini):
     """Approving nod - phone put down."""
     for _ in range(2):
         head = create_head_pose(z=-3, mm=True, degrees=True)
         reachy.goto_target(head=head, antennas=[0.2, 0.2], duration=0.2)
-        time.sleep(0.2)
+        _hold(0.2)
         head = create_head_pose(z=3, mm=True, degrees=True)
         reachy.goto_target(head=head, antennas=[0.2, 0.2], duration=0.2)
-        time.sleep(0.2)
+        _hold(0.2)
 
     # Return to neutral
     head = create_head_pose(z=0, mm=True, degrees=True)
     reachy.goto_target(head=head, antennas=[0.1, 0.1], duration=0.3)
 
 
-def idle_breathing(reachy: ReachyMini, should_stop=None):
+def idle_breathing(reachy: ReachyMini, should_stop=None, wait_for_stop=None):
     """Gentle idle animation - can be interrupted by should_stop callback.
 
     Args:
         should_stop: Optional callback that returns True to interrupt animation
+        wait_for_stop: Optional callback wait_for_stop(timeout) that blocks up to
+            timeout seconds and returns True to interrupt (wakes immediately)
     """
     reachy.goto_target(antennas=[0.15, 0.15], duration=0.8, method="minjerk")
-
-    # Sleep in small chunks to allow interruption
-    for _ in range(16):  # 16 x 0.05 = 0.8s
-        if should_stop and should_stop():
-            return  # Exit immediately
-        time.sleep(0.05)
+    if _interruptible_sleep(0.8, should_stop, wait_for_stop):
+        return  # Exit immediately
 
     reachy.goto_target(antennas=[0.05, 0.05], duration=0.8, method="minjerk")
+    _interruptible_sleep(0.8, should_stop, wait_for_stop)
+
+
+def _hold(seconds: float):
+    """Wait between moves (recorded as a span, since these waits add to reaction time)."""
+    with TRACER.span("hold", "animation", seconds=seconds):
+        time.sleep(seconds)
+
+
+def _interruptible_sleep(seconds: float, should_stop=None, wait_for_stop=None) -> bool:
+    """Sleep for seconds; True if interrupted."""
+    if wait_for_stop:
+        return wait_for_stop(seconds)
 
     # Sleep in small chunks to allow interruption
-    for _ in range(16):  # 16 x 0.05 = 0.8s
+    for _ in range(round(seconds / 0.05)):  # 16 x 0.05 = 0.8s
         if should_stop and should_stop():
-            return  # Exit immediately
+            return True
         time.sleep(0.05)
+    return False
 
 
 def get_animation_for_count(count: int):
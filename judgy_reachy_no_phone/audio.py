@@ -1,8 +1,14 @@
 """Text-to-speech and LLM response generation."""
 
+import asyncio
 import logging
+from typing import AsyncIterator, Optional, Union
 
 from .config import PERSONALITIES, get_random_personality
+from .metrics import LLM_SECONDS, TTS_SECONDS
+from .tracing import TRACER
+from .tts_cache import TTSCache
+from .speech_stream import SpeechStream
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,8 @@ class LLMResponder:
             except Exception as e:
                 logger.warning(f"Groq init failed: {e}, using pre-written lines")
 
+    @TRACER.traced("llm_shame", "llm")
+    @LLM_SECONDS.timed
     def get_response(self, phone_count: int, context: str = "") -> str:
         """Get a snarky response about phone usage."""
 
@@ -97,6 +105,8 @@ RULES:
             logger.warning(f"Groq API error: {e}, using fallback")
             return self._get_prewritten_shame()
 
+    @TRACER.traced("llm_praise", "llm")
+    @LLM_SECONDS.timed
     def get_praise(self) -> str:
         """Get praise for putting phone down."""
 
@@ -178,9 +188,22 @@ RULES:
 
 
 class TextToSpeech:
-    """Convert text to speech using Edge TTS (free) or ElevenLabs."""
-
-    def __init__(self, elevenlabs_key: str = "", voice: str = "", eleven_voice_id: str = "", personality: str = "mixtape"):
+    """Convert text to speech using Edge TTS (free) or ElevenLabs.
+
+    With a TTSCache, each clip is stored under a hash of engine, voice, model
+    and text, and repeated lines are played from disk without a network call.
+    """
+
+    ELEVEN_MODEL = "eleven_multilingual_v2"  # Good balance of emotion and speed
+
+    def __init__(
+        self,
+        elevenlabs_key: str = "",
+        voice: str = "",
+        eleven_voice_id: str = "",
+        personality: str = "mixtape",
+        cache: Optional[TTSCache] = None
+    ):
         self.elevenlabs_key = elevenlabs_key
         self.user_edge_voice = voice  # User's custom Edge TTS voice (overrides personality default)
         self.user_eleven_voice = eleven_voice_id  # User's custom ElevenLabs voice (overrides personality default)
@@ -189,6 +212,7 @@ class TextToSpeech:
         self.chars_used = 0
         self.MONTHLY_LIMIT = 9000  # Leave buffer under 10k
         self.working_voice_cache = {}  # Cache of personality -> working voice ID
+        self.cache = cache
 
         if elevenlabs_key:
             try:
@@ -221,8 +245,13 @@ class TextToSpeech:
 
         return edge_voice, eleven_voices
 
-    async def synthesize(self, text: str, output_path: str = "/tmp/judgy_reachy_tts.mp3") -> str:
-        """Convert text to speech, return path to audio file."""
+    @TRACER.traced("tts", "tts")
+    async def synthesize(self, text: str, output_path: str = "/tmp/judgy_reachy_tts.mp3", check_cache: bool = True) -> str:
+        """Convert text to speech, return path to audio file.
+
+        check_cache=False skips the cache lookup when the caller already
+        missed on it (results are still stored).
+        """
 
         # Get appropriate voices for current personality
         edge_voice, eleven_voices = self._get_voice_for_personality()
@@ -234,7 +263,7 @@ class TextToSpeech:
                 try:
                     cached_voice = self.working_voice_cache[self.personality]
                     logger.info(f"Using cached ElevenLabs voice: {cached_voice}")
-                    return await self._synthesize_elevenlabs(text, output_path, cached_voice)
+                    return await self._synthesize_elevenlabs(text, output_path, cached_voice, check_cache)
                 except Exception as e:
                     logger.warning(f"Cached voice failed: {e}, trying other voices")
                     # Remove from cache if it failed
@@ -244,7 +273,7 @@ class TextToSpeech:
             for voice_id in eleven_voices:
                 try:
                     logger.info(f"Trying ElevenLabs voice: {voice_id}")
-                    result = await self._synthesize_elevenlabs(text, output_path, voice_id)
+                    result = await self._synthesize_elevenlabs(text, output_path, voice_id, check_cache)
                     # Success! Cache this voice for future use
                     self.working_voice_cache[self.personality] = voice_id
                     logger.info(f"✓ Voice {voice_id} works! Cached for {self.personality}")
@@ -258,30 +287,120 @@ class TextToSpeech:
 
         # Fallback to Edge TTS (always works, unlimited)
         logger.info(f"Using Edge TTS with voice: {edge_voice}")
-        return await self._synthesize_edge(text, output_path, edge_voice)
+        return await self._synthesize_edge(text, output_path, edge_voice, check_cache)
 
-    async def _synthesize_elevenlabs(self, text: str, output_path: str, voice_id: str) -> str:
-        """Use ElevenLabs for high-quality voice."""
-        audio = self.eleven_client.text_to_speech.convert(
+    async def open_stream(self, text: str, output_path: str = "/tmp/judgy_reachy_tts.mp3") -> Union[str, SpeechStream]:
+        """Start streaming speech for text (call on a running event loop).
+
+        Returns the path of a cached clip when there is one, otherwise a
+        SpeechStream whose MP3 chunks download in the background and are
+        cached once complete. ElevenLabs is only streamed once a working
+        voice is known; until then the file path runs, so voice fallback works.
+        Whenever the file path runs, it synthesizes to output_path.
+        """
+        edge_voice, _ = self._get_voice_for_personality()
+
+        if self.eleven_client and (self.chars_used + len(text)) < self.MONTHLY_LIMIT:
+            voice_id = self.working_voice_cache.get(self.personality)
+            if voice_id is None:
+                return await self.synthesize(text, output_path)
+            key, cached = self._lookup_cache("elevenlabs", voice_id, self.ELEVEN_MODEL, text)
+            chunks = self._stream_elevenlabs(text, voice_id)
+        else:
+            key, cached = self._lookup_cache("edge", edge_voice, "", text)
+            chunks = self._stream_edge(text, edge_voice)
+
+        if cached:
+            return cached
+        return SpeechStream(
+            text,
+            chunks,
+            fallback=lambda: self.synthesize(text, output_path, check_cache=False),
+            on_complete=(lambda data: self.cache.store(key, data)) if key else None,
+            output_path=output_path
+        )
+
+    async def _stream_elevenlabs(self, text: str, voice_id: str) -> AsyncIterator[bytes]:
+        """ElevenLabs audio chunks as the API sends them."""
+        loop = asyncio.get_running_loop()
+        chunks = await loop.run_in_executor(None, lambda: iter(self.eleven_client.text_to_speech.convert(
             text=text,
             voice_id=voice_id,
-            model_id="eleven_multilingual_v2",  # Good balance of emotion and speed
-        )
+            model_id=self.ELEVEN_MODEL,
+        )))
+        self.chars_used += len(text)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    async def _stream_edge(self, text: str, voice: str) -> AsyncIterator[bytes]:
+        """Edge TTS audio chunks as the service sends them."""
+        import edge_tts
 
-        with open(output_path, "wb") as f:
-            for chunk in audio:
-                f.write(chunk)
+        async for message in edge_tts.Communicate(text, voice).stream():
+            if message["type"] == "audio":
+                yield message["data"]
+
+    def _lookup_cache(self, engine: str, voice: str, model: str, text: str, check: bool = True):
+        """Cache key and cached clip path (None, None without a cache).
+
+        check=False only builds the key, so an utterance whose lookup already
+        missed is not counted as a second miss.
+        """
+        if self.cache is None:
+            return None, None
+        key = TTSCache.key(engine, voice, model, text)
+        return key, self.cache.lookup(key) if check else None
+
+    async def _synthesize_elevenlabs(self, text: str, output_path: str, voice_id: str, check_cache: bool = True) -> str:
+        """Use ElevenLabs for high-quality voice."""
+        key, cached = self._lookup_cache("elevenlabs", voice_id, self.ELEVEN_MODEL, text, check_cache)
+        if cached:
+            logger.debug(f"ElevenLabs TTS cache hit: {text!r}")
+            return cached
+
+        # The SDK call blocks: run it in the loop's executor so other jobs keep going
+        with TTS_SECONDS.time():
+            data = await asyncio.get_running_loop().run_in_executor(None, self._convert_elevenlabs, text, voice_id)
 
         self.chars_used += len(text)
         logger.debug(f"ElevenLabs TTS: {len(text)} chars, total: {self.chars_used}")
+
+        if key:
+            return self.cache.store(key, data)
+        with open(output_path, "wb") as f:
+            f.write(data)
         return output_path
 
-    async def _synthesize_edge(self, text: str, output_path: str, voice: str) -> str:
+    def _convert_elevenlabs(self, text: str, voice_id: str) -> bytes:
+        audio = self.eleven_client.text_to_speech.convert(
+            text=text,
+            voice_id=voice_id,
+            model_id=self.ELEVEN_MODEL,
+        )
+        return b"".join(audio)
+
+    async def _synthesize_edge(self, text: str, output_path: str, voice: str, check_cache: bool = True) -> str:
         """Use Edge TTS (free, unlimited)."""
+        key, cached = self._lookup_cache("edge", voice, "", text, check_cache)
+        if cached:
+            logger.debug(f"Edge TTS cache hit: {text!r}")
+            return cached
+
+        if key:
+            # Collected in memory: output_path may be shared with a synthesis running alongside
+            with TTS_SECONDS.time():
+                data = b"".join([chunk async for chunk in self._stream_edge(text, voice)])
+            logger.debug(f"Edge TTS: {len(text)} chars with voice {voice}")
+            return self.cache.store(key, data)
+
         import edge_tts
 
         communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(output_path)
+        with TTS_SECONDS.time():
+            await communicate.save(output_path)
 
         logger.debug(f"Edge TTS: {len(text)} chars with voice {voice}")
         return output_path
@@ -0,0 +1,238 @@
+"""Inference backend selection and a keyed cache of exported models."""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+from importlib import metadata
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("pytorch", "tensorrt", "onnx", "openvino")
+BACKEND_LABELS = {
+    "tensorrt": "TensorRT",
+    "onnx": "ONNX Runtime",
+    "openvino": "OpenVINO",
+}
+PRECISIONS = ("fp32", "fp16", "int8")
+
+# Ultralytics export format for each backend
+EXPORT_FORMATS = {
+    "tensorrt": "engine",
+    "onnx": "onnx",
+    "openvino": "openvino",
+}
+
+# Python package that has to be installed for each exported backend
+BACKEND_PACKAGES = {
+    "tensorrt": "tensorrt",
+    "onnx": "onnxruntime",
+    "openvino": "openvino",
+}
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "judgy_reachy_no_phone", "models")
+
+
+def backend_available(backend: str) -> bool:
+    """True if the runtime for this backend is importable."""
+    if backend == "pytorch":
+        return True
+    package = BACKEND_PACKAGES.get(backend)
+    return package is not None and find_spec(package) is not None
+
+
+def select_backend(device: str, requested: str = "auto") -> str:
+    """
+    Pick an inference backend for the device.
+
+    Auto order: TensorRT on CUDA, PyTorch on MPS, and on CPU OpenVINO, then
+    ONNX Runtime, then PyTorch depending on what is installed.
+    """
+    if requested != "auto":
+        if requested not in BACKENDS:
+            logger.warning(f"Unknown backend '{requested}', choosing automatically")
+        elif not backend_available(requested):
+            logger.warning(f"Backend '{requested}' not installed, choosing automatically")
+        else:
+            return requested
+
+    if device == "cuda":
+        return "tensorrt"
+    if device == "cpu":
+        for backend in ("openvino", "onnx"):
+            if backend_available(backend):
+                return backend
+    return "pytorch"
+
+
+def select_precision(backend: str, requested: str = "auto") -> str:
+    """Resolve "auto" precision: FP16 for TensorRT, FP32 elsewhere."""
+    if requested in PRECISIONS:
+        if requested == "int8" and backend == "onnx":
+            logger.warning("INT8 export is not supported for ONNX Runtime, using FP32")
+            return "fp32"
+        return requested
+    return "fp16" if backend == "tensorrt" else "fp32"
+
+
+def _package_version(package: str) -> str:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "none"
+
+
+def _hash_path(path: Path) -> str:
+    """SHA-256 of a file, or of every file in a directory (exported OpenVINO models are directories)."""
+    digest = hashlib.sha256()
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for file in files:
+        digest.update(str(file.relative_to(path) if path.is_dir() else file.name).encode())
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """On-disk cache of exported model artifacts.
+
+    Each artifact lives in its own directory named by a key derived from the
+    weights hash, backend, precision, input size, calibration data and the
+    versions of the libraries involved, so any change produces a fresh export
+    instead of silently reusing a stale one. A manifest with the artifact's
+    hash is written last; entries without a matching manifest are treated as
+    corrupt and rebuilt.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, cache_dir: str = ""):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+
+    def key(self, weights_path: str, backend: str, precision: str, imgsz: int, calibration_dir: str = "") -> dict:
+        """Describe an artifact; the cache key is the hash of this dict."""
+        fields = {
+            "weights_sha256": _hash_path(Path(weights_path)),
+            "backend": backend,
+            "precision": precision,
+            "imgsz": imgsz,
+            "ultralytics": _package_version("ultralytics"),
+            "torch": _package_version("torch"),
+            "runtime": _package_version(BACKEND_PACKAGES.get(backend, "torch")),
+        }
+        if precision == "int8" and calibration_dir:
+            fields["calibration"] = self._calibration_fingerprint(calibration_dir)
+        return fields
+
+    def entry_dir(self, fields: dict) -> Path:
+        """Cache directory for an artifact key."""
+        digest = hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{fields['backend']}-{fields['precision']}-{fields['imgsz']}-{digest}"
+
+    def lookup(self, fields: dict) -> Optional[str]:
+        """Return the artifact path if a valid entry exists."""
+        entry = self.entry_dir(fields)
+        manifest_path = entry / self.MANIFEST
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            artifact = entry / manifest["artifact"]
+            if manifest["fields"] != fields or not artifact.exists():
+                raise ValueError("manifest does not match")
+            if _hash_path(artifact) != manifest["sha256"]:
+                raise ValueError("artifact hash mismatch")
+            return str(artifact)
+        except Exception as e:
+            logger.warning(f"Cached model in {entry} is stale or corrupt ({e}), rebuilding")
+            self.invalidate(fields)
+            return None
+
+    def invalidate(self, fields: dict):
+        """Delete a cache entry."""
+        shutil.rmtree(self.entry_dir(fields), ignore_errors=True)
+
+    def export(
+        self,
+        weights_path: str,
+        fields: dict,
+        calibration_dir: str = "",
+        progress: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Export the weights for this key into the cache and return the artifact path."""
+        from ultralytics import YOLO
+
+        entry = self.entry_dir(fields)
+        shutil.rmtree(entry, ignore_errors=True)
+        entry.mkdir(parents=True)
+
+        backend = fields["backend"]
+        precision = fields["precision"]
+        if progress:
+            progress(f"Exporting to {backend} ({precision}, {fields['imgsz']}px), first time only...")
+        logger.info(f"Exporting {weights_path} to {backend} ({precision}) in {entry}")
+
+        # Ultralytics writes exports next to the weights, so export a copy inside the entry
+        local_weights = entry / "model.pt"
+        shutil.copy2(weights_path, local_weights)
+
+        export_args = {
+            "format": EXPORT_FORMATS[backend],
+            "imgsz": fields["imgsz"],
+            "half": precision == "fp16",
+            "int8": precision == "int8",
+            "device": 0 if backend == "tensorrt" else "cpu",
+        }
+        if backend == "tensorrt":
+            export_args["workspace"] = 4
+
+        model = YOLO(str(local_weights))
+        if precision == "int8" and calibration_dir:
+            export_args["data"] = self._write_calibration_yaml(entry, calibration_dir, model.names)
+
+        artifact = Path(model.export(**export_args)).resolve()
+        local_weights.unlink(missing_ok=True)
+
+        # Manifest goes last: an interrupted export leaves no manifest and is rebuilt
+        manifest = {
+            "fields": fields,
+            "artifact": str(artifact.relative_to(entry.resolve())),
+            "sha256": _hash_path(artifact),
+        }
+        tmp_path = entry / (self.MANIFEST + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, entry / self.MANIFEST)
+
+        logger.info(f"✅ Export complete: {artifact}")
+        return str(artifact)
+
+    @staticmethod
+    def _calibration_fingerprint(calibration_dir: str) -> str:
+        """Cheap fingerprint of the calibration images (names and sizes)."""
+        digest = hashlib.sha256()
+        for path in sorted(Path(calibration_dir).rglob("*")):
+            if path.is_file():
+                digest.update(f"{path.name}:{path.stat().st_size}".encode())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _write_calibration_yaml(entry: Path, calibration_dir: str, names: dict) -> str:
+        """Dataset file pointing Ultralytics at recorded desk frames for INT8 calibration."""
+        path = entry / "calibration.yaml"
+        lines = [
+            f"path: {Path(calibration_dir).resolve()}",
+            "train: .",
+            "val: .",
+            "names:",
+        ]
+        lines += [f"  {idx}: {json.dumps(name)}" for idx, name in sorted(names.items())]
+        path.write_text("\n".join(lines) + "\n")
+        return str(path)
@@ -0,0 +1,102 @@
+"""Two-stage detection cascade: small model screens, main model confirms."""
+
+import logging
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CascadePolicy:
+    """Escalation policy for the screening model.
+
+    The screening model runs at screen_ratio x the detector's active
+    confidence threshold (DETECTION_CONFIDENCE, or TRACKING_CONFIDENCE while a
+    phone is tracked), so it flags anything the main model might accept.
+
+    Modes:
+        "crop"  - confirm with the main model on a crop around the flagged boxes
+        "frame" - confirm with the main model (+ ByteTrack) on the full frame
+    A pending pickup always escalates to a full-frame confirmation.
+    """
+
+    MODES = ("crop", "frame")
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for latency samples
+
+    def __init__(
+        self,
+        screen_weights: str = "yolo26n.pt",
+        mode: str = "crop",
+        screen_ratio: float = 0.5,
+        crop_margin: float = 0.5
+    ):
+        if mode not in self.MODES:
+            logger.warning(f"Unknown cascade mode '{mode}', using 'crop'")
+            mode = "crop"
+        self.screen_weights = screen_weights
+        self.mode = mode
+        self.screen_ratio = screen_ratio
+        self.crop_margin = crop_margin  # Crop padding around flagged boxes (fraction of size)
+
+        # Stats
+        self.screen_runs = 0
+        self.escalations = 0
+        self.screen_latency = 0.0   # Smoothed (seconds)
+        self.confirm_latency = 0.0  # Smoothed (seconds)
+
+    def screen_threshold(self, active_threshold: float) -> float:
+        """Confidence threshold for the screening model."""
+        return active_threshold * self.screen_ratio
+
+    def should_escalate(self, screen_detections: list, pickup_pending: bool) -> bool:
+        """Decide whether the main model has to look at this frame."""
+        self.screen_runs += 1
+        if screen_detections or pickup_pending:
+            self.escalations += 1
+            return True
+        return False
+
+    def crop_region(self, detections: list, frame_shape) -> Tuple[int, int, int, int]:
+        """Expanded box around all flagged detections."""
+        height, width = frame_shape[:2]
+        x1 = min(d.x1 for d in detections)
+        y1 = min(d.y1 for d in detections)
+        x2 = max(d.x2 for d in detections)
+        y2 = max(d.y2 for d in detections)
+        pad_x = int((x2 - x1) * self.crop_margin)
+        pad_y = int((y2 - y1) * self.crop_margin)
+        return (
+            max(0, x1 - pad_x),
+            max(0, y1 - pad_y),
+            min(width, x2 + pad_x),
+            min(height, y2 + pad_y),
+        )
+
+    def record_screen(self, seconds: float):
+        """Feed back the latency of a screening run."""
+        self.screen_latency = self._smooth(self.screen_latency, seconds)
+
+    def record_confirm(self, seconds: float):
+        """Feed back the latency of a main-model confirmation."""
+        self.confirm_latency = self._smooth(self.confirm_latency, seconds)
+
+    def _smooth(self, current: float, sample: float) -> float:
+        if current == 0.0:
+            return sample
+        return current + self.LATENCY_SMOOTHING * (sample - current)
+
+    def reset_stats(self):
+        """Zero the statistics (e.g. between benchmark recordings)."""
+        self.screen_runs = 0
+        self.escalations = 0
+        self.screen_latency = 0.0
+        self.confirm_latency = 0.0
+
+    def get_stats(self) -> dict:
+        """Get cascade statistics."""
+        return {
+            "mode": self.mode,
+            "screen_runs": self.screen_runs,
+            "escalation_rate": round(self.escalations / self.screen_runs, 3) if self.screen_runs else 0.0,
+            "screen_latency_ms": round(self.screen_latency * 1000, 1),
+            "confirm_latency_ms": round(self.confirm_latency * 1000, 1),
+        }
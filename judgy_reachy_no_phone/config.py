@@ -8,11 +8,71 @@ from dataclasses import dataclass
 class Config:
     """App configuration."""
     # Detection settings
-    PICKUP_THRESHOLD: int = 3          # Frames to confirm phone pickup
-    PUTDOWN_THRESHOLD: int = 15        # Frames to confirm phone put down (~3 sec)
+    PICKUP_SECONDS: float = 0.5        # Seconds of sightings to confirm phone pickup
+    PUTDOWN_SECONDS: float = 3.0       # Seconds without phone to confirm put down
     DETECTION_CONFIDENCE: float = 0.3  # Higher = fewer false positives
     COOLDOWN_SECONDS: float = 10.0     # Min time between shames
 
+    # Detection scheduling (adaptive rate instead of a fixed frame stride)
+    DETECTION_CPU_BUDGET: float = 0.5       # Max fraction of time spent in inference
+    DETECTION_DENSE_INTERVAL: float = 0.1   # Seconds between detections while phone visible/pending
+    DETECTION_NORMAL_INTERVAL: float = 0.2  # Seconds between detections shortly after a phone was seen
+    DETECTION_SPARSE_INTERVAL: float = 0.5  # Seconds between detections in long phone-free stretches
+    DETECTION_IDLE_AFTER: float = 30.0      # Phone-free seconds before switching to sparse
+
+    # Motion gate (reuse the last result when the scene has not changed)
+    MOTION_GATE_ENABLED: bool = True
+    MOTION_THRESHOLD: float = 0.005    # Fraction of changed thumbnail pixels that counts as motion
+    MOTION_MAX_INTERVAL: float = 2.0   # Force a real detection at least this often (seconds)
+
+    # Track-and-crop (follow a held phone, confirm with YOLO on a crop only)
+    TRACK_CROP_ENABLED: bool = True
+    TRACK_CONFIRM_INTERVAL: float = 1.0  # Seconds between YOLO confirmations of a tracked phone
+    TRACK_CROP_MARGIN: float = 0.5       # Crop padding around the box (fraction of box size)
+    TRACK_MIN_SCORE: float = 0.5         # Min template match score before the track is lost
+
+    # Inference backend ("auto" = TensorRT on NVIDIA, OpenVINO/ONNX Runtime on CPU if installed)
+    INFERENCE_BACKEND: str = "auto"    # "auto", "pytorch", "tensorrt", "onnx", "openvino"
+    INFERENCE_PRECISION: str = "auto"  # "auto", "fp32", "fp16", "int8"
+    MODEL_CACHE_DIR: str = ""          # Exported models (default: ~/.cache/judgy_reachy_no_phone/models)
+    INT8_CALIBRATION_DIR: str = ""     # Folder of recorded desk frames for INT8 calibration
+    INFERENCE_SIZE: int = 640          # Model input size (320/416/640): smaller = faster, phones are large
+
+    # Model cascade (small model screens, YOLO26m confirms)
+    CASCADE_ENABLED: bool = False
+    CASCADE_SCREEN_MODEL: str = "yolo26n.pt"
+    CASCADE_MODE: str = "crop"           # "crop" = confirm on flagged region, "frame" = full frame
+    CASCADE_SCREEN_RATIO: float = 0.5    # Screen threshold as a fraction of the active confidence
+
+    # Web preview (drawn and encoded only while someone is watching)
+    PREVIEW_IDLE_TIMEOUT: float = 5.0    # Stop drawing frames this many seconds after the last viewer
+
+    # Laptop webcam capture (simulation mode)
+    CAMERA_LOW_LATENCY: bool = True      # MJPG, 1-frame driver buffer, skip queued frames
+    CAMERA_WIDTH: int = 640
+    CAMERA_HEIGHT: int = 480
+    CAMERA_FPS: int = 30
+
+    # Recorded input instead of a camera (profiling, testing without hardware)
+    REPLAY_SOURCE: str = ""              # Video file or folder of images ("" = live camera)
+    REPLAY_REALTIME: bool = True         # False = replay as fast as the pipeline can go
+
+    # Synthesized speech cache (repeated lines skip the TTS network call)
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_DIR: str = ""              # Default: ~/.cache/judgy_reachy_no_phone/tts
+    TTS_CACHE_MAX_MB: int = 100          # Least recently used clips are deleted past this size
+    WARMUP_ENABLED: bool = True          # Pre-synthesize prewritten lines when monitoring starts
+    WARMUP_ELEVENLABS: bool = False      # Also warm ElevenLabs voices (spends monthly quota)
+    SPECULATIVE_REACTIONS: bool = True   # Start the shame line + audio on the first sighting
+    SPECULATION_TIMEOUT: float = 5.0     # Max wait for a speculative shame before generating it normally
+    REACTION_WORKERS: int = 4            # Threads for blocking LLM/TTS/playback calls
+    TTS_STREAMING: bool = True           # Start speaking on the first audio chunk (needs ffmpeg)
+    TTS_JITTER_BUFFER_MS: int = 150      # Audio decoded before playback starts (absorbs network gaps)
+
+    # Span tracing (export at /api/trace, open in chrome://tracing or ui.perfetto.dev)
+    TRACE_ENABLED: bool = False
+    TRACE_CAPACITY: int = 50000          # Spans kept in memory (oldest dropped first)
+
     # API Keys (optional - leave empty for free defaults)
     GROQ_API_KEY: str = ""             # Get free at console.groq.com
     ELEVENLABS_API_KEY: str = ""       # Get free at elevenlabs.io
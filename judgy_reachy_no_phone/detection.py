@@ -1,16 +1,71 @@
 """Phone detection using YOLO."""
 
 import time
+import threading
 import logging
 from collections import deque
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, fields
+from typing import Optional
 
 import cv2
 import numpy as np
 
+from .phone_state import PhoneStateMachine
+from .motion import MotionGate
+from .roi_tracker import RoiTracker
+from .cascade import CascadePolicy
+from .preprocess import Letterbox
+from .tracing import TRACER
+from .metrics import DETECTIONS, DRAW_SECONDS, INFERENCE_RUNS, INFERENCE_SECONDS, INFERENCE_SKIPPED, PARSE_SECONDS
+from .backends import ExportCache, BACKEND_LABELS, select_backend, select_precision
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Detection:
+    """A single phone detection in frame coordinates.
+
+    Supports dict-style access (det['x1'], det.get('track_id')) so code written
+    against the old detection dicts keeps working.
+    """
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    confidence: float
+    class_name: str = "cell phone"
+    track_id: Optional[int] = None
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        if key not in self.keys():
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _DETECTION_FIELDS
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _DETECTION_FIELDS else default
+
+    @staticmethod
+    def keys() -> tuple:
+        return _DETECTION_FIELDS
+
+    def as_dict(self) -> dict:
+        """Plain dict copy (e.g. for JSON responses)."""
+        return {key: getattr(self, key) for key in _DETECTION_FIELDS}
+
+
+_DETECTION_FIELDS = tuple(f.name for f in fields(Detection))
+
+
 class PhoneDetector:
     """Detect phone in camera frame using YOLO."""
 
@@ -21,35 +76,82 @@ class PhoneDetector:
     TRACKING_CONFIDENCE = 0.2   # Lower threshold when tracking existing phone
     TRACKING_PERSIST_FRAMES = 3  # Keep tracking for N frames after losing detection
 
-    def __init__(self, confidence: float = 0.5, loading_callback=None):
+    WEIGHTS = "yolo26m.pt"
+
+    def __init__(
+        self,
+        confidence: float = 0.5,
+        loading_callback=None,
+        motion_gate: Optional[MotionGate] = None,
+        roi_tracker: Optional[RoiTracker] = None,
+        cascade: Optional[CascadePolicy] = None,
+        backend: str = "auto",
+        precision: str = "auto",
+        model_cache_dir: str = "",
+        calibration_dir: str = "",
+        imgsz: int = 640,
+        device: str = "auto"
+    ):
         self.confidence = confidence  # Kept for backward compatibility
         self.yolo_model = None
+        self.crop_model = None  # Second instance of the main model for crops (never runs the tracker)
+        self._exported_artifact: Optional[str] = None
         self._initialized = False
         self.loading_callback = loading_callback  # Callback to report loading progress
 
-        # State tracking
-        self.phone_visible = False
-        self.consecutive_phone = 0
-        self.consecutive_no_phone = 0
-        self.phone_count = 0
-        self.last_reaction_time = 0
+        # Inference backend: "auto", "pytorch", "tensorrt", "onnx" or "openvino"
+        self.backend = backend
+        self.precision = precision  # "auto", "fp32", "fp16" or "int8"
+        self.calibration_dir = calibration_dir  # Recorded desk frames for INT8 calibration
+        self.export_cache = ExportCache(model_cache_dir)
+        self.backend_name = "none"
+        self.device = device  # "auto", "cuda", "mps" or "cpu"
+
+        # Model input size: frames are letterboxed into reused imgsz x imgsz buffers
+        self.imgsz = imgsz
+        self._frame_letterbox = Letterbox(imgsz)
+        self._crop_letterbox = Letterbox(imgsz)
+
+        # Skip the model when the scene is static (reuses the last result)
+        self.motion_gate = motion_gate
+
+        # Follow a detected phone between YOLO runs (track-and-crop mode)
+        self.roi_tracker = roi_tracker
+        self.full_frame_runs = 0
+        self.crop_runs = 0
+        self._model_ran = False
+
+        # Optional small screening model in front of the main model
+        self.cascade = cascade
+        self.screen_model = None
+
+        # State tracking (time-based pickup/putdown hysteresis)
+        self.state = PhoneStateMachine(reference_confidence=self.DETECTION_CONFIDENCE)
+        self._count_lock = threading.Lock()  # Count updates from the inference thread vs. dropped events
 
         # History for robust detection
         self.history = deque(maxlen=30)
 
         # Tracking persistence (like demo.js)
-        self.last_phone_box: Optional[Dict[str, Any]] = None
+        self.last_phone_box: Optional[Detection] = None
         self.frames_without_detection = 0
 
-        # For visualization
+        # For visualization (compact Detections only, never raw YOLO results)
         self.last_detections = []
+        self._preview_buffer: Optional[np.ndarray] = None
+
+        # Last returned detections (reused when the motion gate skips the model)
+        self.current_detections = []
+
+        # Duration of the last detect_phone_with_tracking call (seconds)
+        self.last_inference_time = 0.0
 
         # Loading state (like demo.js)
         self.loading_status = "idle"  # idle, loading, ready, error
         self.loading_message = ""
 
     def initialize(self):
-        """Load YOLO model with progress reporting and TensorRT support."""
+        """Load YOLO model with progress reporting and TensorRT / OpenVINO / ONNX Runtime support."""
         if self._initialized:
             return True
 
@@ -63,71 +165,49 @@ class PhoneDetector:
 
             import torch
             from ultralytics import YOLO
-            import os
 
             # Auto-detect best device (supports CUDA, MPS, and CPU)
-            if torch.cuda.is_available():
+            if self.device != "auto":
+                device = self.device
+            elif torch.cuda.is_available():
                 device = 'cuda'  # NVIDIA GPU
-                use_tensorrt = True
             elif torch.backends.mps.is_available():
                 device = 'mps'   # Apple Silicon GPU
-                use_tensorrt = False
             else:
                 device = 'cpu'   # Fallback to CPU
-                use_tensorrt = False
-
-            # TensorRT optimization for NVIDIA GPUs (2-3x faster!)
-            if use_tensorrt:
-                engine_path = "yolo26m.engine"
-
-                # Check if TensorRT engine already exists
-                if os.path.exists(engine_path):
-                    try:
-                        logger.info("Found existing TensorRT engine, loading...")
-                        self.loading_message = "Loading TensorRT engine..."
-                        if self.loading_callback:
-                            self.loading_callback("loading", "Loading TensorRT engine...")
-
-                        self.yolo_model = YOLO(engine_path)
-                        logger.info("✅ Loaded TensorRT engine (2-3x faster!)")
-
-                    except Exception as e:
-                        logger.warning(f"TensorRT engine load failed: {e}, falling back to PyTorch")
-                        use_tensorrt = False
-                else:
-                    # Export to TensorRT engine (one-time, takes 1-2 minutes)
-                    try:
-                        logger.info("TensorRT engine not found, exporting (one-time setup, ~1-2 min)...")
-                        self.loading_message = "Exporting to TensorRT (first time, ~1-2 min)..."
-                        if self.loading_callback:
-                            self.loading_callback("loading", "Exporting to TensorRT (first time, ~1-2 min)...")
-
-                        # Load PyTorch model first
-                        temp_model = YOLO("yolo26m.pt")
-
-                        # Export to TensorRT
-                        temp_model.export(format='engine', device=0, half=True, workspace=4)
-                        logger.info("✅ TensorRT export complete!")
-
-                        # Load the exported engine
-                        self.yolo_model = YOLO(engine_path)
-                        logger.info("✅ Loaded TensorRT engine (2-3x faster!)")
-
-                    except Exception as e:
-                        logger.warning(f"TensorRT export failed: {e}, using PyTorch instead")
-                        use_tensorrt = False
-
-            # Fallback to PyTorch (if not NVIDIA GPU or TensorRT failed)
-            if not use_tensorrt:
-                self.loading_message = f"Loading YOLO26m on {device.upper()}..."
-                if self.loading_callback:
-                    self.loading_callback("loading", f"Loading YOLO26m on {device.upper()}...")
-
-                self.yolo_model = YOLO("yolo26m.pt").to(device)
+
+            # TensorRT on NVIDIA, OpenVINO / ONNX Runtime on CPU (or manual override)
+            backend = select_backend(device, self.backend)
+            if backend != "pytorch":
+                try:
+                    self.yolo_model = self._load_exported(YOLO, backend)
+                except Exception as e:
+                    logger.warning(f"{backend} backend failed: {e}, falling back to PyTorch")
+                    backend = "pytorch"
+
+            # Fallback to PyTorch (MPS, missing runtimes, or export failure)
+            if backend == "pytorch":
+                self._report_loading(f"Loading YOLO26m on {device.upper()}...")
+                self.yolo_model = YOLO(self.WEIGHTS).to(device)
                 logger.info(f"Loaded YOLO26m on {device.upper()} (PyTorch)")
 
+            # Crops need their own instance: after the first track(), ByteTrack's
+            # callbacks stay registered on yolo_model and would run on every predict()
+            if self.roi_tracker is not None or (self.cascade is not None and self.cascade.mode == "crop"):
+                self.crop_model = self._load_crop_model(YOLO, backend, device)
+
+            # Small screening model for the cascade (optional, PyTorch)
+            if self.cascade is not None:
+                try:
+                    self.screen_model = YOLO(self.cascade.screen_weights).to(device)
+                    logger.info(f"Loaded cascade screening model {self.cascade.screen_weights} on {device.upper()}")
+                except Exception as e:
+                    logger.warning(f"Cascade screening model load failed: {e}, using single model")
+                    self.screen_model = None
+
             # Report success
-            backend = "TensorRT" if use_tensorrt else device.upper()
+            self.backend_name = backend if backend != "pytorch" else f"pytorch-{device}"
+            backend = BACKEND_LABELS.get(backend, device.upper())
             self.loading_status = "ready"
             self.loading_message = f"Model ready on {backend}"
             if self.loading_callback:
@@ -146,6 +226,47 @@ class PhoneDetector:
             logger.error(f"Failed to load YOLO: {e}")
             return False
 
+    def _report_loading(self, message: str):
+        """Report a loading progress message."""
+        self.loading_message = message
+        if self.loading_callback:
+            self.loading_callback("loading", message)
+
+    def _load_crop_model(self, YOLO, backend: str, device: str):
+        """Load the main model again for crop inference."""
+        if backend == "pytorch":
+            return YOLO(self.WEIGHTS).to(device)
+        return YOLO(self._exported_artifact, task="detect")
+
+    def _load_exported(self, YOLO, backend: str):
+        """Load the model for an exported backend, exporting it into the cache on first use."""
+        precision = select_precision(backend, self.precision)
+        self._report_loading(f"Preparing {BACKEND_LABELS[backend]} model...")
+
+        # Resolve the local weights file (downloads yolo26m.pt on first run)
+        weights_path = getattr(YOLO(self.WEIGHTS), "ckpt_path", None) or self.WEIGHTS
+        fields = self.export_cache.key(weights_path, backend, precision, self.imgsz, self.calibration_dir)
+
+        for attempt in range(2):
+            artifact = self.export_cache.lookup(fields)
+            if artifact is None:
+                artifact = self.export_cache.export(
+                    weights_path, fields, self.calibration_dir, progress=self._report_loading
+                )
+
+            try:
+                model = YOLO(artifact, task="detect")
+                # Exported models load lazily: run one frame so a broken artifact fails here
+                model.predict(np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8), imgsz=self.imgsz, verbose=False)
+                logger.info(f"✅ Loaded {BACKEND_LABELS[backend]} model ({precision}) from {artifact}")
+                self._exported_artifact = artifact
+                return model
+            except Exception as e:
+                if attempt:
+                    raise
+                logger.warning(f"Cached {backend} model failed to load: {e}, rebuilding")
+                self.export_cache.invalidate(fields)
+
     def detect_phone(self, frame: np.ndarray) -> bool:
         """
         Check if phone is in frame (backward compatible).
@@ -155,12 +276,18 @@ class PhoneDetector:
         detections = self.detect_phone_with_tracking(frame)
         return len(detections) > 0
 
-    def detect_phone_with_tracking(self, frame: np.ndarray) -> list:
+    @TRACER.traced("detect", "inference")
+    def detect_phone_with_tracking(self, frame: np.ndarray, timestamp: Optional[float] = None) -> list:
         """
         Detect phone with YOLO's built-in ByteTrack tracking + adaptive confidence.
 
+        If a motion gate is set and the scene has not changed since the last
+        model run, the previous detections are returned without running YOLO.
+        If an ROI tracker is set, a detected phone is followed by template
+        matching and only re-checked by YOLO on a crop around it.
+
         Returns:
-            List of detection dicts with keys: x1, y1, x2, y2, confidence, class_name, track_id
+            List of Detection (dict-compatible: x1, y1, x2, y2, confidence, class_name, track_id)
 
         NOTE: To revert to custom tracking, see git history or the old implementation
         that used manual tracking persistence (TRACKING_PERSIST_FRAMES approach).
@@ -169,58 +296,26 @@ class PhoneDetector:
             if not self.initialize():
                 return []
 
+        start = time.perf_counter()
+        self._model_ran = False
         try:
-            # Adaptive confidence: lower threshold when we have active tracks
-            confidence_threshold = (
-                self.TRACKING_CONFIDENCE if self.last_phone_box
-                else self.DETECTION_CONFIDENCE
-            )
+            if timestamp is None:
+                timestamp = time.time()
 
-            # Use YOLO's built-in tracker (ByteTrack) instead of manual tracking
-            # persist=True keeps track IDs across frames, tracker="bytetrack.yaml"
-            results = self.yolo_model.track(
-                frame,
-                persist=True,  # Maintain track IDs across frames
-                conf=confidence_threshold,  # Adaptive confidence
-                tracker="bytetrack.yaml",  # ByteTrack algorithm (robust, fast)
-                verbose=False,
-                classes=[self.PHONE_CLASS_ID]  # Only track phones
-            )
-            self.last_detections = results  # Save for visualization
-
-            # Collect tracked phones with their IDs
-            new_detections = []
-            best_phone = None
-            best_score = 0.0
-
-            for result in results:
-                if result.boxes is None or len(result.boxes) == 0:
-                    continue
-
-                for box in result.boxes:
-                    if int(box.cls) == self.PHONE_CLASS_ID:
-                        conf = float(box.conf)
-                        x1, y1, x2, y2 = map(int, box.xyxy[0])
-
-                        # Get track ID (ByteTrack assigns persistent IDs)
-                        track_id = int(box.id[0]) if box.id is not None else None
-
-                        detection = {
-                            'x1': x1,
-                            'y1': y1,
-                            'x2': x2,
-                            'y2': y2,
-                            'confidence': conf,
-                            'class_name': 'cell phone',
-                            'track_id': track_id
-                        }
-
-                        new_detections.append(detection)
-
-                        # Track the most confident phone for state tracking
-                        if conf > best_score:
-                            best_score = conf
-                            best_phone = detection
+            if self.motion_gate is not None and not self.motion_gate.should_infer(frame, timestamp):
+                return list(self.current_detections)
+
+            # While a phone is tracked, follow it cheaply and only confirm on a crop
+            new_detections = None
+            if self.roi_tracker is not None and self.roi_tracker.active:
+                new_detections = self._detect_in_roi(frame, timestamp)
+
+            # No track (or track lost): full-frame YOLO + ByteTrack
+            if new_detections is None:
+                new_detections = self._detect_full_frame(frame, timestamp)
+
+            # Track the most confident phone for state tracking
+            best_phone = max(new_detections, key=lambda d: d.confidence, default=None)
 
             # Update last_phone_box with the best detection (for adaptive confidence)
             if best_phone:
@@ -232,102 +327,288 @@ class PhoneDetector:
                 if self.frames_without_detection >= self.TRACKING_PERSIST_FRAMES:
                     self.last_phone_box = None
 
+            if self.motion_gate is not None and self._model_ran:
+                self.motion_gate.record_inference(time.perf_counter() - start)
+
+            DETECTIONS.inc(len(new_detections))
+            self.last_detections = new_detections  # Save for visualization
+            self.current_detections = new_detections
             return new_detections
 
         except Exception as e:
             logger.debug(f"YOLO tracking error: {e}")
             return []
 
-    def draw_detections(self, frame: np.ndarray) -> np.ndarray:
-        """Draw detection boxes on frame."""
-        if not self.last_detections:
-            return frame
+        finally:
+            self.last_inference_time = time.perf_counter() - start
+            # Gated and ROI-tracked passes cost next to nothing: keep them out of the inference stage
+            if self._model_ran:
+                INFERENCE_RUNS.inc()
+                INFERENCE_SECONDS.observe(self.last_inference_time)
+            else:
+                INFERENCE_SKIPPED.inc()
+
+    @TRACER.traced("yolo_full_frame", "inference")
+    def _detect_full_frame(self, frame: np.ndarray, timestamp: float) -> list:
+        """Run YOLO + ByteTrack on the whole frame (behind the cascade screen, if any)."""
+        # Adaptive confidence: lower threshold when we have active tracks
+        confidence_threshold = (
+            self.TRACKING_CONFIDENCE if self.last_phone_box
+            else self.DETECTION_CONFIDENCE
+        )
+
+        # Letterbox once; the screening and main model share the same input
+        model_input = self._frame_letterbox(frame)
+
+        if self.screen_model is not None:
+            flagged = self._screen(model_input, confidence_threshold)
+            if not self.cascade.should_escalate(flagged, self.state.pickup_pending):
+                return []
+            if flagged and self.cascade.mode == "crop" and not self.state.pickup_pending:
+                start = time.perf_counter()
+                detections = self._predict_crop(
+                    frame, self.cascade.crop_region(flagged, frame.shape), confidence_threshold
+                )
+                self.cascade.record_confirm(time.perf_counter() - start)
+                self._start_roi_tracking(frame, detections, timestamp)
+                return detections
+
+        start = time.perf_counter()
+
+        # Use YOLO's built-in tracker (ByteTrack) instead of manual tracking
+        # persist=True keeps track IDs across frames, tracker="bytetrack.yaml"
+        results = self.yolo_model.track(
+            model_input,
+            persist=True,  # Maintain track IDs across frames
+            conf=confidence_threshold,  # Adaptive confidence
+            tracker="bytetrack.yaml",  # ByteTrack algorithm (robust, fast)
+            imgsz=self.imgsz,
+            verbose=False,
+            classes=[self.PHONE_CLASS_ID]  # Only track phones
+        )
+        self._model_ran = True
+        self.full_frame_runs += 1
+        if self.screen_model is not None:
+            self.cascade.record_confirm(time.perf_counter() - start)
+
+        detections = self._parse_results(results, confidence_threshold, letterbox=self._frame_letterbox)
+        self._start_roi_tracking(frame, detections, timestamp)
+        return detections
+
+    def _screen(self, model_input: np.ndarray, active_threshold: float) -> list:
+        """Run the small screening model at a lowered threshold (on the letterboxed frame)."""
+        threshold = self.cascade.screen_threshold(active_threshold)
+        start = time.perf_counter()
+        results = self.screen_model.predict(
+            model_input,
+            conf=threshold,
+            imgsz=self.imgsz,
+            verbose=False,
+            classes=[self.PHONE_CLASS_ID]
+        )
+        self._model_ran = True
+        self.cascade.record_screen(time.perf_counter() - start)
+        return self._parse_results(results, threshold, letterbox=self._frame_letterbox)
+
+    def _predict_crop(self, frame: np.ndarray, region, confidence_threshold: float) -> list:
+        """Run the main model (no tracker) on a crop, in frame coordinates."""
+        x0, y0, x1, y1 = region
+        results = self.crop_model.predict(
+            self._crop_letterbox(frame[y0:y1, x0:x1]),
+            conf=confidence_threshold,
+            imgsz=self.imgsz,
+            verbose=False,
+            classes=[self.PHONE_CLASS_ID]
+        )
+        self._model_ran = True
+        self.crop_runs += 1
+        return self._parse_results(
+            results, confidence_threshold, offset=(x0, y0), letterbox=self._crop_letterbox
+        )
+
+    def _start_roi_tracking(self, frame: np.ndarray, detections: list, timestamp: float):
+        """Hand the best phone to the ROI tracker so the next frames skip YOLO."""
+        if self.roi_tracker is not None and detections:
+            best = max(detections, key=lambda d: d.confidence)
+            self.roi_tracker.start(
+                frame, (best.x1, best.y1, best.x2, best.y2),
+                best.confidence, best.track_id, timestamp
+            )
 
-        frame_with_boxes = frame.copy()
+    @TRACER.traced("roi_track", "inference")
+    def _detect_in_roi(self, frame: np.ndarray, timestamp: float) -> Optional[list]:
+        """Follow the tracked phone; returns None when the track is lost."""
+        tracker = self.roi_tracker
+
+        if tracker.confirmation_due(timestamp):
+            # Periodic YOLO confirmation on an expanded crop around the box
+            detections = self._predict_crop(frame, tracker.crop_region(frame.shape), self.TRACKING_CONFIDENCE)
+            if not detections:
+                tracker.stop()
+                return None
+
+            # Crops are not run through ByteTrack: keep the track's ID
+            best = max(detections, key=lambda d: d.confidence)
+            best.track_id = tracker.track_id
+            tracker.start(
+                frame, (best.x1, best.y1, best.x2, best.y2),
+                best.confidence, tracker.track_id, timestamp
+            )
+            return detections
 
-        try:
-            for result in self.last_detections:
-                for box in result.boxes:
-                    cls = int(box.cls)
+        box = tracker.update(frame)
+        if box is None:
+            return None
 
-                    # Only draw phones
-                    if cls != self.PHONE_CLASS_ID:
-                        continue
+        x1, y1, x2, y2 = box
+        return [Detection(x1, y1, x2, y2, tracker.confidence, track_id=tracker.track_id)]
 
-                    conf = float(box.conf)
-                    x1, y1, x2, y2 = map(int, box.xyxy[0])
+    def _parse_results(
+        self,
+        results,
+        min_confidence: float = 0.0,
+        offset=(0, 0),
+        letterbox: Optional[Letterbox] = None
+    ) -> list:
+        """Convert YOLO results to Detections in frame coordinates.
+
+        Boxes are mapped back through the letterbox (if the model saw a
+        letterboxed image) and then shifted by offset (if it saw a crop).
+
+        Each result's boxes are pulled out in one transfer (boxes.data, rows of
+        x1, y1, x2, y2, [track_id], conf, cls) and filtered with NumPy, instead
+        of converting every box field to a Python scalar one at a time.
+        """
+        start = time.perf_counter()
+        off_x, off_y = offset
+        detections = []
+
+        for result in results:
+            if result.boxes is None or len(result.boxes) == 0:
+                continue
+
+            data = result.boxes.data.cpu().numpy()
+            keep = (data[:, -1] == self.PHONE_CLASS_ID) & (data[:, -2] >= min_confidence)
+            if not keep.any():
+                continue
+            data = data[keep]
+
+            boxes = data[:, :4]
+            if letterbox is not None:
+                boxes = letterbox.to_frame(boxes)
+            coords = boxes.astype(np.int32)
+            coords += (off_x, off_y, off_x, off_y)
+            confidences = data[:, -2].tolist()
+
+            # Get track IDs (ByteTrack assigns persistent IDs)
+            if data.shape[1] == 7:
+                track_ids = data[:, 4].astype(np.int64).tolist()
+            else:
+                track_ids = [None] * len(confidences)
+
+            for (x1, y1, x2, y2), conf, track_id in zip(coords.tolist(), confidences, track_ids):
+                detections.append(Detection(x1, y1, x2, y2, conf, track_id=track_id))
+
+        PARSE_SECONDS.observe(time.perf_counter() - start)
+        return detections
+
+    def draw_detections(self, frame: np.ndarray) -> np.ndarray:
+        """Draw detection boxes on frame.
+
+        Returns the frame itself when there is nothing to draw. Otherwise the
+        boxes are drawn into a preview buffer that is reused across calls, so
+        the returned array is only valid until the next call.
+        """
+        detections = self.last_detections
+        if not detections:
+            return frame
 
-                    # Get class name from model
-                    class_name = self.yolo_model.names[cls] if self.yolo_model else "phone"
+        start = time.perf_counter()
+        if self._preview_buffer is None or self._preview_buffer.shape != frame.shape:
+            self._preview_buffer = np.empty_like(frame)
+        frame_with_boxes = self._preview_buffer
+        np.copyto(frame_with_boxes, frame)
 
-                    # Draw green box for phone
-                    cv2.rectangle(frame_with_boxes, (x1, y1), (x2, y2), (0, 255, 0), 3)
-                    text = f"{class_name} {conf:.2f}"
-                    cv2.putText(frame_with_boxes, text, (x1, y1 - 10),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        try:
+            # Detections may come from YOLO or from the ROI tracker, so draw
+            # from the parsed Detections rather than raw YOLO results
+            for det in detections:
+                x1, y1, x2, y2 = det.x1, det.y1, det.x2, det.y2
+
+                # Draw green box for phone
+                cv2.rectangle(frame_with_boxes, (x1, y1), (x2, y2), (0, 255, 0), 3)
+                text = f"{det.class_name} {det.confidence:.2f}"
+                cv2.putText(frame_with_boxes, text, (x1, y1 - 10),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         except Exception as e:
             logger.debug(f"Draw error: {e}")
 
+        DRAW_SECONDS.observe(time.perf_counter() - start)
         return frame_with_boxes
 
     def process_frame(
         self,
         frame: np.ndarray,
-        pickup_threshold: int = 3,
-        putdown_threshold: int = 15,
-        cooldown: float = 30.0
+        pickup_seconds: float = 0.5,
+        putdown_seconds: float = 3.0,
+        cooldown: float = 30.0,
+        timestamp: Optional[float] = None
     ) -> Optional[str]:
         """
         Process a frame and track phone state.
 
+        Args:
+            pickup_seconds: Seconds of (confidence-weighted) sightings to confirm pickup
+            putdown_seconds: Seconds without a sighting to confirm put down
+            cooldown: Min seconds between shames
+            timestamp: Capture time of the frame (defaults to now)
+
         Returns:
             "picked_up" - Phone just picked up (trigger shame)
             "put_down" - Phone just put down (optional praise)
             None - No state change
         """
         # Use new tracking-enabled detection
-        detections = self.detect_phone_with_tracking(frame)
-        phone_in_frame = len(detections) > 0
+        detections = self.detect_phone_with_tracking(frame, timestamp)
+        best_confidence = max((d.confidence for d in detections), default=0.0)
 
         # Add to history
-        self.history.append(phone_in_frame)
-
-        # Update consecutive counters
-        if phone_in_frame:
-            self.consecutive_phone += 1
-            self.consecutive_no_phone = 0
-        else:
-            self.consecutive_no_phone += 1
-
-        # Check for phone pickup (quick to detect)
-        if self.consecutive_phone >= pickup_threshold and not self.phone_visible:
-            self.phone_visible = True
-            self.consecutive_no_phone = 0
-
-            # Check cooldown
-            now = time.time()
-            if now - self.last_reaction_time >= cooldown:
-                self.phone_count += 1
-                self.last_reaction_time = now
-                return "picked_up"
-
-        # Periodic reactions while STILL holding phone (like demo.js)
-        if self.phone_visible and phone_in_frame:
-            now = time.time()
-            if now - self.last_reaction_time >= cooldown:
-                self.phone_count += 1
-                self.last_reaction_time = now
-                return "picked_up"  # Shame again!
-
-        # Check for phone put down (slow to confirm - avoids flickering)
-        if self.consecutive_no_phone >= putdown_threshold and self.phone_visible:
-            self.phone_visible = False
-            self.consecutive_phone = 0
-            # Reset cooldown timer so next pickup can trigger immediately
-            self.last_reaction_time = 0
-            return "put_down"
-
-        return None
+        self.history.append(best_confidence > 0.0)
+
+        self.state.pickup_seconds = pickup_seconds
+        self.state.putdown_seconds = putdown_seconds
+        self.state.cooldown = cooldown
+        with self._count_lock:
+            return self.state.update(timestamp, best_confidence)
+
+    @property
+    def model_ran(self) -> bool:
+        """True if the last detection ran a model (not skipped by the motion gate or ROI tracker)."""
+        return self._model_ran
+
+    @property
+    def phone_visible(self) -> bool:
+        """True once a pickup is confirmed, until the put down is confirmed."""
+        return self.state.phone_visible
+
+    @property
+    def phone_count(self) -> int:
+        """Number of shame-worthy pickups."""
+        return self.state.phone_count
+
+    @phone_count.setter
+    def phone_count(self, value: int):
+        self.state.phone_count = value
+
+    @property
+    def last_reaction_time(self) -> Optional[float]:
+        """Timestamp of the last "picked_up" event (None after a put down)."""
+        return self.state.last_reaction_time
+
+    @property
+    def pickup_pending(self) -> bool:
+        """True while a phone has been seen but the pickup is not confirmed yet."""
+        return self.state.pickup_pending
 
     def get_stats(self) -> dict:
         """Get detection statistics."""
@@ -336,28 +617,55 @@ class PhoneDetector:
             "phone_visible": self.phone_visible,
             "history_size": len(self.history),
             "recent_detections": sum(self.history) if self.history else 0,
+            "motion_gate": self.motion_gate.get_stats() if self.motion_gate else None,
+            "roi_tracker": self.roi_tracker.get_stats() if self.roi_tracker else None,
+            "full_frame_runs": self.full_frame_runs,
+            "crop_runs": self.crop_runs,
+            "cascade": self.cascade.get_stats() if self.screen_model is not None else None,
+            "backend": self.backend_name,
         }
 
     def reset_count(self):
         """Reset daily count."""
-        self.phone_count = 0
+        self.state.phone_count = 0
+
+    def uncount_pickup(self):
+        """Take back a counted pickup whose reaction never ran (safe from any thread)."""
+        with self._count_lock:
+            if self.state.phone_count > 0:
+                self.state.phone_count -= 1
 
     def reset_tracking(self):
         """Reset tracking state (useful when stopping/starting monitoring)."""
-        self.phone_visible = False
-        self.consecutive_phone = 0
-        self.consecutive_no_phone = 0
+        self.state.reset()
         self.last_phone_box = None
         self.frames_without_detection = 0
-        self.last_reaction_time = 0
+        self.current_detections = []
+        self.last_detections = []
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+        if self.roi_tracker is not None:
+            self.roi_tracker.stop()
 
         # Reset ByteTrack tracker (clear track IDs)
         if self.yolo_model and hasattr(self.yolo_model, 'predictor'):
             try:
-                # This resets the tracker's internal state
-                self.yolo_model.predictor.trackers = []
+                # Reset the trackers in place: the registered track callbacks expect them to exist
+                for tracker in getattr(self.yolo_model.predictor, "trackers", None) or []:
+                    tracker.reset()
                 logger.debug("ByteTrack tracker reset")
             except Exception as e:
                 logger.debug(f"Tracker reset error (non-critical): {e}")
 
         logger.debug("Tracking state reset")
+
+    def reset(self):
+        """Start over as if newly created (tracking, count and all statistics); the model stays loaded."""
+        self.reset_tracking()
+        self.reset_count()
+        self.history.clear()
+        self.full_frame_runs = 0
+        self.crop_runs = 0
+        for component in (self.motion_gate, self.roi_tracker, self.cascade):
+            if component is not None:
+                component.reset_stats()
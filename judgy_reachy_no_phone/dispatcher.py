@@ -0,0 +1,135 @@
+"""Thread-safe hand-off of detection events to the robot control loop."""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ReactionEvent:
+    """A detection event stamped with the capture time of the frame that caused it."""
+
+    __slots__ = ("kind", "timestamp", "posted_at")
+
+    def __init__(self, kind: str, timestamp: float, posted_at: float):
+        self.kind = kind            # "picked_up" or "put_down"
+        self.timestamp = timestamp  # Capture time of the triggering frame
+        self.posted_at = posted_at
+
+
+class ReactionDispatcher:
+    """Queue between the inference worker and the reaction loop.
+
+    post() is called from the inference thread and wakes the reaction loop
+    at once. Pending events are coalesced: a put_down drops a picked_up that
+    has not been handled yet (the moment has passed), and a repeated event
+    replaces the pending one of the same kind. Events older than max_age
+    when they come up for handling are dropped as stale, and clear() drops
+    everything pending. Every event dropped without being handled (coalesced,
+    stale or cleared) is passed to on_dropped, outside the queue lock, so the
+    caller can undo bookkeeping done when it was posted.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for latency samples
+
+    def __init__(self, max_age: float = 10.0, on_dropped: Optional[Callable[[ReactionEvent], None]] = None):
+        self.max_age = max_age  # Seconds after capture an event is still worth reacting to
+        self.on_dropped = on_dropped
+
+        self._cond = threading.Condition()
+        self._queue = deque()
+
+        # Stats
+        self.events_posted = 0
+        self.events_handled = 0
+        self.events_coalesced = 0
+        self.events_stale = 0
+        self.latency = 0.0  # Smoothed capture-to-handling latency (seconds)
+
+    @property
+    def depth(self) -> int:
+        """Events waiting to be handled."""
+        return len(self._queue)
+
+    @property
+    def pending(self) -> bool:
+        """True while an event is waiting (interrupts idle animations)."""
+        return bool(self._queue)
+
+    def post(self, kind: str, timestamp: Optional[float] = None):
+        """Queue an event from any thread and wake the reaction loop."""
+        now = time.time()
+        event = ReactionEvent(kind, timestamp if timestamp is not None else now, now)
+        with self._cond:
+            superseded = [e for e in self._queue if e.kind == kind or (kind == "put_down" and e.kind == "picked_up")]
+            for old in superseded:
+                self._queue.remove(old)
+            self.events_coalesced += len(superseded)
+            self._queue.append(event)
+            self.events_posted += 1
+            self._cond.notify_all()
+
+        self._dropped(superseded)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ReactionEvent]:
+        """Next fresh event, waiting up to timeout seconds; None on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        stale = []
+        try:
+            with self._cond:
+                while True:
+                    while self._queue:
+                        event = self._queue.popleft()
+                        age = time.time() - event.timestamp
+                        if age > self.max_age:
+                            self.events_stale += 1
+                            stale.append(event)
+                            logger.debug(f"Dropping stale {event.kind} event ({age:.1f}s old)")
+                            continue
+                        self.events_handled += 1
+                        self._record_latency(age)
+                        return event
+
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+        finally:
+            self._dropped(stale)
+
+    def wait_pending(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds, returning True as soon as an event is waiting."""
+        with self._cond:
+            return bool(self._cond.wait_for(lambda: self._queue, timeout))
+
+    def clear(self):
+        """Drop all pending events (e.g. when monitoring stops)."""
+        with self._cond:
+            dropped = list(self._queue)
+            self._queue.clear()
+        self._dropped(dropped)
+
+    def _dropped(self, events: list):
+        if self.on_dropped is not None:
+            for event in events:
+                self.on_dropped(event)
+
+    def _record_latency(self, seconds: float):
+        if self.latency == 0.0:
+            self.latency = seconds
+        else:
+            self.latency += self.LATENCY_SMOOTHING * (seconds - self.latency)
+
+    def get_stats(self) -> dict:
+        """Get dispatcher statistics."""
+        return {
+            "depth": self.depth,
+            "posted": self.events_posted,
+            "handled": self.events_handled,
+            "coalesced": self.events_coalesced,
+            "stale": self.events_stale,
+            "latency_ms": round(self.latency * 1000, 1),
+        }
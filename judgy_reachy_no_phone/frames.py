@@ -0,0 +1,161 @@
+"""Preallocated ring of captured frames shared between threads."""
+
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FrameLease:
+    """Read-only view of one captured frame, pinned until released.
+
+    While a lease is held the ring never writes into its slot, so the frame
+    cannot change underneath the holder. Release it (or use it as a context
+    manager) as soon as the frame is no longer needed.
+    """
+
+    __slots__ = ("frame", "seq", "timestamp", "_ring", "_slot")
+
+    def __init__(self, ring: "FrameRing", slot: int, frame: np.ndarray, seq: int, timestamp: float):
+        self.frame = frame
+        self.seq = seq
+        self.timestamp = timestamp
+        self._ring = ring
+        self._slot = slot
+
+    def release(self):
+        """Unpin the slot (safe to call more than once)."""
+        if self._ring is not None:
+            self._ring._unpin(self._slot)
+            self._ring = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class FrameRing:
+    """Fixed set of frame buffers written round-robin by the capture thread.
+
+    The writer either fills a slot in place (write_buffer + commit, e.g.
+    VideoCapture.read(buffer)) or adopts an array the camera already
+    allocated (put), so steady-state capture allocates nothing. Each committed
+    frame gets a sequence number and capture timestamp. Readers borrow a
+    read-only view by sequence number; borrowing a frame that has already
+    been overwritten returns None instead of a torn frame. Pinned slots are
+    skipped by the writer; if every slot is pinned the ring grows by one.
+    """
+
+    def __init__(self, size: int = 8):
+        self._lock = threading.Lock()
+        self._buffers: List[Optional[np.ndarray]] = [None] * size
+        self._seqs = [0] * size          # Sequence number held by each slot (0 = empty)
+        self._timestamps = [0.0] * size
+        self._pins = [0] * size
+        self._write_slot: Optional[int] = None
+        self._next_slot = 0
+        self.seq = 0  # Sequence number of the latest committed frame
+
+        # Stats
+        self.frames_written = 0
+        self.borrow_misses = 0  # Borrows of frames that were already overwritten
+
+    def write_buffer(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Reserve the next free slot and return its buffer for in-place capture."""
+        with self._lock:
+            slot = self._reserve()
+            buffer = self._buffers[slot]
+            if buffer is not None and buffer.shape == tuple(shape) and buffer.dtype == dtype:
+                try:
+                    buffer.flags.writeable = True
+                    return buffer
+                except ValueError:
+                    pass  # Adopted array backed by read-only memory
+            buffer = self._buffers[slot] = np.empty(shape, dtype=dtype)
+            return buffer
+
+    def commit(self, timestamp: float, frame: Optional[np.ndarray] = None) -> int:
+        """Publish the reserved buffer as the newest frame; returns its sequence number.
+
+        Pass the array the capture call returned: if it is not the reserved
+        buffer (e.g. the camera changed resolution) it is adopted instead.
+        """
+        with self._lock:
+            slot = self._write_slot
+            if frame is not None and frame is not self._buffers[slot]:
+                self._buffers[slot] = frame
+            return self._publish(slot, timestamp)
+
+    def abort(self):
+        """Give back a reserved buffer after a failed capture."""
+        with self._lock:
+            self._write_slot = None
+
+    def put(self, frame: np.ndarray, timestamp: float) -> int:
+        """Adopt a freshly allocated frame without copying; returns its sequence number."""
+        with self._lock:
+            slot = self._reserve()
+            self._buffers[slot] = frame
+            return self._publish(slot, timestamp)
+
+    def borrow(self, seq: Optional[int] = None) -> Optional[FrameLease]:
+        """Pin a frame by sequence number (latest if None); None if gone or not written yet."""
+        with self._lock:
+            if seq is None:
+                seq = self.seq
+            if seq <= 0:
+                return None
+            for slot, slot_seq in enumerate(self._seqs):
+                if slot_seq == seq and slot != self._write_slot:
+                    self._pins[slot] += 1
+                    return FrameLease(self, slot, self._buffers[slot], seq, self._timestamps[slot])
+            self.borrow_misses += 1
+            return None
+
+    def _reserve(self) -> int:
+        """Pick the oldest unpinned slot for writing (lock held)."""
+        size = len(self._buffers)
+        for i in range(size):
+            slot = (self._next_slot + i) % size
+            if self._pins[slot] == 0 and slot != self._write_slot:
+                self._next_slot = (slot + 1) % size
+                break
+        else:
+            # Every slot is pinned by a consumer: grow rather than tear a frame
+            logger.warning(f"All {size} frame slots in use, growing ring")
+            self._buffers.append(None)
+            self._seqs.append(0)
+            self._timestamps.append(0.0)
+            self._pins.append(0)
+            slot = size
+
+        self._seqs[slot] = 0  # Invalidate before the buffer is overwritten
+        self._write_slot = slot
+        return slot
+
+    def _publish(self, slot: int, timestamp: float) -> int:
+        self._buffers[slot].flags.writeable = False
+        self.seq += 1
+        self._seqs[slot] = self.seq
+        self._timestamps[slot] = timestamp
+        self._write_slot = None
+        self.frames_written += 1
+        return self.seq
+
+    def _unpin(self, slot: int):
+        with self._lock:
+            self._pins[slot] -= 1
+
+    def get_stats(self) -> dict:
+        """Get ring statistics."""
+        return {
+            "slots": len(self._buffers),
+            "pinned": sum(1 for pins in self._pins if pins),
+            "frames_written": self.frames_written,
+            "borrow_misses": self.borrow_misses,
+        }
@@ -0,0 +1,127 @@
+"""Background inference worker for phone detection."""
+
+import time
+import threading
+import logging
+from typing import Optional, Callable, Any
+
+from .frames import FrameLease
+from .metrics import EVENTS, FRAMES_DROPPED
+
+logger = logging.getLogger(__name__)
+
+SUPERSEDED_DROPS = FRAMES_DROPPED.labels("superseded")
+
+
+class InferenceWorker:
+    """Run detection off the capture thread with a latest-frame-wins mailbox.
+
+    The capture loop calls submit() and never waits for the model. The mailbox
+    holds a single frame: submitting while a frame is still waiting replaces it
+    (and counts it as dropped), so the worker always picks up the newest frame.
+    Frames arrive as FrameLeases from the capture ring; the worker releases
+    each lease once the frame has been processed or dropped.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for frame age samples
+
+    def __init__(self, process: Callable[[Any, float], Optional[str]], on_event: Callable[[str, float], None]):
+        self.process = process    # Called as process(frame, timestamp) -> event or None
+        self.on_event = on_event  # Called as on_event(event, timestamp) for every non-None event
+
+        self._cond = threading.Condition()
+        self._pending = None  # FrameLease waiting to be processed
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.frames_submitted = 0
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.frame_age = 0.0       # Smoothed capture-to-inference age (seconds)
+        self.last_frame_age = 0.0
+
+    def start(self):
+        """Start the worker thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="inference-worker", daemon=True)
+        self._thread.start()
+        logger.info("Inference worker started")
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the worker thread and discard any pending frame."""
+        with self._cond:
+            self._running = False
+            self._drop_pending()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info("Inference worker stopped")
+
+    def submit(self, lease: FrameLease):
+        """Hand a frame lease to the worker, replacing any frame still waiting."""
+        with self._cond:
+            self._drop_pending()
+            self._pending = lease
+            self.frames_submitted += 1
+            self._cond.notify()
+
+    def clear(self):
+        """Discard the pending frame (e.g. when monitoring stops)."""
+        with self._cond:
+            self._drop_pending()
+
+    def _drop_pending(self):
+        if self._pending is not None:
+            self._pending.release()
+            self._pending = None
+            self.frames_dropped += 1
+            SUPERSEDED_DROPS.inc()
+
+    @property
+    def busy(self) -> bool:
+        """True while a frame is waiting in the mailbox."""
+        return self._pending is not None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                lease = self._pending
+                self._pending = None
+
+            self._record_age(time.time() - lease.timestamp)
+            try:
+                event = self.process(lease.frame, lease.timestamp)
+                if event:
+                    EVENTS.labels(event).inc()
+                    self.on_event(event, lease.timestamp)
+            except Exception as e:
+                logger.error(f"Detection error: {e}")
+            finally:
+                lease.release()
+                self.frames_processed += 1
+
+    def _record_age(self, age: float):
+        """Track how old frames are when inference starts on them."""
+        self.last_frame_age = age
+        if self.frame_age == 0.0:
+            self.frame_age = age
+        else:
+            self.frame_age += self.LATENCY_SMOOTHING * (age - self.frame_age)
+
+    def get_stats(self) -> dict:
+        """Get worker statistics."""
+        return {
+            "frames_submitted": self.frames_submitted,
+            "frames_processed": self.frames_processed,
+            "frames_dropped": self.frames_dropped,
+            "frame_age_ms": round(self.frame_age * 1000, 1),
+            "last_frame_age_ms": round(self.last_frame_age * 1000, 1),
+        }
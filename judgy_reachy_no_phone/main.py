@@ -5,20 +5,40 @@ A Reachy Mini app that detects when you pick up your phone
 and shames you with snarky comments.
 """
 
+import os
 import time
+import tempfile
 import threading
 import logging
 import asyncio
 import base64
-
-import cv2
+import functools
+from typing import Optional, Union
 
 from reachy_mini import ReachyMini, ReachyMiniApp
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
 from .config import Config, PERSONALITIES
 from .detection import PhoneDetector
+from .motion import MotionGate
+from .roi_tracker import RoiTracker
+from .cascade import CascadePolicy
+from .inference import InferenceWorker
+from .dispatcher import ReactionDispatcher
+from .scheduler import DetectionScheduler
+from .preview import PreviewHub
+from .frames import FrameRing
+from .sources import FrameSource, WebcamSource, RobotMediaSource, ReplaySource
+from .pipeline import CapturePipeline
+from .metrics import REGISTRY, ANIMATION_SECONDS, PLAYBACK_SECONDS
+from .tracing import TRACER
 from .audio import LLMResponder, TextToSpeech
+from .tts_cache import TTSCache
+from .warmup import TTSWarmup
+from .speculation import ReactionSpeculator
+from .reactions import ReactionWorker
+from .speech_stream import SpeechStream, StreamingPlayer
 from .animations import (
     play_sound_safe,
     get_animation_for_count,
@@ -51,13 +71,45 @@ class JudgyReachyNoPhone(ReachyMiniApp):
         # Components (pass loading callback to detector)
         self.detector = PhoneDetector(
             confidence=self.config.DETECTION_CONFIDENCE,
-            loading_callback=self._on_model_loading
+            loading_callback=self._on_model_loading,
+            motion_gate=MotionGate(
+                threshold=self.config.MOTION_THRESHOLD,
+                max_interval=self.config.MOTION_MAX_INTERVAL,
+                enabled=self.config.MOTION_GATE_ENABLED
+            ),
+            roi_tracker=RoiTracker(
+                confirm_interval=self.config.TRACK_CONFIRM_INTERVAL,
+                crop_margin=self.config.TRACK_CROP_MARGIN,
+                min_score=self.config.TRACK_MIN_SCORE
+            ) if self.config.TRACK_CROP_ENABLED else None,
+            cascade=CascadePolicy(
+                screen_weights=self.config.CASCADE_SCREEN_MODEL,
+                mode=self.config.CASCADE_MODE,
+                screen_ratio=self.config.CASCADE_SCREEN_RATIO
+            ) if self.config.CASCADE_ENABLED else None,
+            backend=self.config.INFERENCE_BACKEND,
+            precision=self.config.INFERENCE_PRECISION,
+            model_cache_dir=self.config.MODEL_CACHE_DIR,
+            calibration_dir=self.config.INT8_CALIBRATION_DIR,
+            imgsz=self.config.INFERENCE_SIZE
         )
         self.llm = LLMResponder(api_key=self.config.GROQ_API_KEY, personality="pure_reachy")
+        self.tts_cache = self._open_tts_cache()
+        # LLM, TTS and playback run as jobs on one long-lived event loop thread
+        self.reactions = ReactionWorker(max_workers=self.config.REACTION_WORKERS)
+        self.warmup = TTSWarmup(self.reactions, allow_elevenlabs=self.config.WARMUP_ELEVENLABS)
+        # Shame line + audio generated while a pickup is still being confirmed
+        self.speculator = (
+            ReactionSpeculator(self.reactions, claim_timeout=self.config.SPECULATION_TIMEOUT)
+            if self.config.SPECULATIVE_REACTIONS else None
+        )
+        self.speech_player: Optional[StreamingPlayer] = None  # Set in run() if the robot accepts pushed audio
+        self._speech_files = set()  # Temp audio files of reactions not performed yet
         # Don't pass config voice defaults - let personalities use their own defaults
         self.tts = TextToSpeech(
             elevenlabs_key=self.config.ELEVENLABS_API_KEY,
-            personality="pure_reachy"
+            personality="pure_reachy",
+            cache=self.tts_cache
         )
         # Load Reachy's emotion library for Pure Reachy mode
         try:
@@ -82,12 +134,78 @@ class JudgyReachyNoPhone(ReachyMiniApp):
         self.frozen_streak = 0  # Stores streak when monitoring is stopped
         self.frozen_phone_count = 0  # Store phone count when stopped
 
-        # Camera thread state
-        self.latest_frame = None
-        self.latest_frame_jpeg = None  # JPEG encoded frame for web display
-        self.camera_running = False
-        self.camera_fps = 0
-        self.detection_event_queue = []
+        # Camera thread state: captured frames live in a preallocated ring
+        self.frames = FrameRing(size=8)
+        self.capture: Optional[CapturePipeline] = None
+
+        # Annotated frames for the web UI, drawn and encoded only while viewed
+        self.preview = PreviewHub(
+            render=self.detector.draw_detections,
+            idle_timeout=self.config.PREVIEW_IDLE_TIMEOUT
+        )
+
+        # Detection rate adapts to inference latency and phone state
+        self.scheduler = DetectionScheduler(
+            cpu_budget=self.config.DETECTION_CPU_BUDGET,
+            dense_interval=self.config.DETECTION_DENSE_INTERVAL,
+            normal_interval=self.config.DETECTION_NORMAL_INTERVAL,
+            sparse_interval=self.config.DETECTION_SPARSE_INTERVAL,
+            idle_after=self.config.DETECTION_IDLE_AFTER
+        )
+
+        # Detection events reach the robot loop through a dispatcher (wakes it immediately)
+        self.dispatcher = ReactionDispatcher(on_dropped=self._on_event_dropped)
+
+        # Detection runs on its own thread so capture never waits for YOLO
+        self.inference_worker = InferenceWorker(
+            process=self._run_detection,
+            on_event=self.dispatcher.post
+        )
+
+        self._register_gauges()
+        TRACER.configure(enabled=self.config.TRACE_ENABLED, capacity=self.config.TRACE_CAPACITY)
+
+    def _on_event_dropped(self, event):
+        """A pickup dropped before its reaction ran was never shamed: take it back out of the count."""
+        if event.kind == "picked_up":
+            self.detector.uncount_pickup()
+
+    def _open_tts_cache(self) -> Optional[TTSCache]:
+        """Shared speech cache for every TextToSpeech instance (None if disabled or unusable)."""
+        if not self.config.TTS_CACHE_ENABLED:
+            return None
+        try:
+            return TTSCache(
+                cache_dir=self.config.TTS_CACHE_DIR,
+                max_bytes=self.config.TTS_CACHE_MAX_MB * 1024 * 1024
+            )
+        except OSError as e:
+            logger.warning(f"TTS cache unavailable ({e}), synthesizing every line")
+            return None
+
+    def _start_warmup(self, personality: str):
+        """Pre-synthesize the personality's prewritten lines in the background."""
+        if self.config.WARMUP_ENABLED:
+            self.warmup.start(self.tts, personality)
+
+    def _register_gauges(self):
+        """Expose queue depths and component state on /metrics (read at scrape time)."""
+        REGISTRY.gauge("judgy_reaction_queue_depth", "Detection events waiting for the robot",
+                       lambda: self.dispatcher.depth)
+        REGISTRY.gauge("judgy_inference_pending", "Frames waiting in the inference mailbox (0 or 1)",
+                       lambda: int(self.inference_worker.busy))
+        REGISTRY.gauge("judgy_frames_pinned", "Ring frames lent to inference or the preview",
+                       lambda: self.frames.get_stats()["pinned"])
+        REGISTRY.gauge("judgy_preview_viewers", "Connected video stream viewers",
+                       lambda: self.preview.get_stats()["viewers"])
+        REGISTRY.gauge("judgy_capture_fps", "Unique frames captured per second",
+                       lambda: self.capture.fps if self.capture else 0)
+        REGISTRY.gauge("judgy_monitoring", "1 while monitoring is on", lambda: int(self.is_monitoring))
+        REGISTRY.gauge("judgy_model_backend", "Inference backend in use", self._backend_info, label="backend")
+
+    def _backend_info(self) -> dict:
+        backend = self.detector.backend_name
+        return {backend: 1} if backend else {}
 
     def _on_model_loading(self, status: str, message: str):
         """Callback for model loading progress (like demo.js)."""
@@ -118,113 +236,62 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                 })
             return {"personalities": personalities_list}
 
-    def _camera_thread(self, webcam, stop_event: threading.Event):
-        """Fast camera capture and encoding thread (for laptop webcam in simulation)."""
-        fps_counter = 0
-        fps_start = time.time()
-        detection_skip = 0
-
-        logger.info("Laptop camera thread started (simulation mode)")
-
-        try:
-            while not stop_event.is_set() and self.camera_running:
-                ret, frame = webcam.read()
-                if not ret:
-                    time.sleep(0.01)
-                    continue
-
-                # Store frame for detection
-                self.latest_frame = frame.copy()
-
-                # Calculate FPS
-                fps_counter += 1
-                if time.time() - fps_start >= 1.0:
-                    self.camera_fps = fps_counter
-                    fps_counter = 0
-                    fps_start = time.time()
-
-                # Run detection every 3rd frame
-                if self.is_monitoring and (detection_skip % 3 == 0):
-                    try:
-                        event = self.detector.process_frame(
-                            frame,
-                            pickup_threshold=self.config.PICKUP_THRESHOLD,
-                            putdown_threshold=self.config.PUTDOWN_THRESHOLD,
-                            cooldown=self.config.COOLDOWN_SECONDS
-                        )
-                        # Store event for main thread to handle
-                        if event:
-                            self.detection_event_queue.append(event)
-                    except Exception as e:
-                        logger.error(f"Detection error: {e}")
-
-                detection_skip += 1
-
-                # Draw detection boxes only (no text overlays)
-                frame_with_boxes = self.detector.draw_detections(frame)
-
-                # Encode as JPEG for web display
-                _, buffer = cv2.imencode('.jpg', frame_with_boxes, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                self.latest_frame_jpeg = base64.b64encode(buffer).decode('utf-8')
-
-                time.sleep(0.01)  # ~100 FPS max
-
-        finally:
-            logger.info("Laptop camera thread stopped")
-
-    def _robot_camera_thread(self, reachy_mini: ReachyMini, stop_event: threading.Event):
-        """Camera thread using robot's media system (for real robot)."""
-        fps_counter = 0
-        fps_start = time.time()
-        detection_skip = 0
-
-        logger.info("Robot camera thread started")
-
-        try:
-            while not stop_event.is_set() and self.camera_running:
-                frame = reachy_mini.media.get_frame()
-                if frame is None:
-                    time.sleep(0.01)
-                    continue
-
-                # Store frame for detection
-                self.latest_frame = frame.copy()
-
-                # Calculate FPS
-                fps_counter += 1
-                if time.time() - fps_start >= 1.0:
-                    self.camera_fps = fps_counter
-                    fps_counter = 0
-                    fps_start = time.time()
-
-                # Run detection every 3rd frame
-                if self.is_monitoring and (detection_skip % 3 == 0):
-                    try:
-                        event = self.detector.process_frame(
-                            frame,
-                            pickup_threshold=self.config.PICKUP_THRESHOLD,
-                            putdown_threshold=self.config.PUTDOWN_THRESHOLD,
-                            cooldown=self.config.COOLDOWN_SECONDS
-                        )
-                        # Store event for main thread to handle
-                        if event:
-                            self.detection_event_queue.append(event)
-                    except Exception as e:
-                        logger.error(f"Detection error: {e}")
-
-                detection_skip += 1
-
-                # Draw detection boxes only (no text overlays)
-                frame_with_boxes = self.detector.draw_detections(frame)
-
-                # Encode as JPEG for web display
-                _, buffer = cv2.imencode('.jpg', frame_with_boxes, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                self.latest_frame_jpeg = base64.b64encode(buffer).decode('utf-8')
-
-                time.sleep(0.01)  # ~100 FPS max
-
-        finally:
-            logger.info("Robot camera thread stopped")
+    def _run_detection(self, frame, timestamp: float):
+        """Run detection on one frame (called from the inference worker thread)."""
+        if not self.is_monitoring:
+            return None
+        was_pending = self.detector.pickup_pending
+        event = self.detector.process_frame(
+            frame,
+            pickup_seconds=self.config.PICKUP_SECONDS,
+            putdown_seconds=self.config.PUTDOWN_SECONDS,
+            cooldown=self.config.COOLDOWN_SECONDS,
+            timestamp=timestamp
+        )
+        self.scheduler.record_latency(self.detector.last_inference_time, model_ran=self.detector.model_ran)
+
+        # First sighting after a phone-free period: get the shame ready while the pickup confirms
+        if event is None and not was_pending and self.detector.pickup_pending:
+            self._speculate()
+        return event
+
+    def _speculate(self):
+        """Start generating the next shame in the background (not needed for Pure Reachy)."""
+        if self.speculator is None or (self.llm.personality == "pure_reachy" and self.emotions):
+            return
+        self.speculator.prepare(self.detector.phone_count + 1, self.llm, self.tts)
+
+    def _detection_due(self) -> bool:
+        """Ask the scheduler whether the current frame should be detected."""
+        phone_active = self.detector.phone_visible or self.detector.pickup_pending
+        return self.scheduler.should_run(time.time(), phone_active)
+
+    def _dispatch_frame(self, seq: int):
+        """Lend a captured frame to inference (when due) and the preview (when watched)."""
+        # Hand frame to the inference worker when due (never blocks)
+        if self.is_monitoring and self._detection_due():
+            self.inference_worker.submit(self.frames.borrow(seq))
+
+        # Boxes are drawn and the JPEG encoded only when a viewer asks for it
+        if self.preview.active:
+            self.preview.publish(self.frames.borrow(seq))
+
+    def _select_source(self, reachy_mini: ReachyMini) -> FrameSource:
+        """Recording if configured, laptop webcam in simulation, robot camera otherwise."""
+        if self.config.REPLAY_SOURCE:
+            logger.info(f"Replaying recording {self.config.REPLAY_SOURCE}...")
+            return ReplaySource(self.config.REPLAY_SOURCE, realtime=self.config.REPLAY_REALTIME, loop=True)
+        if reachy_mini.client.get_status().simulation_enabled:
+            logger.info("Simulation mode detected - using laptop webcam...")
+            return WebcamSource(
+                0,
+                low_latency=self.config.CAMERA_LOW_LATENCY,
+                width=self.config.CAMERA_WIDTH,
+                height=self.config.CAMERA_HEIGHT,
+                fps=self.config.CAMERA_FPS
+            )
+        logger.info("Real robot detected - using robot camera...")
+        return RobotMediaSource(reachy_mini.media)
 
     def run(self, reachy_mini: ReachyMini, stop_event: threading.Event):
         """Main loop."""
@@ -240,101 +307,79 @@ class JudgyReachyNoPhone(ReachyMiniApp):
         # Initialize detector (reports loading progress)
         logger.info("Initializing YOLO model...")
         self.detector.initialize()
+        self.inference_worker.start()
+        self.reactions.start()
+
+        # Speak TTS while it downloads when the robot accepts pushed audio samples
+        if self.config.TTS_STREAMING:
+            if StreamingPlayer.supported(reachy_mini.media):
+                self.speech_player = StreamingPlayer(
+                    reachy_mini.media,
+                    jitter_buffer_ms=self.config.TTS_JITTER_BUFFER_MS
+                )
+            else:
+                logger.info("Streaming TTS unavailable (needs push_audio_sample and ffmpeg), playing audio files")
 
-        # Auto-detect: Use laptop webcam in simulation, robot camera otherwise
-        is_simulation = reachy_mini.client.get_status().simulation_enabled
-        webcam = None
+        # Open the frame source and start the capture loop
+        source = self._select_source(reachy_mini)
+        self.camera_loading_status = "connecting"
+        self.camera_loading_message = f"Opening {source.description.lower()}..."
 
-        if is_simulation:
-            logger.info("Simulation mode detected - using laptop webcam...")
-            self.camera_loading_status = "connecting"
-            self.camera_loading_message = "Opening laptop webcam..."
-
-            webcam = cv2.VideoCapture(0)
-            if not webcam.isOpened():
-                logger.error("Failed to open laptop webcam!")
-                self.camera_loading_status = "error"
-                self.camera_loading_message = "Failed to open webcam"
-                webcam = None
-            else:
-                logger.info("Laptop webcam opened successfully!")
-                self.camera_loading_status = "ready"
-                self.camera_loading_message = "Camera connected"
-                self.camera_running = True
-
-                # Start fast camera thread
-                camera_thread = threading.Thread(
-                    target=self._camera_thread,
-                    args=(webcam, stop_event),
-                    daemon=True
-                )
-                camera_thread.start()
+        if not source.open():
+            logger.error(f"Failed to open {source.description.lower()}!")
+            self.camera_loading_status = "error"
+            self.camera_loading_message = f"Failed to open {source.description.lower()}"
         else:
-            logger.info("Real robot detected - using robot camera...")
-            self.camera_loading_status = "connecting"
-            self.camera_loading_message = "Connecting to robot camera..."
-
-            self.camera_running = True
+            logger.info(f"{source.description} opened successfully!")
             self.camera_loading_status = "ready"
             self.camera_loading_message = "Camera connected"
+            self.capture = CapturePipeline(source, self.frames, on_frame=self._dispatch_frame)
+            self.capture.start(stop_event)
 
-            # Start camera thread with robot's media system
-            camera_thread = threading.Thread(
-                target=self._robot_camera_thread,
-                args=(reachy_mini, stop_event),
-                daemon=True
-            )
-            camera_thread.start()
-
-        # Detection and robot control loop (separate from camera display)
-        breath_counter = 0
+        # Robot control loop: wakes as soon as the dispatcher has an event
         BREATH_INTERVAL = 8
-        last_tick = time.time()
+        last_breath = time.time()
 
         try:
             while not stop_event.is_set():
-                current_time = time.time()
-                delta = current_time - last_tick
-                last_tick = current_time
-
-                # Process detection events from camera thread
-                while self.detection_event_queue:
-                    event = self.detection_event_queue.pop(0)
+                # Wait for an event, at most until the next idle breath is due
+                timeout = min(0.5, max(0.0, last_breath + BREATH_INTERVAL - time.time()))
+                event = self.dispatcher.get(timeout=timeout)
+                if event is not None:
                     try:
-                        if event == "picked_up":
+                        if event.kind == "picked_up":
                             self._handle_phone_pickup(reachy_mini)
-                        elif event == "put_down" and self.praise_enabled:
-                            self._handle_phone_putdown(reachy_mini)
+                        elif event.kind == "put_down":
+                            self._cancel_waiting_shames()
+                            if self.praise_enabled:
+                                self._handle_phone_putdown(reachy_mini)
                     except Exception as e:
                         logger.error(f"Event handling error: {e}")
+                    continue
 
                 # Idle breathing when not reacting - only if no pending events
-                breath_counter += delta
-                if breath_counter >= BREATH_INTERVAL:
-                    breath_counter = 0
-                    # Only do idle breathing if no events pending (to avoid blocking)
-                    if self.is_monitoring and not self.detector.phone_visible and len(self.detection_event_queue) == 0:
+                if time.time() - last_breath >= BREATH_INTERVAL:
+                    last_breath = time.time()
+                    if (self.is_monitoring and not self.detector.phone_visible
+                            and not self.dispatcher.pending and not self.reactions.busy):
                         try:
-                            # Pass callback to check for events during breathing
-                            idle_breathing(reachy_mini, should_stop=lambda: len(self.detection_event_queue) > 0)
+                            # Interrupted by the same wakeup that delivers events
+                            idle_breathing(reachy_mini, wait_for_stop=self.dispatcher.wait_pending)
                         except:
                             pass
 
-                # Faster loop for responsive event processing
-                time.sleep(0.05)  # 20 FPS = 50ms max delay
-
         finally:
-            # Stop camera thread
-            self.camera_running = False
-            if webcam is not None:
-                webcam.release()
-                logger.info("Webcam released")
+            # Stop camera and inference threads
+            if self.capture is not None:
+                self.capture.stop()
+            self.inference_worker.stop()
+            self.reactions.stop()
 
         # Cleanup
         self.is_monitoring = False
 
     def _handle_phone_pickup(self, reachy: ReachyMini):
-        """Handle phone pickup event."""
+        """Handle phone pickup event (the reaction runs on the reaction worker)."""
         count = self.detector.phone_count
         self.total_shames += 1
 
@@ -357,35 +402,27 @@ class JudgyReachyNoPhone(ReachyMiniApp):
             emotion = self.emotions.get(emotion_name)
             logger.info(f"Pure Reachy shame: {emotion_name}")
 
-            # Play emotion (includes sound + animation automatically)
-            reachy.play_move(emotion)
+            self.reactions.react(functools.partial(self._play_emotion, reachy, emotion), kind="picked_up")
         else:
-            # Normal mode: Get snarky response via TTS
-            text = self.llm.get_response(count)
-            logger.info(f"Response: {text}")
-
-            # Generate and play audio
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                audio_path = loop.run_until_complete(self.tts.synthesize(text))
-                loop.close()
-
-                # Play audio
-                reachy.media.play_sound(audio_path)
+            # Normal mode: Get snarky response via TTS, then speak and animate
+            self.reactions.react(
+                functools.partial(self._perform_shame, reachy, count),
+                prepare=self._prepare_shame(count, self.llm, self.tts),
+                kind="picked_up",
+                on_cancel=self._discard_speech
+            )
 
-                # Animate based on offense count
-                animation = get_animation_for_count(count)
-                animation(reachy)
-
-            except Exception as e:
-                logger.error(f"Shame response error: {e}")
-                # Fallback: just animate
-                play_sound_safe(reachy, "confused1.wav")
-                disappointed_shake(reachy)
+    def _cancel_waiting_shames(self):
+        """Drop shames not performed yet once the phone is down (like a coalesced pickup)."""
+        cancelled = self.reactions.cancel_waiting("picked_up")
+        if cancelled:
+            logger.info(f"Phone put down before {cancelled} shame(s) played, dropping them")
+            self.total_shames -= cancelled
+            for _ in range(cancelled):
+                self.detector.uncount_pickup()
 
     def _handle_phone_putdown(self, reachy: ReachyMini):
-        """Handle phone put down event."""
+        """Handle phone put down event (the reaction runs on the reaction worker)."""
         logger.info("Phone put down!")
 
         # Start new streak
@@ -401,27 +438,128 @@ class JudgyReachyNoPhone(ReachyMiniApp):
             emotion = self.emotions.get(emotion_name)
             logger.info(f"Pure Reachy praise: {emotion_name}")
 
-            # Play emotion (includes sound + animation automatically)
-            reachy.play_move(emotion)
+            self.reactions.react(functools.partial(self._play_emotion, reachy, emotion))
         else:
             # Normal mode: Get praise via TTS
-            text = self.llm.get_praise()
-            logger.info(f"Praise: {text}")
+            self.reactions.react(
+                functools.partial(self._perform_praise, reachy),
+                prepare=self._prepare_praise(self.llm, self.tts)
+            )
 
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                audio_path = loop.run_until_complete(self.tts.synthesize(text))
-                loop.close()
+    @TRACER.traced("prepare_shame", "reaction")
+    async def _prepare_shame(self, count: int, llm: LLMResponder, tts: TextToSpeech) -> Optional[Union[str, SpeechStream]]:
+        """Shame line and its audio (None on failure); runs on the reaction worker."""
+        try:
+            # Already generated if speculation hit
+            prepared = await self.speculator.claim(count, llm, tts) if self.speculator else None
+            if prepared:
+                text, audio_path = prepared
+                logger.info(f"Response: {text} (prepared)")
+                return audio_path
+
+            text = await self.reactions.call(llm.get_response, count)
+            logger.info(f"Response: {text}")
+            return await self._prepare_speech(tts, text)
+        except Exception as e:
+            logger.error(f"Shame response error: {e}")
+            return None
 
-                reachy.media.play_sound(audio_path)
+    @TRACER.traced("perform_shame", "reaction")
+    def _perform_shame(self, reachy: ReachyMini, count: int, speech: Optional[Union[str, SpeechStream]]):
+        """Speak the shame and animate based on offense count."""
+        try:
+            if speech is None:
+                raise RuntimeError("no audio")
 
-                approving_nod(reachy)
+            # Play audio
+            self._speak(reachy, speech)
 
-            except Exception as e:
-                logger.debug(f"Praise error: {e}")
+            # Animate based on offense count
+            animation = get_animation_for_count(count)
+            with ANIMATION_SECONDS.time():
+                animation(reachy)
+
+        except Exception as e:
+            logger.error(f"Shame response error: {e}")
+            # Fallback: just animate
+            play_sound_safe(reachy, "confused1.wav")
+            disappointed_shake(reachy)
+
+        finally:
+            # The player opened the file long before the animation ended
+            self._discard_speech(speech)
+
+    @TRACER.traced("prepare_praise", "reaction")
+    async def _prepare_praise(self, llm: LLMResponder, tts: TextToSpeech) -> Optional[Union[str, SpeechStream]]:
+        """Praise line and its audio (None on failure); runs on the reaction worker."""
+        try:
+            text = await self.reactions.call(llm.get_praise)
+            logger.info(f"Praise: {text}")
+            return await self._prepare_speech(tts, text)
+        except Exception as e:
+            logger.debug(f"Praise error: {e}")
+            return None
+
+    @TRACER.traced("perform_praise", "reaction")
+    def _perform_praise(self, reachy: ReachyMini, speech: Optional[Union[str, SpeechStream]]):
+        """Speak the praise and nod."""
+        try:
+            if speech is not None:
+                self._speak(reachy, speech)
+
+            with ANIMATION_SECONDS.time():
                 approving_nod(reachy)
 
+        except Exception as e:
+            logger.debug(f"Praise error: {e}")
+            approving_nod(reachy)
+
+        finally:
+            self._discard_speech(speech)
+
+    async def _prepare_speech(self, tts: TextToSpeech, text: str) -> Union[str, SpeechStream]:
+        """Audio for text: a SpeechStream when streaming playback is on, else a file path."""
+        # A file of its own: the next reaction prepares while this one waits to perform
+        fd, output_path = tempfile.mkstemp(prefix="judgy_reachy_tts_", suffix=".mp3")
+        os.close(fd)
+        self._speech_files.add(output_path)
+        try:
+            if self.speech_player is not None:
+                speech = await tts.open_stream(text, output_path)
+            else:
+                speech = await tts.synthesize(text, output_path)
+        except Exception:
+            self._discard_speech(output_path)
+            raise
+
+        if isinstance(speech, str) and speech != output_path:
+            self._discard_speech(output_path)  # Cached clip: the temp file was never written
+        return speech
+
+    def _discard_speech(self, speech: Optional[Union[str, SpeechStream]]):
+        """Delete a reaction's own temp audio file (cached clips are left alone)."""
+        path = speech.output_path if isinstance(speech, SpeechStream) else speech
+        if path in self._speech_files:
+            self._speech_files.discard(path)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _speak(self, reachy: ReachyMini, speech: Union[str, SpeechStream]):
+        """Play prepared speech: an audio file, or a stream pushed to the speaker as it decodes."""
+        with PLAYBACK_SECONDS.time(), TRACER.span("play_sound", "audio"):
+            if isinstance(speech, SpeechStream):
+                speech = self.reactions.run(self.speech_player.play(speech))
+                if speech is None:
+                    return
+            reachy.media.play_sound(speech)
+
+    def _play_emotion(self, reachy: ReachyMini, emotion):
+        """Play a recorded emotion (includes sound + animation automatically)."""
+        with ANIMATION_SECONDS.time(), TRACER.span("play_move", "animation"):
+            reachy.play_move(emotion)
+
     def _run_ui(self, reachy_mini: ReachyMini, stop_event: threading.Event):
         """Setup FastAPI routes for the UI."""
 
@@ -444,6 +582,7 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                 "model_message": self.model_loading_message,
                 "camera_status": self.camera_loading_status,
                 "camera_message": self.camera_loading_message,
+                **self.warmup.get_status(),
                 "overall_ready": (
                     self.model_loading_status == "ready" and
                     self.camera_loading_status == "ready"
@@ -453,10 +592,50 @@ class JudgyReachyNoPhone(ReachyMiniApp):
         # API endpoint: Get video frame
         @self.settings_app.get("/api/video-frame")
         def get_video_frame():
-            if self.latest_frame_jpeg:
-                return {"frame": self.latest_frame_jpeg, "fps": self.camera_fps}
+            self.preview.request_frame()
+            _, jpeg = self.preview.jpeg()
+            if jpeg:
+                return {"frame": base64.b64encode(jpeg).decode('utf-8'), "fps": self.capture.fps if self.capture else 0}
             return {"frame": None, "fps": 0}
 
+        # API endpoint: MJPEG stream (multipart/x-mixed-replace), optionally downscaled/throttled
+        @self.settings_app.get("/api/video-stream")
+        def video_stream(width: int = 0, fps: float = 0):
+            min_interval = 1.0 / fps if fps > 0 else 0.0
+            STREAM_KEEPALIVE = 2.0  # Seconds without a new frame before the last one is resent
+
+            def part(jpeg: bytes) -> bytes:
+                return (
+                    b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+                    + str(len(jpeg)).encode() + b"\r\n\r\n" + jpeg + b"\r\n"
+                )
+
+            def frames():
+                last_seq = 0
+                last_part = part(b"")
+                sent_at = time.time()
+                with self.preview.viewer():
+                    while not stop_event.is_set():
+                        if self.preview.wait_for_frame(last_seq) == last_seq:
+                            # No new frame (capture stopped?): resend the last one (empty before the first),
+                            # since only a write notices that the client has gone away
+                            if time.time() - sent_at >= STREAM_KEEPALIVE:
+                                sent_at = time.time()
+                                yield last_part
+                            continue
+                        last_seq, jpeg = self.preview.jpeg(width)
+                        if jpeg is None:
+                            continue
+                        sent_at = time.time()
+                        last_part = part(jpeg)
+                        yield last_part
+                        if min_interval:
+                            delay = sent_at + min_interval - time.time()
+                            if delay > 0:
+                                time.sleep(delay)
+
+            return StreamingResponse(frames(), media_type="multipart/x-mixed-replace; boundary=frame")
+
         # API endpoint: Get status
         @self.settings_app.get("/api/status")
         def get_status():
@@ -492,6 +671,8 @@ class JudgyReachyNoPhone(ReachyMiniApp):
             else:
                 button_text = "▶️ Start Monitoring"
 
+            scheduler_stats = self.scheduler.get_stats()
+
             return {
                 "status_text": status_text,
                 "phone_count": stats['phone_count'],
@@ -501,9 +682,40 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                 "mode": mode_text,
                 "is_monitoring": self.is_monitoring,
                 "button_text": button_text,
-                "has_previous_session": self.has_previous_session
+                "has_previous_session": self.has_previous_session,
+                "inference": self.inference_worker.get_stats(),
+                "scheduler": scheduler_stats,
+                "detection_rate": scheduler_stats["detection_rate"],
+                "model_rate": scheduler_stats["model_rate"],
+                "motion_gate": stats["motion_gate"],
+                "cascade": stats["cascade"],
+                "backend": stats["backend"],
+                "camera_active": self.capture is not None and self.capture.running,
+                "preview": self.preview.get_stats(),
+                "frames": self.frames.get_stats(),
+                "capture": self.capture.get_stats() if self.capture else None,
+                "reactions": self.dispatcher.get_stats(),
+                "trace": TRACER.get_stats(),
+                "speculation": self.speculator.get_stats() if self.speculator else None,
+                "reaction_worker": self.reactions.get_stats(),
+                "speech_stream": self.speech_player.get_stats() if self.speech_player else None,
+                "tts_cache": self.tts_cache.get_stats() if self.tts_cache else None,
+                "frame_age_ms": round(self.inference_worker.frame_age * 1000, 1)
             }
 
+        # API endpoint: Prometheus text exposition
+        @self.settings_app.get("/metrics")
+        def metrics():
+            return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+        # API endpoint: Chrome trace-event JSON of recorded spans (TRACE_ENABLED)
+        @self.settings_app.get("/api/trace")
+        def get_trace(clear: bool = False):
+            trace = TRACER.export()
+            if clear:
+                TRACER.clear()
+            return trace
+
         # API endpoint: Toggle monitoring
         @self.settings_app.post("/api/toggle")
         def toggle_monitoring(req: ToggleRequest):
@@ -514,9 +726,13 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                 else:
                     self.frozen_streak = 0
 
+                self.is_monitoring = False
+                self.inference_worker.clear()
+                self.dispatcher.clear()  # Uncounts pickups that were never shamed
                 self.frozen_phone_count = self.detector.phone_count
                 self.has_previous_session = True
-                self.is_monitoring = False
+                if self.speculator is not None:
+                    self.speculator.clear()
 
                 # Return appropriate button text based on whether there's data
                 button_text = "▶️ Continue Monitoring" if self.has_previous_session else "▶️ Start Monitoring"
@@ -538,18 +754,22 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                         elevenlabs_key=req.eleven_key,
                         voice=req.edge_voice,  # Pass empty string if not set, let personality defaults handle it
                         eleven_voice_id=req.eleven_voice,
-                        personality=req.personality
+                        personality=req.personality,
+                        cache=self.tts_cache
                     )
                 else:
                     logger.info(f"No ElevenLabs key provided, using Edge TTS")
                     self.tts = TextToSpeech(
                         voice=req.edge_voice,  # Pass empty string if not set, let personality defaults handle it
-                        personality=req.personality
+                        personality=req.personality,
+                        cache=self.tts_cache
                     )
 
                 self.config.COOLDOWN_SECONDS = req.cooldown
                 self.praise_enabled = req.praise
+                self._start_warmup(req.personality)
 
+                self.scheduler.reset()
                 self.is_monitoring = True
                 self.session_start = time.time()
 
@@ -700,12 +920,14 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                     elevenlabs_key=req.eleven_key,
                     voice=req.edge_voice,
                     eleven_voice_id=req.eleven_voice,
-                    personality=req.personality
+                    personality=req.personality,
+                    cache=self.tts_cache
                 )
             else:
                 self.tts = TextToSpeech(
                     voice=req.edge_voice,
-                    personality=req.personality
+                    personality=req.personality,
+                    cache=self.tts_cache
                 )
 
             # Run test without starting monitoring
@@ -722,26 +944,20 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                 emotion = self.emotions.get(emotion_name)
                 logger.info(f"Pure Reachy test: {emotion_name}")
 
-                reachy_mini.play_move(emotion)
+                reaction = self.reactions.react(functools.partial(self._play_emotion, reachy_mini, emotion))
             else:
-                # Normal mode: Get response via TTS
-                text = self.llm.get_response(self.detector.phone_count)
-                logger.info(f"Test response: {text}")
+                # Normal mode: Get response via TTS, then play audio and animate
+                count = self.detector.phone_count
+                reaction = self.reactions.react(
+                    functools.partial(self._perform_shame, reachy_mini, count),
+                    prepare=self._prepare_shame(count, self.llm, self.tts)
+                )
 
-                # Play audio and animate
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    audio_path = loop.run_until_complete(self.tts.synthesize(text))
-                    loop.close()
-
-                    reachy_mini.media.play_sound(audio_path)
-                    animation = get_animation_for_count(self.detector.phone_count)
-                    animation(reachy_mini)
-                except Exception as e:
-                    logger.error(f"Test error: {e}")
-                    play_sound_safe(reachy_mini, "confused1.wav")
-                    disappointed_shake(reachy_mini)
+            # Respond once the robot has finished (queued behind any live reaction)
+            try:
+                reaction.result()
+            except Exception as e:
+                logger.error(f"Test error: {e}")
 
             return {"success": True}
 
@@ -763,15 +979,18 @@ class JudgyReachyNoPhone(ReachyMiniApp):
                     elevenlabs_key=req.eleven_key,
                     voice=req.edge_voice,
                     eleven_voice_id=req.eleven_voice,
-                    personality=req.personality
+                    personality=req.personality,
+                    cache=self.tts_cache
                 )
                 logger.info(f"Updated TTS: personality={req.personality}, ElevenLabs enabled")
             else:
                 self.tts = TextToSpeech(
                     voice=req.edge_voice,
-                    personality=req.personality
+                    personality=req.personality,
+                    cache=self.tts_cache
                 )
                 logger.info(f"Updated TTS: personality={req.personality}, Edge TTS only")
+            self._start_warmup(req.personality)
 
             # Update other settings
             self.config.COOLDOWN_SECONDS = req.cooldown
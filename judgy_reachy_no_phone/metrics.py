@@ -0,0 +1,234 @@
+"""Minimal Prometheus-style metrics (text exposition format, no dependencies)."""
+
+import time
+import asyncio
+import functools
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Sequence, Tuple
+
+# Latency buckets (seconds): sub-millisecond hot-path stages up to multi-second LLM/TTS calls
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _HistogramChild:
+    """One labelled histogram series. Buckets are preallocated; observe() allocates nothing."""
+
+    __slots__ = ("bounds", "counts", "sum", "count", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self):
+        """Observe the duration of a block (for slow paths; hot paths call observe())."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def timed(self, fn):
+        """Decorator observing each call of a function or coroutine function."""
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                with self.time():
+                    return await fn(*args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.time():
+                    return fn(*args, **kwargs)
+        return wrapper
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _Metric:
+    """A metric family with an optional single label."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, label: str = ""):
+        self.name = name
+        self.help = help
+        self.label = label
+        self._children: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        if not label:
+            self._default = self.labels("")
+
+    def labels(self, value: str):
+        """Series for one label value (look it up once and keep it on hot paths)."""
+        child = self._children.get(value)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(value, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _series_labels(self, value: str) -> Dict[str, str]:
+        return {self.label: value} if self.label else {}
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for value, child in sorted(self._children.items()):
+            lines.extend(self._render_child(self._series_labels(value), child))
+        return "\n".join(lines)
+
+    def _render_child(self, labels: Dict[str, str], child) -> list:
+        raise NotImplementedError
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, label: str = "", buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, label)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def _render_child(self, labels, child) -> list:
+        with child._lock:
+            counts = list(child.counts)
+            total, count = child.sum, child.count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': le})} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def _render_child(self, labels, child) -> list:
+        return [f"{self.name}_total{_format_labels(labels)} {child.value}"]
+
+
+class Gauge:
+    """Value read from a callback at scrape time, so it costs nothing on the hot path.
+
+    The callback returns a number, or a dict of label value -> number for a
+    labelled gauge.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, fn: Callable[[], object], label: str = ""):
+        self.name = name
+        self.help = help
+        self.fn = fn
+        self.label = label
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        try:
+            value = self.fn()
+        except Exception:
+            value = None
+        if isinstance(value, dict):
+            for label_value, number in sorted(value.items()):
+                lines.append(f"{self.name}{_format_labels({self.label: label_value})} {float(number)}")
+        elif value is not None:
+            lines.append(f"{self.name} {float(value)}")
+        return "\n".join(lines)
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        """Add (or replace) a metric by name and return it."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def gauge(self, name: str, help: str, fn: Callable[[], object], label: str = "") -> Gauge:
+        return self.register(Gauge(name, help, fn, label))
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Pipeline stage latency, one series per stage
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "judgy_stage_duration_seconds", "Time spent in each pipeline stage", label="stage"
+))
+CAPTURE_SECONDS = STAGE_SECONDS.labels("capture")
+INFERENCE_SECONDS = STAGE_SECONDS.labels("inference")
+PARSE_SECONDS = STAGE_SECONDS.labels("parse")
+DRAW_SECONDS = STAGE_SECONDS.labels("draw")
+ENCODE_SECONDS = STAGE_SECONDS.labels("encode")
+LLM_SECONDS = STAGE_SECONDS.labels("llm")
+TTS_SECONDS = STAGE_SECONDS.labels("tts")
+PLAYBACK_SECONDS = STAGE_SECONDS.labels("playback")
+ANIMATION_SECONDS = STAGE_SECONDS.labels("animation")
+
+FRAMES_CAPTURED = REGISTRY.register(Counter("judgy_frames_captured", "Unique frames captured"))
+FRAMES_DROPPED = REGISTRY.register(Counter(
+    "judgy_frames_dropped", "Frames not processed, by reason", label="reason"
+))
+INFERENCE_RUNS = REGISTRY.register(Counter("judgy_inference_runs", "Detection passes that ran a model"))
+INFERENCE_SKIPPED = REGISTRY.register(Counter(
+    "judgy_inference_skipped", "Detection passes answered without a model (motion gate, ROI tracker)"
+))
+DETECTIONS = REGISTRY.register(Counter("judgy_detections", "Phone boxes detected"))
+EVENTS = REGISTRY.register(Counter("judgy_events", "Pickup/putdown events", label="event"))
@@ -0,0 +1,105 @@
+"""Cheap frame-difference gate in front of the detector."""
+
+import logging
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class MotionGate:
+    """Skip inference when the scene has not changed since the last run.
+
+    Each frame is shrunk to a tiny grayscale thumbnail and compared with the
+    thumbnail of the frame that last went through the model. If the fraction
+    of thumbnail pixels that changed by more than PIXEL_DELTA stays under the
+    threshold, the previous detection result can be reused. Counting changed
+    pixels (rather than averaging the difference) keeps small objects such as
+    a phone entering the frame from being diluted by the static background.
+    A refresh is forced every max_interval seconds so slow drift or a stuck
+    result can never hide a phone for long.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for model latency samples
+    PIXEL_DELTA = 20         # Per-pixel gray level change that counts as "changed"
+
+    def __init__(
+        self,
+        threshold: float = 0.005,
+        max_interval: float = 2.0,
+        size: Tuple[int, int] = (64, 48),
+        enabled: bool = True
+    ):
+        self.threshold = threshold        # Fraction of changed pixels that counts as motion
+        self.max_interval = max_interval  # Force inference at least this often (seconds)
+        self.size = size                  # Thumbnail (width, height)
+        self.enabled = enabled
+
+        # Reused thumbnail buffers
+        self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self._gray = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._reference = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._diff = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._has_reference = False
+        self.last_refresh: Optional[float] = None
+
+        # Stats
+        self.checks = 0
+        self.hits = 0
+        self.last_score = 0.0
+        self.model_latency = 0.0  # Smoothed latency of real inference (seconds)
+
+    def should_infer(self, frame: np.ndarray, timestamp: float) -> bool:
+        """Return False if the last result can be reused for this frame."""
+        if not self.enabled:
+            return True
+
+        self.checks += 1
+        cv2.resize(frame, self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if self._has_reference and timestamp - self.last_refresh < self.max_interval:
+            cv2.absdiff(self._gray, self._reference, dst=self._diff)
+            cv2.threshold(self._diff, self.PIXEL_DELTA, 1, cv2.THRESH_BINARY, dst=self._diff)
+            self.last_score = cv2.countNonZero(self._diff) / self._diff.size
+            if self.last_score < self.threshold:
+                self.hits += 1
+                return False
+
+        # Scene changed (or refresh due): this frame becomes the new reference
+        self._reference[...] = self._gray
+        self._has_reference = True
+        self.last_refresh = timestamp
+        return True
+
+    def record_inference(self, seconds: float):
+        """Feed back the latency of a real model run (for saved-time stats)."""
+        if self.model_latency == 0.0:
+            self.model_latency = seconds
+        else:
+            self.model_latency += self.LATENCY_SMOOTHING * (seconds - self.model_latency)
+
+    def reset(self):
+        """Drop the reference so the next frame always runs the model."""
+        self._has_reference = False
+        self.last_refresh = None
+
+    def reset_stats(self):
+        """Zero the statistics (e.g. between benchmark recordings)."""
+        self.checks = 0
+        self.hits = 0
+        self.last_score = 0.0
+        self.model_latency = 0.0
+
+    def get_stats(self) -> dict:
+        """Get gate statistics."""
+        return {
+            "enabled": self.enabled,
+            "hit_rate": round(self.hits / self.checks, 3) if self.checks else 0.0,
+            "hits": self.hits,
+            "checks": self.checks,
+            "saved_seconds": round(self.hits * self.model_latency, 2),
+            "last_score": round(self.last_score, 4),
+        }
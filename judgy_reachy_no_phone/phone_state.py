@@ -0,0 +1,125 @@
+"""Pickup/putdown state machine driven by frame timestamps."""
+
+import time
+from typing import Optional, Callable
+
+
+class PhoneStateMachine:
+    """Time-based hysteresis for phone pickup and put-down.
+
+    Thresholds are in seconds, so changing the camera fps or detection rate
+    does not change how long a pickup or put-down takes to confirm.
+
+    Pickup evidence accumulates while a phone is seen: each observation adds
+    the time since the previous one, weighted by confidence (capped at 1.0 for
+    confidence >= reference_confidence). Evidence decays at the same rate
+    while no phone is seen. Put-down is confirmed once no phone has been seen
+    for putdown_seconds.
+
+    The machine does no I/O and reads no clock unless update() is called
+    without a timestamp, so it can be driven with synthetic timestamps.
+    """
+
+    def __init__(
+        self,
+        pickup_seconds: float = 0.5,
+        putdown_seconds: float = 3.0,
+        cooldown: float = 30.0,
+        reference_confidence: float = 0.5,
+        max_gap: float = 1.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self.pickup_seconds = pickup_seconds
+        self.putdown_seconds = putdown_seconds
+        self.cooldown = cooldown
+        self.reference_confidence = reference_confidence
+        self.max_gap = max_gap  # Longest interval a single observation can account for
+        self.clock = clock
+
+        self.phone_visible = False
+        self.phone_count = 0
+        self.pending = False  # Phone seen but pickup not confirmed yet
+        self.evidence = 0.0  # Confidence-weighted seconds of phone sightings
+        self.last_seen: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+        self.last_reaction_time: Optional[float] = None
+
+    @property
+    def pickup_pending(self) -> bool:
+        """True while a phone has been seen but the pickup is not confirmed yet."""
+        return self.pending
+
+    def update(self, timestamp: Optional[float], confidence: float) -> Optional[str]:
+        """
+        Feed one detection result.
+
+        Args:
+            timestamp: Capture time of the frame (seconds)
+            confidence: Best phone confidence in the frame, 0.0 if none
+
+        Returns:
+            "picked_up" - Phone just picked up, or still held after the cooldown
+            "put_down" - Phone just put down
+            None - No state change
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+
+        if self.last_timestamp is None:
+            dt = 0.0
+        else:
+            dt = min(max(timestamp - self.last_timestamp, 0.0), self.max_gap)
+        self.last_timestamp = timestamp
+
+        if confidence > 0.0:
+            self.last_seen = timestamp
+            if not self.phone_visible:
+                if self.pending:
+                    self.evidence += dt * min(1.0, confidence / self.reference_confidence)
+                self.pending = True
+
+                # Check for phone pickup (quick to detect)
+                if self.evidence >= self.pickup_seconds:
+                    self.phone_visible = True
+                    self.pending = False
+                    self.evidence = 0.0
+                    return self._react(timestamp)
+                return None
+
+            # Periodic reactions while STILL holding phone (like demo.js)
+            return self._react(timestamp)
+
+        if not self.phone_visible:
+            if self.pending:
+                self.evidence -= dt
+                if self.evidence <= 0.0:
+                    self.pending = False
+                    self.evidence = 0.0
+            return None
+
+        # Check for phone put down (slow to confirm - avoids flickering)
+        if self.last_seen is None or timestamp - self.last_seen >= self.putdown_seconds:
+            self.phone_visible = False
+            self.evidence = 0.0
+            # Reset cooldown timer so next pickup can trigger immediately
+            self.last_reaction_time = None
+            return "put_down"
+
+        return None
+
+    def _react(self, timestamp: float) -> Optional[str]:
+        """Emit "picked_up" if the cooldown has elapsed."""
+        if self.last_reaction_time is None or timestamp - self.last_reaction_time >= self.cooldown:
+            self.phone_count += 1
+            self.last_reaction_time = timestamp
+            return "picked_up"
+        return None
+
+    def reset(self):
+        """Reset tracking state but keep the pickup count."""
+        self.phone_visible = False
+        self.pending = False
+        self.evidence = 0.0
+        self.last_seen = None
+        self.last_timestamp = None
+        self.last_reaction_time = None
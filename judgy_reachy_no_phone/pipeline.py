@@ -0,0 +1,106 @@
+"""Capture loop shared by every frame source."""
+
+import time
+import logging
+import threading
+from typing import Callable, Optional
+
+from .frames import FrameRing
+from .sources import FrameSource
+from .metrics import CAPTURE_SECONDS, FRAMES_CAPTURED
+from .tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+
+class CapturePipeline:
+    """Pull frames from a FrameSource into the ring and hand them on.
+
+    One loop serves the webcam, the robot camera and recordings: capture into
+    the ring, update the FPS counter, then call on_frame(seq), which lends the
+    frame to inference and the preview without copying. Nothing here depends
+    on the robot SDK, so the pipeline runs anywhere a source can be opened.
+    """
+
+    def __init__(self, source: FrameSource, ring: FrameRing, on_frame: Callable[[int], None]):
+        self.source = source
+        self.ring = ring
+        self.on_frame = on_frame
+
+        self.running = False
+        self.fps = 0
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.frames_captured = 0
+
+    def start(self, stop_event: threading.Event):
+        """Start capturing on a background thread."""
+        self.running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(stop_event,),
+            name=f"capture-{self.source.name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop capturing and release the source."""
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.source.close()
+
+    def step(self) -> Optional[int]:
+        """Capture and dispatch one frame; returns its sequence number or None."""
+        start = time.perf_counter()
+        with TRACER.span("capture", "capture"):
+            seq = self.source.read(self.ring)
+        if seq is None:
+            return None
+        CAPTURE_SECONDS.observe(time.perf_counter() - start)
+        FRAMES_CAPTURED.inc()
+        self.frames_captured += 1
+        self.on_frame(seq)
+        return seq
+
+    def _run(self, stop_event: threading.Event):
+        fps_counter = 0
+        fps_start = time.time()
+
+        logger.info(f"{self.source.description} capture started")
+
+        try:
+            while not stop_event.is_set() and self.running:
+                seq = self.step()
+                if seq is None:
+                    if self.source.finished:
+                        break
+                    time.sleep(0.01)
+                    continue
+
+                # Calculate FPS
+                fps_counter += 1
+                if time.time() - fps_start >= 1.0:
+                    self.fps = fps_counter
+                    fps_counter = 0
+                    fps_start = time.time()
+
+                if self.source.poll_interval:
+                    time.sleep(self.source.poll_interval)
+        except Exception as e:
+            logger.error(f"Capture error: {e}")
+        finally:
+            self.running = False
+            logger.info(f"{self.source.description} capture stopped")
+
+    def get_stats(self) -> dict:
+        """Get capture statistics."""
+        return {
+            "source": self.source.name,
+            "fps": self.fps,
+            "frames_captured": self.frames_captured,
+            **self.source.get_stats(),
+        }
@@ -0,0 +1,64 @@
+"""Letterbox preprocessing into reused buffers."""
+
+import logging
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class Letterbox:
+    """Resize a frame to fit a square model input, padding the rest.
+
+    The output canvas and the resize buffer are allocated once per input
+    shape and reused, so steady-state preprocessing allocates nothing. The
+    canvas is overwritten by the next call: use it before calling again.
+    """
+
+    PAD_VALUE = 114  # Same gray padding Ultralytics uses
+
+    def __init__(self, size: int = 640):
+        self.size = size
+        self.canvas = np.full((size, size, 3), self.PAD_VALUE, dtype=np.uint8)
+        self._resized: Optional[np.ndarray] = None
+        self._input_shape: Optional[Tuple[int, int]] = None
+
+        # Inverse transform of the last call: frame = (model - pad) / scale
+        self.scale = 1.0
+        self.pad_x = 0
+        self.pad_y = 0
+
+    def __call__(self, image: np.ndarray) -> np.ndarray:
+        """Letterbox image into the reused canvas and return it."""
+        height, width = image.shape[:2]
+        if (height, width) != self._input_shape:
+            self._configure(height, width)
+
+        new_h, new_w = self._resized.shape[:2]
+        if (new_h, new_w) == (height, width):
+            np.copyto(self._resized, image)
+        else:
+            cv2.resize(image, (new_w, new_h), dst=self._resized, interpolation=cv2.INTER_LINEAR)
+        self.canvas[self.pad_y:self.pad_y + new_h, self.pad_x:self.pad_x + new_w] = self._resized
+        return self.canvas
+
+    def _configure(self, height: int, width: int):
+        """Compute scale/padding for a new input shape and reset the canvas."""
+        self.scale = min(self.size / width, self.size / height)
+        new_w = max(1, int(round(width * self.scale)))
+        new_h = max(1, int(round(height * self.scale)))
+        self.pad_x = (self.size - new_w) // 2
+        self.pad_y = (self.size - new_h) // 2
+        self._resized = np.empty((new_h, new_w, 3), dtype=np.uint8)
+        self.canvas[...] = self.PAD_VALUE
+        self._input_shape = (height, width)
+
+    def to_frame(self, boxes: np.ndarray) -> np.ndarray:
+        """Map an (N, 4) array of x1, y1, x2, y2 from model input back to frame coordinates."""
+        height, width = self._input_shape
+        boxes = (boxes - (self.pad_x, self.pad_y, self.pad_x, self.pad_y)) / self.scale
+        np.clip(boxes[:, 0::2], 0, width, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, height, out=boxes[:, 1::2])
+        return boxes
@@ -0,0 +1,169 @@
+"""Shared JPEG preview of the annotated camera feed."""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .frames import FrameLease
+from .metrics import ENCODE_SECONDS
+from .tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewHub:
+    """Latest camera frame, rendered and encoded once per (frame, width) for all viewers.
+
+    The capture thread publishes frame leases from the capture ring only
+    while the preview is active (a stream is open, or a frame was requested
+    within idle_timeout seconds); each publish wakes waiting viewers. Nothing
+    is copied or drawn at publish time: when a viewer asks for a sequence
+    number that has not been encoded yet, the frame is rendered (detection
+    boxes drawn) and encoded, and the JPEG is cached for that sequence, so a
+    headless unit draws and encodes nothing. Encodes are cached per width, so
+    any number of viewers at the same resolution cost one encode per frame.
+    """
+
+    QUALITY = 85
+    MIN_WIDTH = 80
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for encode time samples
+
+    def __init__(
+        self,
+        render: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        quality: int = QUALITY,
+        idle_timeout: float = 5.0
+    ):
+        self.render = render  # Draws the overlay: render(frame) -> annotated frame
+        self.quality = quality
+        self.idle_timeout = idle_timeout  # Seconds without viewers before publishing stops
+        self.seq = 0  # Capture sequence number of the latest published frame
+
+        self._cond = threading.Condition()
+        self._encode_lock = threading.Lock()
+        self._lease: Optional[FrameLease] = None    # Latest published frame
+        self._reading: Optional[FrameLease] = None  # Frame being encoded right now
+        self._encoded: Dict[int, Tuple[int, bytes]] = {}  # width -> (seq, jpeg)
+        self._viewers = 0
+        self._last_request = 0.0
+
+        # Stats
+        self.frames_published = 0
+        self.encodes = 0
+        self.encode_time = 0.0  # Smoothed (seconds)
+
+    @property
+    def viewers(self) -> int:
+        """Number of connected stream viewers."""
+        return self._viewers
+
+    @property
+    def active(self) -> bool:
+        """True while frames are wanted: a stream is open or a frame was requested recently."""
+        return self._viewers > 0 or time.time() - self._last_request < self.idle_timeout
+
+    def request_frame(self, timeout: float = 0.5):
+        """Mark demand for a frame; if the preview was idle, wait briefly for a fresh one."""
+        was_active = self.active
+        self._last_request = time.time()
+        if not was_active:
+            self.wait_for_frame(self.seq, timeout)
+
+    @contextmanager
+    def viewer(self):
+        """Count a stream viewer for the duration of the block."""
+        with self._cond:
+            self._viewers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._viewers -= 1
+                self._last_request = time.time()
+
+    def publish(self, lease: Optional[FrameLease]):
+        """Make a captured frame the latest preview frame; the hub takes over the lease."""
+        if lease is None:
+            return
+        with self._cond:
+            previous = self._lease
+            self._lease = lease
+            self.seq = lease.seq
+            self.frames_published += 1
+            if previous is not None and previous is not self._reading:
+                previous.release()
+            self._cond.notify_all()
+
+    def wait_for_frame(self, after_seq: int, timeout: float = 1.0) -> int:
+        """Block until a frame newer than after_seq exists; return the latest seq."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq > after_seq, timeout)
+            return self.seq
+
+    def jpeg(self, width: int = 0) -> Tuple[int, Optional[bytes]]:
+        """Latest frame as JPEG, optionally downscaled to width; (seq, None) if no frame yet."""
+        with self._encode_lock:
+            with self._cond:
+                lease = self._lease
+                if lease is None:
+                    return self.seq, None
+                seq = lease.seq
+                width = self._normalize_width(width, lease.frame.shape[1])
+                cached = self._encoded.get(width)
+                if cached and cached[0] == seq:
+                    return cached
+                self._reading = lease
+
+            try:
+                jpeg = self._encode(lease.frame, width)
+            finally:
+                with self._cond:
+                    self._reading = None
+                    if lease is not self._lease:
+                        lease.release()  # Replaced while encoding
+
+            # Keep only encodes of the current frame
+            self._encoded = {w: e for w, e in self._encoded.items() if e[0] == seq}
+            self._encoded[width] = (seq, jpeg)
+            return seq, jpeg
+
+    def _normalize_width(self, width: int, frame_width: int) -> int:
+        """Requested width clamped to [MIN_WIDTH, frame width]; 0 means full size."""
+        if width <= 0 or width >= frame_width:
+            return 0
+        return max(self.MIN_WIDTH, width)
+
+    @TRACER.traced("encode", "preview")
+    def _encode(self, frame: np.ndarray, width: int) -> bytes:
+        if self.render is not None:
+            frame = self.render(frame)  # Overlay time is counted by the draw stage
+        start = time.time()
+        if width:
+            height, frame_width = frame.shape[:2]
+            size = (width, max(1, int(round(height * width / frame_width))))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+
+        elapsed = time.time() - start
+        ENCODE_SECONDS.observe(elapsed)
+        self.encodes += 1
+        if self.encode_time == 0.0:
+            self.encode_time = elapsed
+        else:
+            self.encode_time += self.LATENCY_SMOOTHING * (elapsed - self.encode_time)
+        return buffer.tobytes()
+
+    def get_stats(self) -> dict:
+        """Get preview statistics."""
+        return {
+            "active": self.active,
+            "viewers": self._viewers,
+            "frames_published": self.frames_published,
+            "encodes": self.encodes,
+            "encode_ms": round(self.encode_time * 1000, 1),
+        }
@@ -0,0 +1,201 @@
+"""Long-lived asyncio worker for reaction jobs (LLM, TTS, playback)."""
+
+import asyncio
+import logging
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Reaction:
+    __slots__ = ("kind", "on_cancel", "cancelled")
+
+    def __init__(self, kind: str, on_cancel: Optional[Callable]):
+        self.kind = kind
+        self.on_cancel = on_cancel
+        self.cancelled = False
+
+
+class ReactionWorker:
+    """One event loop thread that owns LLM generation, TTS and playback.
+
+    Jobs are coroutines submitted from any thread with submit() (or run() to
+    wait for the result). Blocking SDK calls (Groq, ElevenLabs, the robot's
+    play_sound and moves) go through call(), which runs them in a bounded
+    thread pool, so several jobs can wait on the network at once without
+    creating a thread or an event loop per call.
+
+    react() splits a reaction into prepare (network: LLM, TTS) and perform
+    (speaking and moving). Preparations overlap freely; performances run one
+    at a time, in the order the reactions were submitted. cancel_waiting()
+    drops reactions that have not started performing (e.g. a shame still
+    being generated when the phone is put down), so callers never have to
+    hold events back while a preparation waits on the network.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(2, max_workers)  # A job may block one thread waiting on another
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._last_turn: Optional[asyncio.Future] = None  # Loop thread only
+        self._waiting = []  # Reactions submitted but not performing yet
+
+        # Stats
+        self.active = 0      # Submitted jobs not finished yet
+        self.reacting = 0    # Reactions not finished yet
+        self.preparing = 0   # Reactions still generating their line/audio
+        self.jobs_submitted = 0
+        self.jobs_failed = 0
+        self.reactions_cancelled = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def busy(self) -> bool:
+        """True while a reaction is being prepared or performed."""
+        return self.reacting > 0
+
+    def start(self):
+        """Start the loop thread (idempotent)."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="reaction-io")
+            self.loop = asyncio.new_event_loop()
+            self.loop.set_default_executor(self.executor)
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(ready,), name="reaction-loop", daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the loop; unfinished jobs are abandoned."""
+        with self._start_lock:
+            if self._thread is None:
+                return
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=timeout)
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self._thread = None
+            self._last_turn = None
+            self.active = self.reacting = self.preparing = 0
+            self._waiting = []
+
+    def _run(self, ready: threading.Event):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def submit(self, coro: Awaitable) -> Future:
+        """Schedule a coroutine on the worker loop from any thread."""
+        self.start()
+        with self._start_lock:
+            self.active += 1
+            self.jobs_submitted += 1
+        return asyncio.run_coroutine_threadsafe(self._track(coro), self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Submit a coroutine and wait for its result (not from the worker loop itself)."""
+        return self.submit(coro).result(timeout)
+
+    async def _track(self, coro: Awaitable) -> Any:
+        try:
+            return await coro
+        except Exception as e:
+            self.jobs_failed += 1
+            logger.error(f"Reaction job failed: {e}")
+            raise
+        finally:
+            with self._start_lock:
+                self.active -= 1
+
+    async def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function in the bounded pool (from a job on the worker loop)."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    def react(
+        self,
+        perform: Callable,
+        prepare: Optional[Awaitable] = None,
+        kind: str = "",
+        on_cancel: Optional[Callable] = None
+    ) -> Future:
+        """Run prepare (if any), then perform(prepared) in submission order.
+
+        If the reaction is cancelled with cancel_waiting(kind) before it
+        performs, on_cancel(prepared) is called instead (to free what was
+        prepared) and the future's result is None.
+        """
+        reaction = _Reaction(kind, on_cancel)
+        # Counted before the job starts, so callers see it as busy right away
+        with self._start_lock:
+            self.reacting += 1
+            if prepare is not None:
+                self.preparing += 1
+            self._waiting.append(reaction)
+        return self.submit(self._react(reaction, perform, prepare))
+
+    def cancel_waiting(self, kind: str) -> int:
+        """Cancel reactions of this kind that have not started performing; returns how many."""
+        with self._start_lock:
+            cancelled = [r for r in self._waiting if r.kind == kind and not r.cancelled]
+            for reaction in cancelled:
+                reaction.cancelled = True
+        return len(cancelled)
+
+    async def _react(self, reaction: _Reaction, perform: Callable, prepare: Optional[Awaitable]) -> Any:
+        previous = self._last_turn
+        turn = asyncio.get_running_loop().create_future()
+        self._last_turn = turn
+        try:
+            args = ()
+            try:
+                if prepare is not None:
+                    try:
+                        args = (await prepare,)
+                    finally:
+                        with self._start_lock:
+                            self.preparing -= 1
+            finally:
+                # Keep the order even when this preparation failed
+                if previous is not None:
+                    await previous
+                with self._start_lock:
+                    if reaction in self._waiting:  # Gone if the worker was stopped meanwhile
+                        self._waiting.remove(reaction)
+
+            if reaction.cancelled:
+                self.reactions_cancelled += 1
+                if reaction.on_cancel is not None:
+                    await self.call(reaction.on_cancel, *(args or (None,)))
+                return None
+            return await self.call(perform, *args)
+        finally:
+            turn.set_result(None)
+            with self._start_lock:
+                self.reacting -= 1
+
+    def get_stats(self) -> dict:
+        """Get worker statistics."""
+        return {
+            "running": self.running,
+            "active": self.active,
+            "reacting": self.reacting,
+            "preparing": self.preparing,
+            "submitted": self.jobs_submitted,
+            "failed": self.jobs_failed,
+            "cancelled": self.reactions_cancelled,
+            "max_workers": self.max_workers,
+        }
@@ -0,0 +1,147 @@
+"""Lightweight phone box tracking between YOLO runs."""
+
+import logging
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]  # x1, y1, x2, y2 in frame coordinates
+
+
+class RoiTracker:
+    """Follow a detected phone with template matching.
+
+    Once YOLO finds a phone, the box content becomes a grayscale template.
+    Later frames only search a window around the previous box, so a tracked
+    phone costs one small matchTemplate instead of a full model run. Every
+    confirm_interval seconds the detector re-runs YOLO on an expanded crop
+    around the box (see crop_region) and restarts the tracker from the result.
+    """
+
+    TEMPLATE_WIDTH = 48  # Templates are downscaled to about this width
+
+    def __init__(
+        self,
+        confirm_interval: float = 1.0,
+        search_margin: float = 0.5,
+        crop_margin: float = 0.5,
+        min_score: float = 0.5
+    ):
+        self.confirm_interval = confirm_interval  # Seconds between YOLO confirmations
+        self.search_margin = search_margin        # Search window padding (fraction of box size)
+        self.crop_margin = crop_margin            # Confirmation crop padding (fraction of box size)
+        self.min_score = min_score                # Min normalized correlation to keep the track
+
+        self.box: Optional[Box] = None
+        self.confidence = 0.0
+        self.track_id: Optional[int] = None
+        self.last_confirmed = 0.0
+        self.last_score = 0.0
+        self._template: Optional[np.ndarray] = None
+        self._scale = 1.0
+
+        # Stats
+        self.tracked_frames = 0
+        self.tracks_lost = 0
+
+    @property
+    def active(self) -> bool:
+        """True while a phone is being tracked."""
+        return self.box is not None
+
+    def start(self, frame: np.ndarray, box: Box, confidence: float, track_id: Optional[int], timestamp: float):
+        """(Re)start tracking from a YOLO detection."""
+        x1, y1, x2, y2 = self._clip(box, frame.shape)
+        if x2 - x1 < 4 or y2 - y1 < 4:
+            self.stop()
+            return
+
+        self._scale = min(1.0, self.TEMPLATE_WIDTH / (x2 - x1))
+        patch = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY)
+        if self._scale < 1.0:
+            patch = cv2.resize(patch, None, fx=self._scale, fy=self._scale, interpolation=cv2.INTER_AREA)
+
+        self._template = patch
+        self.box = (x1, y1, x2, y2)
+        self.confidence = confidence
+        self.track_id = track_id
+        self.last_confirmed = timestamp
+
+    def stop(self):
+        """Drop the current track."""
+        if self.box is not None:
+            self.tracks_lost += 1
+        self.box = None
+        self._template = None
+
+    def confirmation_due(self, timestamp: float) -> bool:
+        """True when the track should be re-checked by YOLO."""
+        return timestamp - self.last_confirmed >= self.confirm_interval
+
+    def crop_region(self, frame_shape) -> Box:
+        """Expanded region around the box for a YOLO confirmation run."""
+        return self._expand(self.box, self.crop_margin, frame_shape)
+
+    def update(self, frame: np.ndarray) -> Optional[Box]:
+        """Move the box to its best match in the new frame, None if lost."""
+        if self.box is None:
+            return None
+
+        sx1, sy1, sx2, sy2 = self._expand(self.box, self.search_margin, frame.shape)
+        window = cv2.cvtColor(frame[sy1:sy2, sx1:sx2], cv2.COLOR_BGR2GRAY)
+        if self._scale < 1.0:
+            window = cv2.resize(window, None, fx=self._scale, fy=self._scale, interpolation=cv2.INTER_AREA)
+
+        th, tw = self._template.shape
+        if window.shape[0] < th or window.shape[1] < tw:
+            self.stop()
+            return None
+
+        scores = cv2.matchTemplate(window, self._template, cv2.TM_CCOEFF_NORMED)
+        _, self.last_score, _, (mx, my) = cv2.minMaxLoc(scores)
+        if self.last_score < self.min_score:
+            self.stop()
+            return None
+
+        w = self.box[2] - self.box[0]
+        h = self.box[3] - self.box[1]
+        x1 = sx1 + int(round(mx / self._scale))
+        y1 = sy1 + int(round(my / self._scale))
+        self.box = (x1, y1, x1 + w, y1 + h)
+        self.tracked_frames += 1
+        return self.box
+
+    def _expand(self, box: Box, margin: float, frame_shape) -> Box:
+        x1, y1, x2, y2 = box
+        pad_x = int((x2 - x1) * margin)
+        pad_y = int((y2 - y1) * margin)
+        return self._clip((x1 - pad_x, y1 - pad_y, x2 + pad_x, y2 + pad_y), frame_shape)
+
+    @staticmethod
+    def _clip(box: Box, frame_shape) -> Box:
+        height, width = frame_shape[:2]
+        x1, y1, x2, y2 = box
+        return (
+            max(0, min(int(x1), width)),
+            max(0, min(int(y1), height)),
+            max(0, min(int(x2), width)),
+            max(0, min(int(y2), height)),
+        )
+
+    def reset_stats(self):
+        """Zero the statistics (e.g. between benchmark recordings)."""
+        self.tracked_frames = 0
+        self.tracks_lost = 0
+        self.last_score = 0.0
+
+    def get_stats(self) -> dict:
+        """Get tracker statistics."""
+        return {
+            "active": self.active,
+            "tracked_frames": self.tracked_frames,
+            "tracks_lost": self.tracks_lost,
+            "last_score": round(self.last_score, 3),
+        }
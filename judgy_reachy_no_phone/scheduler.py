@@ -0,0 +1,123 @@
+"""Adaptive detection scheduling."""
+
+import time
+import logging
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionScheduler:
+    """Decide when the next frame should go to the detector.
+
+    The interval between detections is the larger of two limits:
+    - a state-based target: dense while a phone is visible or a pickup is
+      pending, normal shortly after, sparse during long phone-free stretches
+    - a CPU budget floor: measured inference latency / budget, so a 250ms
+      model with a 0.5 budget never runs more than twice per second
+
+    Only passes that actually ran the model feed the latency; passes the
+    motion gate or ROI tracker answered without it would drag it toward
+    zero. The detection rate counts every completed pass, the model rate
+    only the model runs.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for new latency samples
+    RATE_WINDOW = 5.0        # Seconds of completions used for the reported rate
+
+    def __init__(
+        self,
+        cpu_budget: float = 0.5,
+        dense_interval: float = 0.1,
+        normal_interval: float = 0.2,
+        sparse_interval: float = 0.5,
+        idle_after: float = 30.0
+    ):
+        self.cpu_budget = cpu_budget
+        self.dense_interval = dense_interval
+        self.normal_interval = normal_interval
+        self.sparse_interval = sparse_interval
+        self.idle_after = idle_after
+
+        self.latency = 0.0  # Smoothed detection latency (seconds)
+        self.mode = "normal"  # dense, normal, sparse
+        self.last_dispatch = 0.0
+        self.last_phone_time: Optional[float] = None
+        self._completions = deque(maxlen=64)  # Every completed detection pass
+        self._model_runs = deque(maxlen=64)    # Passes that ran the model
+
+    def interval(self, now: float, phone_active: bool) -> float:
+        """Current target interval between detections (seconds)."""
+        if phone_active:
+            self.last_phone_time = now
+            self.mode = "dense"
+            target = self.dense_interval
+        elif self.last_phone_time is not None and now - self.last_phone_time < self.idle_after:
+            self.mode = "normal"
+            target = self.normal_interval
+        else:
+            self.mode = "sparse"
+            target = self.sparse_interval
+
+        if self.cpu_budget > 0:
+            target = max(target, self.latency / self.cpu_budget)
+        return target
+
+    def should_run(self, now: Optional[float] = None, phone_active: bool = False) -> bool:
+        """Return True (and mark the dispatch) if a detection is due."""
+        if now is None:
+            now = time.time()
+        if now - self.last_dispatch < self.interval(now, phone_active):
+            return False
+        self.last_dispatch = now
+        return True
+
+    def record_latency(self, seconds: float, now: Optional[float] = None, model_ran: bool = True):
+        """Feed back a completed detection; its latency counts only if the model ran."""
+        if now is None:
+            now = time.time()
+        self._completions.append(now)
+        if not model_ran:
+            return
+        if self.latency == 0.0:
+            self.latency = seconds
+        else:
+            self.latency += self.LATENCY_SMOOTHING * (seconds - self.latency)
+        self._model_runs.append(now)
+
+    def detection_rate(self, now: Optional[float] = None) -> float:
+        """Detections actually completed per second over the recent window."""
+        return self._rate(self._completions, now)
+
+    def model_rate(self, now: Optional[float] = None) -> float:
+        """Detections that ran the model per second over the recent window."""
+        return self._rate(self._model_runs, now)
+
+    def _rate(self, times: deque, now: Optional[float]) -> float:
+        if now is None:
+            now = time.time()
+        recent = [t for t in times if now - t <= self.RATE_WINDOW]
+        if len(recent) < 2:
+            return 0.0
+        span = recent[-1] - recent[0]
+        return (len(recent) - 1) / span if span > 0 else 0.0
+
+    def reset(self):
+        """Forget phone history (e.g. when monitoring restarts)."""
+        self.last_phone_time = None
+        self.last_dispatch = 0.0
+        self.mode = "normal"
+        self._completions.clear()
+        self._model_runs.clear()
+
+    def get_stats(self) -> dict:
+        """Get scheduler statistics."""
+        now = time.time()
+        return {
+            "mode": self.mode,
+            "detection_rate": round(self.detection_rate(now), 2),
+            "model_rate": round(self.model_rate(now), 2),
+            "latency_ms": round(self.latency * 1000, 1),
+            "cpu_budget": self.cpu_budget,
+        }
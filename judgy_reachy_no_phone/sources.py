@@ -0,0 +1,332 @@
+"""Frame sources for the capture pipeline: webcam, robot camera and recordings."""
+
+import os
+import time
+import zlib
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from .frames import FrameRing
+from .metrics import FRAMES_DROPPED
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+STALE_DROPS = FRAMES_DROPPED.labels("stale")
+DUPLICATE_DROPS = FRAMES_DROPPED.labels("duplicate")
+
+
+class FrameSource:
+    """Something that produces camera frames into a FrameRing.
+
+    read() captures one frame into the ring and returns its sequence number,
+    or None when no frame is available right now. `finished` turns True when
+    a finite source (a recording) has run out of frames.
+    """
+
+    name = "source"
+    description = "Camera"
+    poll_interval = 0.01  # Pause after each frame (caps the loop at ~100 FPS)
+    _frame_shape = None   # Shape of the last decoded frame, for in-place capture
+
+    def open(self) -> bool:
+        """Prepare the source; False if it cannot deliver frames."""
+        return True
+
+    def read(self, ring: FrameRing) -> Optional[int]:
+        raise NotImplementedError
+
+    def close(self):
+        """Release the device or file."""
+
+    @property
+    def finished(self) -> bool:
+        return False
+
+    def get_stats(self) -> dict:
+        """Source-specific statistics."""
+        return {}
+
+    def _capture_into(
+        self,
+        capture: cv2.VideoCapture,
+        ring: FrameRing,
+        timestamp: float,
+        grabbed: bool = False
+    ) -> Optional[int]:
+        """Decode the next VideoCapture frame into a ring slot (first frame: OpenCV allocates).
+
+        With grabbed=True the frame was already grabbed and is only retrieved.
+        """
+        buffer = ring.write_buffer(self._frame_shape) if self._frame_shape else None
+        ret, frame = capture.retrieve(buffer) if grabbed else capture.read(buffer)
+        if not ret:
+            if buffer is not None:
+                ring.abort()
+            return None
+        self._frame_shape = frame.shape
+        if buffer is None:
+            return ring.put(frame, timestamp)
+        return ring.commit(timestamp, frame)
+
+
+class WebcamSource(FrameSource):
+    """OpenCV camera (laptop webcam in simulation), decoded straight into ring slots.
+
+    In low-latency mode the camera is asked for MJPG at the given resolution
+    and frame rate with a one-frame driver buffer, and each read drains
+    frames that were already queued: grab() returning almost instantly means
+    the frame was sitting in the buffer, so it is skipped without decoding
+    and only the newest frame is retrieved. The loop then paces itself on
+    the camera instead of sleeping.
+    """
+
+    name = "webcam"
+    description = "Laptop webcam"
+    STALE_GRAB_SECONDS = 0.005  # A grab this fast returned a frame that was already queued
+    MAX_DRAIN = 4               # Stale frames skipped per read at most
+
+    def __init__(
+        self,
+        index: int = 0,
+        low_latency: bool = True,
+        width: int = 640,
+        height: int = 480,
+        fps: int = 30,
+        fourcc: str = "MJPG"
+    ):
+        self.index = index
+        self.low_latency = low_latency
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.capture: Optional[cv2.VideoCapture] = None
+        if low_latency:
+            self.poll_interval = 0.0
+
+        # Stats
+        self.frames_drained = 0
+        self.buffer_size_supported = False
+
+    def open(self) -> bool:
+        self.capture = cv2.VideoCapture(self.index)
+        if not self.capture.isOpened():
+            return False
+        if self.low_latency:
+            self._configure()
+        return True
+
+    def _configure(self):
+        """Negotiate format, resolution, frame rate and a minimal driver buffer (best effort)."""
+        capture = self.capture
+        if self.fourcc:
+            capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        if self.width and self.height:
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.fps:
+            capture.set(cv2.CAP_PROP_FPS, self.fps)
+        self.buffer_size_supported = bool(capture.set(cv2.CAP_PROP_BUFFERSIZE, 1))
+
+        logger.info(
+            f"Webcam: {int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+            f"@ {capture.get(cv2.CAP_PROP_FPS):.0f} FPS, "
+            f"driver buffer {'1 frame' if self.buffer_size_supported else 'default (draining stale frames)'}"
+        )
+
+    def read(self, ring: FrameRing) -> Optional[int]:
+        if not self.low_latency:
+            return self._capture_into(self.capture, ring, time.time())
+
+        # Skip queued frames without decoding them: stop at the first grab that waited
+        drained = 0
+        for _ in range(self.MAX_DRAIN + 1):
+            start = time.perf_counter()
+            if not self.capture.grab():
+                return None
+            if time.perf_counter() - start >= self.STALE_GRAB_SECONDS:
+                break
+            drained += 1
+        else:
+            drained -= 1  # The last grab is used, not skipped
+        if drained:
+            self.frames_drained += drained
+            STALE_DROPS.inc(drained)
+        return self._capture_into(self.capture, ring, time.time(), grabbed=True)
+
+    def get_stats(self) -> dict:
+        """Get capture statistics."""
+        return {
+            "low_latency": self.low_latency,
+            "frames_drained": self.frames_drained,
+            "buffer_size_supported": self.buffer_size_supported,
+        }
+
+    def close(self):
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+            logger.info("Webcam released")
+
+
+class RobotMediaSource(FrameSource):
+    """Reachy Mini camera through the SDK's media object (anything with get_frame()).
+
+    Polling get_frame() can hand back a frame that was already seen.
+    Duplicates are recognised by the media timestamp when the media object
+    returns it together with the frame (get_frame_with_timestamp()),
+    otherwise by a CRC of a sparse pixel grid, and are skipped before they
+    reach the ring, so they cost no detection or encoding and the pipeline
+    FPS counts unique frames only. A timestamp read in a separate call could
+    already belong to the next frame, so only the atomic form is trusted.
+    """
+
+    name = "robot"
+    description = "Robot camera"
+    HASH_STRIDE = 16  # Hash every 16th pixel in each direction (~1/256 of the frame)
+
+    def __init__(self, media):
+        self.media = media
+        self._get_frame_with_timestamp = getattr(media, "get_frame_with_timestamp", None)
+        self.dedup_method = "timestamp" if callable(self._get_frame_with_timestamp) else "hash"
+        self._last_key = None
+
+        # Stats
+        self.duplicates = 0
+
+    def read(self, ring: FrameRing) -> Optional[int]:
+        if self.dedup_method == "timestamp":
+            frame, stamp = self._get_frame_with_timestamp()
+        else:
+            frame, stamp = self.media.get_frame(), None
+        if frame is None:
+            return None
+
+        key = self._frame_key(frame, stamp)
+        if key == self._last_key:
+            self.duplicates += 1
+            DUPLICATE_DROPS.inc()
+            return None
+        self._last_key = key
+
+        # The SDK returns a fresh array each time: adopt it, no copy
+        return ring.put(frame, time.time())
+
+    def _frame_key(self, frame, stamp=None) -> tuple:
+        """Identity of a frame: its media timestamp, or a sampled CRC."""
+        if stamp is not None:
+            return ("timestamp", stamp)
+        sample = np.ascontiguousarray(frame[::self.HASH_STRIDE, ::self.HASH_STRIDE])
+        return ("hash", frame.shape, zlib.crc32(sample))
+
+    def get_stats(self) -> dict:
+        """Get capture statistics."""
+        return {
+            "dedup_method": self.dedup_method,
+            "duplicates": self.duplicates,
+        }
+
+
+class ReplaySource(FrameSource):
+    """Recorded video file or folder of images, for profiling without a camera.
+
+    Frame timestamps follow the recording (start time + media time), so
+    time-based logic sees the same timing whether the replay is paced in
+    real time or run as fast as possible (realtime=False).
+    """
+
+    name = "replay"
+    description = "Recording"
+    DEFAULT_FPS = 30.0  # Image sequences and videos without fps metadata
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False, fps: float = 0.0):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.fps = fps
+        self.poll_interval = 0.0
+
+        self.capture: Optional[cv2.VideoCapture] = None
+        self.images: List[str] = []
+        self.frame_index = 0
+        self._start_time = 0.0
+        self._finished = False
+
+    def open(self) -> bool:
+        if os.path.isdir(self.path):
+            self.images = sorted(
+                str(p) for p in Path(self.path).iterdir()
+                if p.suffix.lower() in IMAGE_EXTENSIONS
+            )
+            if not self.images:
+                logger.error(f"No images found in {self.path}")
+                return False
+        else:
+            self.capture = cv2.VideoCapture(self.path)
+            if not self.capture.isOpened():
+                logger.error(f"Cannot open recording {self.path}")
+                return False
+            if not self.fps:
+                self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 0.0
+
+        self.fps = self.fps or self.DEFAULT_FPS
+        self._start_time = time.time()
+        logger.info(f"Replaying {self.path} at {self.fps:.1f} FPS ({'real time' if self.realtime else 'fast'})")
+        return True
+
+    @property
+    def media_time(self) -> float:
+        """Position in the recording of the next frame (seconds)."""
+        return self.frame_index / self.fps
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def read(self, ring: FrameRing) -> Optional[int]:
+        if self._finished:
+            return None
+        if self.images and self.frame_index >= len(self.images) and not self._rewind():
+            return None
+
+        timestamp = self._start_time + self.media_time
+        if self.realtime:
+            delay = timestamp - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+        if self.images:
+            frame = cv2.imread(self.images[self.frame_index])
+            seq = ring.put(frame, timestamp) if frame is not None else None
+        else:
+            seq = self._capture_into(self.capture, ring, timestamp)
+            if seq is None:
+                self._rewind()  # End of video
+                return None
+
+        self.frame_index += 1
+        return seq
+
+    def _rewind(self) -> bool:
+        """Restart a looping replay, or mark the source finished."""
+        if not self.loop:
+            self._finished = True
+            logger.info(f"Replay finished after {self.frame_index} frames")
+            return False
+        if self.capture is not None:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._start_time += self.media_time
+        self.frame_index = 0
+        return True
+
+    def close(self):
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
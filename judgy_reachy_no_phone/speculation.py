@@ -0,0 +1,178 @@
+"""Speculative shame generation while a pickup is still being confirmed."""
+
+import os
+import time
+import asyncio
+import logging
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional, Tuple
+
+from .audio import LLMResponder, TextToSpeech
+from .reactions import ReactionWorker
+
+logger = logging.getLogger(__name__)
+
+
+class _Speculation:
+    __slots__ = (
+        "phone_count", "llm", "tts", "started_at", "ready_at", "text", "audio_path", "output_path",
+        "done", "future", "discarded"
+    )
+
+    def __init__(self, phone_count: int, llm: LLMResponder, tts: TextToSpeech):
+        self.phone_count = phone_count
+        self.llm = llm
+        self.tts = tts
+        self.started_at = time.time()
+        self.ready_at: Optional[float] = None
+        self.text: Optional[str] = None
+        self.audio_path: Optional[str] = None
+        self.output_path: Optional[str] = None  # Own temp file, used when TTS is not cached
+        self.done = threading.Event()
+        self.future: Optional[Future] = None
+        self.discarded = False
+
+
+class ReactionSpeculator:
+    """Generate the next shame line and its audio before the pickup is confirmed.
+
+    prepare() is called on the first sighting after a phone-free period and
+    starts the LLM call and TTS as a job on the reaction worker. When the
+    pickup is confirmed, claim() hands over the result, waiting for it if it
+    is still being generated, but for at most claim_timeout seconds before
+    the caller generates it normally. A sighting that never becomes a pickup
+    leaves its result in place for the next pickup; it is thrown away only
+    when it no longer fits (phone count, personality or voice changed, or
+    older than max_age).
+    """
+
+    KEEP_CLAIMED = 4  # Claimed temp files kept for playback before deletion (uncached TTS only)
+
+    def __init__(self, worker: ReactionWorker, max_age: float = 300.0, claim_timeout: float = 5.0):
+        self.worker = worker
+        self.max_age = max_age
+        self.claim_timeout = claim_timeout
+        self._lock = threading.Lock()
+        self._current: Optional[_Speculation] = None
+        self._claimed = deque()  # Temp files handed out by claim(), oldest first
+
+        # Stats
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.saved_total = 0.0  # Seconds of generation already done when pickups were confirmed
+
+    def prepare(self, phone_count: int, llm: LLMResponder, tts: TextToSpeech):
+        """Start generating the shame for pickup number phone_count (no-op if one already fits)."""
+        with self._lock:
+            if self._current is not None:
+                if self._fits(self._current, phone_count, llm, tts):
+                    return
+                self._discard(self._current)
+            speculation = _Speculation(phone_count, llm, tts)
+            self._current = speculation
+            self.started += 1
+            # Submitted under the lock so claim() always finds the future set
+            speculation.future = self.worker.submit(self._generate(speculation))
+
+    async def claim(self, phone_count: int, llm: LLMResponder, tts: TextToSpeech) -> Optional[Tuple[str, str]]:
+        """(text, audio_path) prepared for this pickup, or None to generate it now (on the worker loop)."""
+        claimed_at = time.time()
+        with self._lock:
+            speculation, self._current = self._current, None
+
+        if speculation is None or not self._fits(speculation, phone_count, llm, tts):
+            self.misses += 1
+            if speculation is not None:
+                self._discard(speculation)
+            return None
+
+        try:
+            # Shielded: on timeout the generation keeps going and cleans up after itself
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(speculation.future)), self.claim_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Speculative shame not ready after {self.claim_timeout}s, generating it now")
+            self.misses += 1
+            self._discard(speculation)
+            return None
+
+        if speculation.audio_path is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.saved_total += min(speculation.ready_at, claimed_at) - speculation.started_at
+        if speculation.audio_path == speculation.output_path:
+            self._keep_claimed(speculation.output_path)
+        return speculation.text, speculation.audio_path
+
+    def clear(self):
+        """Forget any prepared result (e.g. when monitoring stops)."""
+        with self._lock:
+            if self._current is not None:
+                self._discard(self._current)
+            self._current = None
+
+    def _discard(self, speculation: _Speculation):
+        """Drop a result nobody will play; its temp file goes once generation has finished."""
+        self.discarded += 1
+        speculation.discarded = True
+        if speculation.done.is_set():
+            self._remove(speculation.output_path)
+
+    def _keep_claimed(self, path: str):
+        """Keep a claimed temp file until a few newer ones have been handed out."""
+        self._claimed.append(path)
+        while len(self._claimed) > self.KEEP_CLAIMED:
+            self._remove(self._claimed.popleft())
+
+    @staticmethod
+    def _remove(path: Optional[str]):
+        if path and os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _fits(self, speculation: _Speculation, phone_count: int, llm: LLMResponder, tts: TextToSpeech) -> bool:
+        return (
+            speculation.phone_count == phone_count
+            and speculation.llm is llm
+            and speculation.tts is tts
+            and time.time() - speculation.started_at <= self.max_age
+            and not (speculation.done.is_set() and speculation.audio_path is None)
+        )
+
+    async def _generate(self, speculation: _Speculation):
+        # A file of its own: the live reaction, warmup and other speculations may synthesize at the same time
+        fd, speculation.output_path = tempfile.mkstemp(prefix="judgy_reachy_speculative_", suffix=".mp3")
+        os.close(fd)
+        try:
+            speculation.text = await self.worker.call(speculation.llm.get_response, speculation.phone_count)
+            speculation.audio_path = await speculation.tts.synthesize(
+                speculation.text, output_path=speculation.output_path
+            )
+            logger.debug(f"Speculative shame ready: {speculation.text}")
+        except Exception as e:
+            logger.debug(f"Speculative shame failed: {e}")
+        finally:
+            speculation.ready_at = time.time()
+            speculation.done.set()
+            if speculation.discarded or speculation.audio_path != speculation.output_path:
+                self._remove(speculation.output_path)  # Not needed (cached clip, failure or dropped)
+
+    def get_stats(self) -> dict:
+        """Get speculation statistics."""
+        pickups = self.hits + self.misses
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+            "hit_rate": round(self.hits / pickups, 3) if pickups else 0.0,
+            "saved_ms": round(self.saved_total / self.hits * 1000, 1) if self.hits else 0.0,
+        }
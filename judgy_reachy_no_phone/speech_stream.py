@@ -0,0 +1,198 @@
+"""Streaming TTS playback: decode MP3 chunks as they arrive and push PCM to the robot."""
+
+import time
+import shutil
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechStream:
+    """MP3 chunks of one utterance, fetched in the background from the moment it is created.
+
+    Must be created on a running event loop. Chunks that arrive before
+    playback starts are queued, so a reaction waiting for its turn keeps
+    downloading. When the whole clip has arrived, on_complete(data) is called
+    (e.g. to store it in the TTS cache). fallback() produces the clip as a
+    file through the regular non-streaming path, written to output_path.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        chunks: AsyncIterator[bytes],
+        fallback: Callable[[], Awaitable[str]],
+        on_complete: Optional[Callable[[bytes], object]] = None,
+        output_path: Optional[str] = None
+    ):
+        self.text = text
+        self.fallback = fallback
+        self.output_path = output_path
+        self.on_complete = on_complete
+        self.data = bytearray()
+        self.error: Optional[Exception] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.ensure_future(self._fetch(chunks))
+
+    async def _fetch(self, chunks: AsyncIterator[bytes]):
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    self.data += chunk
+                    self._queue.put_nowait(chunk)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._queue.put_nowait(None)
+
+        if self.error is None and self.data and self.on_complete is not None:
+            try:
+                self.on_complete(bytes(self.data))
+            except Exception as e:
+                logger.debug(f"Could not keep streamed clip: {e}")
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Chunks in order as they arrive; raises the fetch error, if any, at the end."""
+        while True:
+            chunk = await self._queue.get()
+            if chunk is None:
+                break
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+class StreamingPlayer:
+    """Decode a SpeechStream with ffmpeg and push float32 PCM to the robot's audio output.
+
+    Sound starts once jitter_buffer_ms of audio has been decoded instead of
+    after the whole file has been downloaded and written. The jitter buffer
+    absorbs gaps between network chunks. If the stream fails before any
+    sound was pushed, play() falls back to the stream's file path.
+
+    Calls into the media object run on the player's own thread, not the
+    reaction worker's pool: play() is awaited by a perform step that already
+    holds one of the pool's threads.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight for latency samples
+    READ_SIZE = 4096         # Bytes read from ffmpeg at a time (1024 float32 samples)
+
+    def __init__(self, media, jitter_buffer_ms: int = 150, ffmpeg: str = "ffmpeg"):
+        self.media = media
+        self.jitter_buffer_ms = jitter_buffer_ms
+        self.ffmpeg = shutil.which(ffmpeg) or ffmpeg
+        self.sample_rate = 0
+        self._playing = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speech-push")  # Also keeps pushes in order
+
+        # Stats
+        self.streams = 0
+        self.fallbacks = 0
+        self.first_sound = 0.0  # Smoothed time from play() to the first pushed samples (seconds)
+
+    @staticmethod
+    def supported(media, ffmpeg: str = "ffmpeg") -> bool:
+        """True if the media object accepts pushed samples and ffmpeg is installed."""
+        return (
+            all(callable(getattr(media, name, None))
+                for name in ("push_audio_sample", "start_playing", "get_output_audio_samplerate"))
+            and shutil.which(ffmpeg) is not None
+        )
+
+    async def play(self, stream: SpeechStream) -> Optional[str]:
+        """Play a stream; returns None once played, or a file path to play instead."""
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        if not self.sample_rate:
+            self.sample_rate = await loop.run_in_executor(self._executor, self.media.get_output_audio_samplerate)
+        if self.sample_rate <= 0:
+            return await self._fallback(stream, "audio output unavailable")
+
+        process = await asyncio.create_subprocess_exec(
+            self.ffmpeg, "-hide_banner", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "f32le", "-ac", "1", "-ar", str(self.sample_rate),
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE
+        )
+        feeder = asyncio.ensure_future(self._feed(stream, process))
+
+        prebuffer_bytes = int(self.sample_rate * self.jitter_buffer_ms / 1000) * 4
+        pending = bytearray()
+        pushed = False
+        try:
+            while True:
+                block = await process.stdout.read(self.READ_SIZE)
+                if block:
+                    pending += block
+                    if not pushed and len(pending) < prebuffer_bytes:
+                        continue  # Still filling the jitter buffer
+
+                usable = len(pending) - len(pending) % 4
+                if usable:
+                    samples = np.frombuffer(bytes(pending[:usable]), dtype=np.float32)
+                    del pending[:usable]
+                    await loop.run_in_executor(self._executor, self._push, samples)
+                    if not pushed:
+                        pushed = True
+                        self._record_first_sound(time.perf_counter() - start)
+                if not block:
+                    break
+
+            await feeder
+            await process.wait()
+        except Exception as e:
+            feeder.cancel()
+            if process.returncode is None:
+                process.kill()
+            if not pushed:
+                return await self._fallback(stream, e)
+            logger.warning(f"Speech stream interrupted: {e}")
+            return None
+
+        if not pushed:
+            return await self._fallback(stream, "no audio decoded")
+        self.streams += 1
+        return None
+
+    async def _feed(self, stream: SpeechStream, process):
+        """Write MP3 chunks into ffmpeg as they arrive."""
+        try:
+            async for chunk in stream.chunks():
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        finally:
+            process.stdin.close()
+
+    def _push(self, samples: np.ndarray):
+        if not self._playing:
+            self.media.start_playing()
+            self._playing = True
+        self.media.push_audio_sample(samples)
+
+    async def _fallback(self, stream: SpeechStream, reason) -> str:
+        logger.warning(f"Streaming playback unavailable ({reason}), using the audio file")
+        self.fallbacks += 1
+        return await stream.fallback()
+
+    def _record_first_sound(self, seconds: float):
+        if self.first_sound == 0.0:
+            self.first_sound = seconds
+        else:
+            self.first_sound += self.LATENCY_SMOOTHING * (seconds - self.first_sound)
+
+    def get_stats(self) -> dict:
+        """Get streaming playback statistics."""
+        return {
+            "streams": self.streams,
+            "fallbacks": self.fallbacks,
+            "first_sound_ms": round(self.first_sound * 1000, 1),
+            "jitter_buffer_ms": self.jitter_buffer_ms,
+        }
@@ -212,28 +212,27 @@ settingsModal.addEventListener('click', (e) => {
     }
 });
 
-// Update video feed
-async function updateVideo() {
-    try {
-        const response = await fetch('/api/video-frame');
-        const data = await response.json();
-
-        const videoFeed = document.getElementById('video-feed');
-        const placeholder = document.getElementById('video-placeholder');
-        const standbyBadge = document.querySelector('.standby-badge');
-
-        if (data.frame) {
-            videoFeed.src = 'data:image/jpeg;base64,' + data.frame;
-            videoFeed.classList.add('active');
-            placeholder.classList.add('hidden');
-            standbyBadge.style.display = 'none';
-        } else {
-            videoFeed.classList.remove('active');
-            placeholder.classList.remove('hidden');
-            standbyBadge.style.display = 'flex';
+// Update video feed (one long-lived MJPEG stream while the camera runs)
+function updateVideo(cameraActive) {
+    const videoFeed = document.getElementById('video-feed');
+    const placeholder = document.getElementById('video-placeholder');
+    const standbyBadge = document.querySelector('.standby-badge');
+
+    if (cameraActive) {
+        if (!videoFeed.getAttribute('src')) {
+            // Ask for frames at the displayed size (full size until laid out)
+            const width = Math.round(videoFeed.parentElement.clientWidth * (window.devicePixelRatio || 1));
+            videoFeed.src = '/api/video-stream' + (width > 0 ? '?width=' + width : '');
         }
-    } catch (e) {
-        console.error('Video update failed:', e);
+        videoFeed.classList.add('active');
+        placeholder.classList.add('hidden');
+        standbyBadge.style.display = 'none';
+    } else {
+        // Dropping the src closes the stream
+        videoFeed.removeAttribute('src');
+        videoFeed.classList.remove('active');
+        placeholder.classList.remove('hidden');
+        standbyBadge.style.display = 'flex';
     }
 }
 
@@ -259,6 +258,8 @@ async function updateDisplay() {
             statusText.textContent = 'Not Monitoring';
         }
 
+        updateVideo(data.camera_active);
+
         // Update stats
         document.getElementById('phone-count').textContent = data.phone_count;
         document.getElementById('current-streak').textContent = data.current_streak;
@@ -510,18 +511,19 @@ async function initialize() {
 
     // Initial UI update
     updateDisplay();
-    updateVideo();
     updateUIForAPIKeys();
 
     // Start loading status check (poll every 500ms until ready)
     checkLoadingStatus();  // Check immediately
     loadingCheckInterval = setInterval(checkLoadingStatus, 500);
 
-    // Auto-update every 100ms for smooth video
-    setInterval(() => {
-        updateVideo();
-        updateDisplay();
-    }, 100);
+    // Reconnect the video stream on the next status update if it drops
+    document.getElementById('video-feed').addEventListener('error', (e) => {
+        e.target.removeAttribute('src');
+    });
+
+    // Auto-update every 100ms (video arrives on its own stream)
+    setInterval(updateDisplay, 100);
 }
 
 // Start initialization when DOM is ready
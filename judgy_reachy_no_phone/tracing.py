@@ -0,0 +1,141 @@
+"""Opt-in span tracer with Chrome trace-event export (chrome://tracing, Perfetto)."""
+
+import os
+import time
+import asyncio
+import functools
+import threading
+from collections import deque
+
+DEFAULT_CAPACITY = 50000  # Spans kept; the oldest are overwritten first
+
+
+class _NullSpan:
+    """Context manager returned while tracing is off: does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name: str, cat: str, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.tracer._events.append(
+            (self.name, self.cat, self.start, end - self.start, threading.get_ident(), self.args)
+        )
+        return False
+
+
+class Tracer:
+    """Record timed spans from any thread into a bounded ring buffer.
+
+    Spans are kept as raw tuples in a deque(maxlen=capacity), so recording
+    is one perf_counter pair and one append; events are only formatted when
+    export() is called. While disabled, span() returns a shared no-op
+    context manager and traced() functions run straight through.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        self.enabled = enabled
+        self._events = deque(maxlen=capacity)
+        self._origin = time.perf_counter()
+        self._thread_names = {}
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen
+
+    def configure(self, enabled: bool, capacity: int = 0):
+        """Turn tracing on or off, optionally resizing the buffer (drops recorded spans)."""
+        if capacity and capacity != self._events.maxlen:
+            self._events = deque(maxlen=capacity)
+        self.enabled = enabled
+
+    def span(self, name: str, cat: str = "", **args):
+        """Context manager timing a block as one span."""
+        if not self.enabled:
+            return _NULL_SPAN
+        self._note_thread()
+        return _Span(self, name, cat, args or None)
+
+    def traced(self, name: str = "", cat: str = ""):
+        """Decorator recording each call of a function or coroutine function as a span."""
+        def decorate(fn):
+            span_name = name or fn.__name__
+            if asyncio.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+                    with self.span(span_name, cat):
+                        return await fn(*args, **kwargs)
+            else:
+                @functools.wraps(fn)
+                def wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return fn(*args, **kwargs)
+                    with self.span(span_name, cat):
+                        return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def _note_thread(self):
+        ident = threading.get_ident()
+        if ident not in self._thread_names:
+            self._thread_names[ident] = threading.current_thread().name
+
+    def clear(self):
+        self._events.clear()
+
+    def export(self) -> dict:
+        """Recorded spans as a Chrome trace-event document."""
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in list(self._thread_names.items())
+        ]
+        for name, cat, start, duration, tid, args in list(self._events):
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def get_stats(self) -> dict:
+        """Get tracer statistics."""
+        return {
+            "enabled": self.enabled,
+            "spans": len(self._events),
+            "capacity": self.capacity,
+        }
+
+
+TRACER = Tracer()
@@ -0,0 +1,137 @@
+"""Content-addressed on-disk cache of synthesized speech."""
+
+import os
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "judgy_reachy_no_phone", "tts")
+
+
+class TTSCache:
+    """Audio files keyed by a hash of engine, voice, model and text.
+
+    Most lines are spoken many times (prewritten lists, repeated LLM
+    outputs), so a hit replays the stored file without any network call.
+    Files are written to a temporary name and moved into place with
+    os.replace, so a crash never leaves a truncated entry. When the cache
+    grows past max_bytes, the least recently used files are deleted; use
+    order survives restarts through file modification times.
+    """
+
+    SUFFIX = ".mp3"
+
+    def __init__(self, cache_dir: str = "", max_bytes: int = 100 * 1024 * 1024):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size, least recently used first
+        self._bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(engine: str, voice: str, model: str, text: str) -> str:
+        """Cache key for one utterance."""
+        return hashlib.sha256(f"{engine}|{voice}|{model}|{text}".encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.SUFFIX)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Path of the cached audio, or None (counts a hit or a miss)."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            path = self.path(key)
+            try:
+                os.utime(path)
+            except OSError:
+                # Deleted behind our back
+                self._bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return path
+
+    def store(self, key: str, data: bytes) -> str:
+        """Atomically write audio for key and return its path."""
+        path = self.path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+        return path
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes (keeps the newest)."""
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+
+    def _load_index(self):
+        """Rebuild the LRU order from the files on disk, dropping leftover temp files."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".tmp"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[:-len(self.SUFFIX)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._bytes += size
+        with self._lock:
+            self._evict()
+        if entries:
+            logger.info(f"TTS cache: {len(self._entries)} clips ({self._bytes / 1e6:.1f} MB) in {self.cache_dir}")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "megabytes": round(self._bytes / 1e6, 2),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
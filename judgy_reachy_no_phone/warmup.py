@@ -0,0 +1,130 @@
+"""Background pre-synthesis of a personality's prewritten lines."""
+
+import os
+import logging
+import tempfile
+import threading
+from typing import List, Optional
+
+from .config import PERSONALITIES
+from .audio import TextToSpeech
+from .reactions import ReactionWorker
+
+logger = logging.getLogger(__name__)
+
+
+def prewritten_lines(personality: str) -> List[str]:
+    """Prewritten shame lines, then praise lines, for a personality (every member for mixtape)."""
+    if personality == "mixtape":
+        members = [p for p in PERSONALITIES if p not in ("mixtape", "pure_reachy")]
+    else:
+        members = [personality]
+
+    lines = []
+    for kind in ("prewritten_shame", "prewritten_praise"):
+        for member in members:
+            lines.extend(PERSONALITIES.get(member, {}).get(kind) or [])
+    return list(dict.fromkeys(lines))  # Drop duplicates, keep order
+
+
+class TTSWarmup:
+    """Fill the TTS cache with a personality's prewritten lines in the background.
+
+    Runs as a job on the reaction worker, one line at a time, whenever
+    monitoring starts or the personality changes; starting again abandons
+    the previous job after its current line, and every line is synthesized
+    into a file of its own so that last line cannot clash with the new job.
+    Lines already in the cache are cache hits and cost nothing, so
+    restarting is cheap. Nothing here touches the capture or inference
+    threads.
+    """
+
+    def __init__(self, worker: ReactionWorker, allow_elevenlabs: bool = False):
+        self.worker = worker
+        self.allow_elevenlabs = allow_elevenlabs  # Warming ElevenLabs spends monthly quota
+
+        self.status = "idle"  # idle, warming, ready, skipped, error
+        self.message = ""
+        self.done = 0
+        self.total = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def start(self, tts: TextToSpeech, personality: str):
+        """Warm the cache for this TTS engine and personality (returns immediately)."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        reason = self._skip_reason(tts, personality)
+        if reason:
+            self._set("skipped", reason, 0, 0)
+            return
+
+        lines = prewritten_lines(personality)
+        self._set("warming", f"Preparing {len(lines)} voice lines...", 0, len(lines))
+        self.worker.submit(self._run(tts, lines, generation))
+
+    def cancel(self):
+        """Abandon the running job after its current line."""
+        with self._lock:
+            self._generation += 1
+
+    def _skip_reason(self, tts: TextToSpeech, personality: str) -> Optional[str]:
+        if personality == "pure_reachy":
+            return "Pure Reachy uses recorded emotions, no speech to prepare"
+        if tts.cache is None:
+            return "TTS cache disabled"
+        if tts.eleven_client is not None and not self.allow_elevenlabs:
+            return "ElevenLabs lines are synthesized on demand (saves quota)"
+        return None
+
+    def _current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _set(self, status: str, message: str, done: int, total: int):
+        self.status = status
+        self.message = message
+        self.done = done
+        self.total = total
+
+    async def _run(self, tts: TextToSpeech, lines: List[str], generation: int):
+        failures = 0
+        for done, text in enumerate(lines, start=1):
+            if not self._current(generation):
+                return
+            try:
+                await self._synthesize(tts, text)
+            except Exception as e:
+                failures += 1
+                logger.debug(f"Warmup failed for {text!r}: {e}")
+            if self._current(generation):
+                self.done = done
+                self.message = f"Prepared {done}/{len(lines)} voice lines"
+
+        if not self._current(generation):
+            return
+        if failures == len(lines):
+            self._set("error", "Could not prepare voice lines (TTS unavailable?)", self.done, len(lines))
+        else:
+            self._set("ready", f"{len(lines) - failures} voice lines ready", self.done, len(lines))
+        logger.info(f"TTS warmup: {self.message}")
+
+    async def _synthesize(self, tts: TextToSpeech, text: str):
+        """Synthesize one line into the cache through a temp file of its own."""
+        fd, output_path = tempfile.mkstemp(prefix="judgy_reachy_warmup_", suffix=".mp3")
+        os.close(fd)
+        try:
+            await tts.synthesize(text, output_path=output_path)
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+
+    def get_status(self) -> dict:
+        """Progress for /api/loading-status."""
+        return {
+            "warmup_status": self.status,
+            "warmup_message": self.message,
+            "warmup_done": self.done,
+            "warmup_total": self.total,
+        }
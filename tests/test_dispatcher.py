@@ -0,0 +1,90 @@
+"""ReactionDispatcher coalescing and dropped-event reporting."""
+
+import time
+
+from judgy_reachy_no_phone.dispatcher import ReactionDispatcher
+
+
+def make_dispatcher(**kwargs):
+    dropped = []
+    dispatcher = ReactionDispatcher(on_dropped=dropped.append, **kwargs)
+    return dispatcher, dropped
+
+
+def test_fresh_event_delivered():
+    dispatcher, dropped = make_dispatcher()
+
+    dispatcher.post("picked_up")
+    event = dispatcher.get(timeout=0)
+
+    assert event.kind == "picked_up"
+    assert dispatcher.get(timeout=0) is None
+    assert dropped == []
+    assert dispatcher.events_handled == 1
+
+
+def test_put_down_coalesces_pending_pickup():
+    dispatcher, dropped = make_dispatcher()
+
+    dispatcher.post("picked_up")
+    dispatcher.post("put_down")
+
+    assert [event.kind for event in dropped] == ["picked_up"]
+    assert dispatcher.get(timeout=0).kind == "put_down"
+    assert dispatcher.get(timeout=0) is None
+    assert dispatcher.events_coalesced == 1
+
+
+def test_repeated_event_replaces_pending_one():
+    dispatcher, dropped = make_dispatcher()
+
+    dispatcher.post("picked_up", timestamp=time.time() - 0.2)
+    latest = time.time()
+    dispatcher.post("picked_up", timestamp=latest)
+
+    assert [event.kind for event in dropped] == ["picked_up"]
+    assert dispatcher.get(timeout=0).timestamp == latest
+
+
+def test_pickup_does_not_coalesce_put_down():
+    dispatcher, dropped = make_dispatcher()
+
+    dispatcher.post("put_down")
+    dispatcher.post("picked_up")
+
+    assert dropped == []
+    assert [dispatcher.get(timeout=0).kind, dispatcher.get(timeout=0).kind] == ["put_down", "picked_up"]
+
+
+def test_stale_event_dropped():
+    dispatcher, dropped = make_dispatcher(max_age=1.0)
+
+    dispatcher.post("picked_up", timestamp=time.time() - 5.0)
+
+    assert dispatcher.get(timeout=0) is None
+    assert [event.kind for event in dropped] == ["picked_up"]
+    assert dispatcher.events_stale == 1
+    assert dispatcher.events_handled == 0
+
+
+def test_stale_event_skipped_for_fresh_one():
+    dispatcher, dropped = make_dispatcher(max_age=1.0)
+
+    dispatcher.post("put_down", timestamp=time.time() - 5.0)
+    dispatcher.post("picked_up")
+
+    assert dispatcher.get(timeout=0).kind == "picked_up"
+    assert [event.kind for event in dropped] == ["put_down"]
+
+
+def test_clear_drops_pending_events():
+    dispatcher, dropped = make_dispatcher()
+
+    dispatcher.post("put_down")
+    dispatcher.post("picked_up")
+    dispatcher.clear()
+
+    assert [event.kind for event in dropped] == ["put_down", "picked_up"]
+    assert not dispatcher.pending
+    assert dispatcher.get(timeout=0) is None
+
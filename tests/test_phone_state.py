@@ -0,0 +1,163 @@
+"""PhoneStateMachine driven with synthetic timestamps (no camera, model or clock)."""
+
+import pytest
+
+from judgy_reachy_no_phone.phone_state import PhoneStateMachine
+
+
+FRAME = 0.1  # Seconds between synthetic frames (10 fps)
+
+
+def _clock():
+    raise AssertionError("the state machine read the clock although every update had a timestamp")
+
+
+def make_machine(**kwargs) -> PhoneStateMachine:
+    params = dict(pickup_seconds=0.5, putdown_seconds=3.0, cooldown=30.0, reference_confidence=0.5)
+    params.update(kwargs)
+    return PhoneStateMachine(clock=_clock, **params)
+
+
+def feed(machine: PhoneStateMachine, start: float, seconds: float, confidence: float) -> list:
+    """Feed frames every FRAME seconds from start; returns (timestamp, event) for each event."""
+    events = []
+    for i in range(round(seconds / FRAME)):
+        timestamp = start + i * FRAME
+        event = machine.update(timestamp, confidence)
+        if event is not None:
+            events.append((round(timestamp, 3), event))
+    return events
+
+
+def test_pickup_confirmed_after_pickup_seconds():
+    machine = make_machine()
+
+    events = feed(machine, 0.0, 1.0, 0.9)
+
+    # First frame only starts the evidence; 0.5 s of evidence after 5 more frames
+    assert events == [(0.5, "picked_up")]
+    assert machine.phone_visible
+    assert machine.phone_count == 1
+    assert not machine.pickup_pending
+
+
+def test_low_confidence_needs_more_time():
+    machine = make_machine()
+
+    # Half the reference confidence counts half as fast
+    events = feed(machine, 0.0, 2.0, 0.25)
+
+    assert events == [(1.0, "picked_up")]
+
+
+def test_pickup_pending_until_confirmed():
+    machine = make_machine()
+
+    assert machine.update(0.0, 0.9) is None
+    assert machine.pickup_pending
+    assert not machine.phone_visible
+
+
+def test_flicker_rejected():
+    machine = make_machine()
+
+    # One-frame sightings between empty frames never build up enough evidence
+    events = []
+    for i in range(100):
+        timestamp = i * FRAME
+        event = machine.update(timestamp, 0.9 if i % 2 == 0 else 0.0)
+        if event is not None:
+            events.append(event)
+
+    assert events == []
+    assert machine.phone_count == 0
+    assert not machine.phone_visible
+
+
+def test_short_sighting_decays_away():
+    machine = make_machine()
+
+    feed(machine, 0.0, 0.3, 0.9)
+    assert machine.pickup_pending
+
+    feed(machine, 0.3, 1.0, 0.0)
+    assert not machine.pickup_pending
+    assert machine.evidence == 0.0
+
+
+def test_put_down_after_grace_period():
+    machine = make_machine()
+    feed(machine, 0.0, 1.0, 0.9)
+
+    # Dropouts shorter than putdown_seconds keep the phone visible
+    assert feed(machine, 1.0, 2.0, 0.0) == []
+    assert machine.phone_visible
+    assert feed(machine, 3.0, 0.5, 0.9) == []
+
+    # Last sighting at 3.4 s: put down confirmed 3 s later
+    events = feed(machine, 3.5, 4.0, 0.0)
+    assert events == [(6.4, "put_down")]
+    assert not machine.phone_visible
+    assert machine.last_reaction_time is None
+
+
+def test_cooldown_reshames_phone_still_held():
+    machine = make_machine(cooldown=30.0)
+
+    events = feed(machine, 0.0, 65.0, 0.9)
+
+    assert [event for _, event in events] == ["picked_up"] * 3
+    assert [timestamp for timestamp, _ in events] == [0.5, 30.5, 60.5]
+    assert machine.phone_count == 3
+
+
+def test_pickup_after_put_down_skips_cooldown():
+    machine = make_machine(cooldown=30.0)
+    feed(machine, 0.0, 1.0, 0.9)
+    feed(machine, 1.0, 4.0, 0.0)
+    assert not machine.phone_visible
+
+    # Well inside the cooldown, but the put down reset it
+    events = feed(machine, 5.0, 1.0, 0.9)
+
+    assert events == [(5.5, "picked_up")]
+    assert machine.phone_count == 2
+
+
+def test_long_gap_counts_at_most_max_gap():
+    machine = make_machine(max_gap=1.0)
+
+    assert machine.update(0.0, 0.9) is None
+    # A 10 s stall between frames is one observation, not 10 s of evidence
+    assert machine.update(10.0, 0.9) == "picked_up"
+    assert machine.evidence == 0.0
+
+    machine = make_machine(pickup_seconds=1.5, max_gap=1.0)
+    machine.update(0.0, 0.9)
+    assert machine.update(10.0, 0.9) is None
+    assert machine.evidence == pytest.approx(1.0)
+
+
+def test_reset_keeps_count():
+    machine = make_machine()
+    feed(machine, 0.0, 1.0, 0.9)
+
+    machine.reset()
+
+    assert machine.phone_count == 1
+    assert not machine.phone_visible
+    assert not machine.pickup_pending
+    assert machine.last_timestamp is None
+
+
+def test_long_synthetic_session():
+    machine = make_machine()
+    n = 200_000
+
+    # Alternating 4 s held / 4 s away: every cycle is one pickup and one put down
+    for i in range(n):
+        timestamp = i * FRAME
+        machine.update(timestamp, 0.9 if int(timestamp // 4.0) % 2 == 0 else 0.0)
+
+    cycles = n * FRAME / 8.0
+    assert machine.phone_count == pytest.approx(cycles, abs=1)